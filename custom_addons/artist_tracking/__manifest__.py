@@ -32,6 +32,7 @@
         
         # Data files
         'data/artist_data.xml',
+        'data/ir_cron_data.xml',
         
         # Views
         'views/actions.xml',
@@ -39,6 +40,7 @@
         'views/association_views.xml',
         'views/performance_views.xml',
         'views/achievement_views.xml',
+        'views/import_views.xml',
         'views/menu.xml',
     ],
     'installable': True,
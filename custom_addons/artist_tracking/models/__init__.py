@@ -4,4 +4,5 @@ from . import association
 from . import performance_metric
 from . import achievement
 from . import analytics
-from . import achievement_integration
\ No newline at end of file
+from . import achievement_integration
+from . import artist_import
\ No newline at end of file
@@ -1,6 +1,12 @@
+import time
+
 from odoo import models, fields, api
 from datetime import datetime, timedelta
 
+# Dashboard figures are reused by the same user and companies for a short time
+DASHBOARD_CACHE_TTL = 60
+_DASHBOARD_CACHE = {}
+
 
 class ArtistAnalytics(models.Model):
     _name = 'artist.analytics'
@@ -50,89 +56,133 @@ class ArtistDashboard(models.TransientModel):
     _description = 'Artist Dashboard Analytics'
 
     # Summary Statistics
-    total_artists = fields.Integer('Total Artists', compute='_compute_summary_stats')
-    active_artists = fields.Integer('Active Artists', compute='_compute_summary_stats')
-    total_associations = fields.Integer('Total Associations', compute='_compute_summary_stats')
-    total_performances_this_month = fields.Integer('Performances This Month', compute='_compute_summary_stats')
+    total_artists = fields.Integer('Total Artists', compute='_compute_dashboard')
+    active_artists = fields.Integer('Active Artists', compute='_compute_dashboard')
+    total_associations = fields.Integer('Total Associations', compute='_compute_dashboard')
+    total_performances_this_month = fields.Integer('Performances This Month', compute='_compute_dashboard')
     
     # Art Category Distribution
-    dance_artists = fields.Integer('Dance Artists', compute='_compute_category_distribution')
-    music_artists = fields.Integer('Music Artists', compute='_compute_category_distribution')
-    visual_arts_artists = fields.Integer('Visual Arts Artists', compute='_compute_category_distribution')
-    theater_artists = fields.Integer('Theater Artists', compute='_compute_category_distribution')
+    dance_artists = fields.Integer('Dance Artists', compute='_compute_dashboard')
+    music_artists = fields.Integer('Music Artists', compute='_compute_dashboard')
+    visual_arts_artists = fields.Integer('Visual Arts Artists', compute='_compute_dashboard')
+    theater_artists = fields.Integer('Theater Artists', compute='_compute_dashboard')
+    film_artists = fields.Integer('Film Artists', compute='_compute_dashboard')
+    literature_artists = fields.Integer('Literature Artists', compute='_compute_dashboard')
+    digital_arts_artists = fields.Integer('Digital Arts Artists', compute='_compute_dashboard')
+    mixed_media_artists = fields.Integer('Mixed Media Artists', compute='_compute_dashboard')
+    other_artists = fields.Integer('Other Artists', compute='_compute_dashboard')
     
     # Performance Analytics
-    avg_performance_rating = fields.Float('Average Performance Rating', compute='_compute_performance_analytics')
-    total_performances_ytd = fields.Integer('Total Performances YTD', compute='_compute_performance_analytics')
-    top_performing_zone = fields.Char('Top Performing Zone', compute='_compute_performance_analytics')
+    avg_performance_rating = fields.Float('Average Performance Rating', compute='_compute_dashboard')
+    total_performances_ytd = fields.Integer('Total Performances YTD', compute='_compute_dashboard')
+    top_performing_zone = fields.Char('Top Performing Zone', compute='_compute_dashboard')
     
     # Achievement Analytics
-    total_achievements_ytd = fields.Integer('Total Achievements YTD', compute='_compute_achievement_analytics')
-    international_achievements = fields.Integer('International Achievements', compute='_compute_achievement_analytics')
-    most_awarded_category = fields.Char('Most Awarded Category', compute='_compute_achievement_analytics')
+    total_achievements_ytd = fields.Integer('Total Achievements YTD', compute='_compute_dashboard')
+    international_achievements = fields.Integer('International Achievements', compute='_compute_dashboard')
+    most_awarded_category = fields.Char('Most Awarded Category', compute='_compute_dashboard')
 
     @api.depends()
-    def _compute_summary_stats(self):
+    def _compute_dashboard(self):
+        data = self._get_dashboard_data()
         for record in self:
-            # Total and active artists
-            record.total_artists = self.env['artist.artist'].search_count([])
-            record.active_artists = self.env['artist.artist'].search_count([('status', '=', 'active')])
-            
-            # Total associations
-            record.total_associations = self.env['artist.association'].search_count([])
-            
-            # Performances this month
-            start_of_month = datetime.now().replace(day=1).date()
-            record.total_performances_this_month = self.env['artist.performance.metric'].search_count([
-                ('performance_date', '>=', start_of_month),
-                ('status', '=', 'completed')
-            ])
+            record.update(data)
 
-    @api.depends()
-    def _compute_category_distribution(self):
-        for record in self:
-            record.dance_artists = self.env['artist.artist'].search_count([('art_category', '=', 'dance')])
-            record.music_artists = self.env['artist.artist'].search_count([('art_category', '=', 'music')])
-            record.visual_arts_artists = self.env['artist.artist'].search_count([('art_category', '=', 'visual_arts')])
-            record.theater_artists = self.env['artist.artist'].search_count([('art_category', '=', 'theater')])
+    @api.model
+    def _get_dashboard_data(self):
+        """Return the dashboard figures, cached for a short time per user and companies
 
-    @api.depends()
-    def _compute_performance_analytics(self):
-        for record in self:
-            # Average performance rating
-            performances = self.env['artist.performance.metric'].search([('overall_rating', '>', 0)])
-            if performances:
-                record.avg_performance_rating = sum(performances.mapped('overall_rating')) / len(performances)
-            else:
-                record.avg_performance_rating = 0.0
-            
-            # Total performances year to date
-            start_of_year = datetime.now().replace(month=1, day=1).date()
-            record.total_performances_ytd = self.env['artist.performance.metric'].search_count([
-                ('performance_date', '>=', start_of_year),
-                ('status', '=', 'completed')
-            ])
-            
-            # Top performing zone (placeholder - would need more complex query)
-            record.top_performing_zone = 'Central Zone'  # This would be computed based on actual data
+        Every figure goes through the ORM and so through the user's record rules,
+        which is why two users never share an entry.
+        """
+        key = (self.env.cr.dbname, self.env.uid, tuple(self.env.companies.ids))
+        now = time.monotonic()
+        cached = _DASHBOARD_CACHE.get(key)
+        if cached and now - cached[0] < DASHBOARD_CACHE_TTL:
+            return cached[1]
+        data = self._compute_dashboard_data()
+        for stale_key in [k for k, (stamp, __) in _DASHBOARD_CACHE.items() if now - stamp >= DASHBOARD_CACHE_TTL]:
+            _DASHBOARD_CACHE.pop(stale_key, None)
+        _DASHBOARD_CACHE[key] = (now, data)
+        return data
 
-    @api.depends()
-    def _compute_achievement_analytics(self):
-        for record in self:
-            # Total achievements year to date
-            start_of_year = datetime.now().replace(month=1, day=1).date()
-            record.total_achievements_ytd = self.env['artist.achievement'].search_count([
-                ('achievement_date', '>=', start_of_year)
-            ])
-            
-            # International achievements
-            record.international_achievements = self.env['artist.achievement'].search_count([
-                ('achievement_level', '=', 'international'),
-                ('achievement_date', '>=', start_of_year)
-            ])
-            
-            # Most awarded category (placeholder)
-            record.most_awarded_category = 'Music'  # This would be computed based on actual data
+    @api.model
+    def _compute_dashboard_data(self):
+        """Compute every dashboard figure from a handful of grouped queries"""
+        today = fields.Date.context_today(self)
+        start_of_month = today.replace(day=1)
+        start_of_year = today.replace(month=1, day=1)
+        Artist = self.env['artist.artist']
+        category_labels = dict(Artist._fields['art_category'].selection)
+        data = {f'{category}_artists': 0 for category in category_labels}
+
+        # Artists by category and status
+        total_artists = active_artists = 0
+        for category, status, count in Artist._read_group(
+                [], groupby=['art_category', 'status'], aggregates=['__count']):
+            total_artists += count
+            if status == 'active':
+                active_artists += count
+            if category:
+                data[f'{category}_artists'] += count
+        data.update({
+            'total_artists': total_artists,
+            'active_artists': active_artists,
+            'total_associations': self.env['artist.association'].search_count([]),
+        })
+
+        # Completed performances of the year, by month
+        Performance = self.env['artist.performance.metric']
+        month_count = ytd_count = 0
+        for month, count in Performance._read_group(
+                [('status', '=', 'completed'), ('performance_date', '>=', start_of_year)],
+                groupby=['performance_date:month'], aggregates=['__count']):
+            ytd_count += count
+            if month and month >= start_of_month:
+                month_count += count
+        [(avg_rating,)] = Performance._read_group(
+            [('overall_rating', '>', 0)], aggregates=['overall_rating:avg'])
+        data.update({
+            'total_performances_this_month': month_count,
+            'total_performances_ytd': ytd_count,
+            'avg_performance_rating': avg_rating or 0.0,
+        })
+
+        # Zones ranked by their artists' average rating, then achievements
+        ratings = {
+            zone: rating
+            for zone, rating in Artist._read_group(
+                [('zone_id', '!=', False), ('overall_rating', '>', 0)],
+                groupby=['zone_id'], aggregates=['overall_rating:avg'])
+        }
+        achievements = {}
+        for artist, count in self.env['artist.achievement']._read_group(
+                [('artist_id.zone_id', '!=', False)], groupby=['artist_id'], aggregates=['__count']):
+            achievements[artist.zone_id] = achievements.get(artist.zone_id, 0) + count
+        zones = set(ratings) | set(achievements)
+        top_zone = min(zones, key=lambda zone: (
+            -(ratings.get(zone) or 0.0), zone not in ratings, -achievements.get(zone, 0), zone.name or ''
+        )) if zones else False
+        data['top_performing_zone'] = top_zone.name if top_zone else ''
+
+        # Achievements of the year by category and level
+        total_achievements = international = 0
+        awards_by_category = {}
+        for category, level, count in self.env['artist.achievement']._read_group(
+                [('achievement_date', '>=', start_of_year)],
+                groupby=['art_category', 'achievement_level'], aggregates=['__count']):
+            total_achievements += count
+            if level == 'international':
+                international += count
+            if category:
+                awards_by_category[category] = awards_by_category.get(category, 0) + count
+        most_awarded = max(awards_by_category, key=awards_by_category.get) if awards_by_category else False
+        data.update({
+            'total_achievements_ytd': total_achievements,
+            'international_achievements': international,
+            'most_awarded_category': category_labels.get(most_awarded, ''),
+        })
+        return data
 
     def action_view_artist_reports(self):
         """Open artist reports view"""
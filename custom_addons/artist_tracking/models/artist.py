@@ -5,13 +5,17 @@ from datetime import datetime
 class Artist(models.Model):
     _name = 'artist.artist'
     _description = 'Artist Registry'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['batch.sequence.mixin', 'person.identity.mixin', 'birthday.refresh.mixin',
+                'mail.thread', 'mail.activity.mixin']
     _rec_name = 'name'
+    _sequence_code = 'artist.artist'
+    _sequence_field = 'artist_id'
+    _sequence_fallback = 'ART000'
 
     # Basic Information
     name = fields.Char('Full Name', required=True, tracking=True)
     artist_id = fields.Char('Artist ID', required=True, copy=False, readonly=True,
-                           default=lambda self: self.env['ir.sequence'].next_by_code('artist.artist'))
+                           default='NEW')
     stage_name = fields.Char('Stage/Professional Name', tracking=True)
     date_of_birth = fields.Date('Date of Birth', tracking=True)
     age = fields.Integer('Age', compute='_compute_age', store=True)
@@ -73,11 +77,13 @@ class Artist(models.Model):
     mentee_ids = fields.One2many('artist.artist', 'mentor_id', string='Mentees')
     education_background = fields.Text('Educational Background')
     certifications = fields.Text('Certifications & Awards')
+    performance_history = fields.Text('Performance History')
     
     # Performance and Achievement Tracking
     performance_ids = fields.One2many('artist.performance.metric', 'artist_id', string='Performances')
     achievement_ids = fields.One2many('artist.achievement', 'artist_id', string='Achievements')
-    total_performances = fields.Integer('Total Performances', compute='_compute_performance_stats', store=True)
+    # Performance aggregates are maintained incrementally by artist.performance.metric
+    total_performances = fields.Integer('Total Performances', readonly=True, copy=False)
     total_achievements = fields.Integer('Total Achievements', compute='_compute_performance_stats', store=True)
     
     # Financial Information (for grants, payments, etc.)
@@ -92,8 +98,10 @@ class Artist(models.Model):
                                   string='Documents')
     
     # Analytics and Stats
-    overall_rating = fields.Float('Overall Rating', compute='_compute_overall_rating', store=True)
-    last_performance_date = fields.Date('Last Performance', compute='_compute_last_performance', store=True)
+    overall_rating = fields.Float('Overall Rating', readonly=True, copy=False)
+    rating_sum = fields.Float('Rating Sum', readonly=True, copy=False)
+    rating_count = fields.Integer('Rated Performances', readonly=True, copy=False)
+    last_performance_date = fields.Date('Last Performance', readonly=True, copy=False)
     
     # Relations for event participation
     event_participants_ids = fields.Many2many(
@@ -112,29 +120,117 @@ class Artist(models.Model):
             else:
                 record.age = 0
 
-    @api.depends('performance_ids', 'achievement_ids')
+    @api.depends('achievement_ids')
     def _compute_performance_stats(self):
         for record in self:
-            record.total_performances = len(record.performance_ids)
             record.total_achievements = len(record.achievement_ids)
 
-    @api.depends('performance_ids.overall_rating')
-    def _compute_overall_rating(self):
-        for record in self:
-            if record.performance_ids:
-                ratings = record.performance_ids.mapped('overall_rating')
-                valid_ratings = [r for r in ratings if r > 0]
-                record.overall_rating = sum(valid_ratings) / len(valid_ratings) if valid_ratings else 0.0
-            else:
-                record.overall_rating = 0.0
+    @api.model
+    def _apply_performance_deltas(self, deltas, refresh_last_date=()):
+        """Apply running performance aggregate deltas in place
 
-    @api.depends('performance_ids.performance_date')
-    def _compute_last_performance(self):
-        for record in self:
-            if record.performance_ids:
-                record.last_performance_date = max(record.performance_ids.mapped('performance_date'))
-            else:
-                record.last_performance_date = False
+        ``deltas`` maps artist ids to (rating sum, rating count, performance count,
+        latest performance date) changes. Artists in ``refresh_last_date`` lost a
+        performance date and get their last performance date looked up again.
+        The resulting rating changes are forwarded to the artists' associations.
+        """
+        deltas = {artist_id: delta for artist_id, delta in deltas.items() if artist_id}
+        refresh_last_date = tuple(artist_id for artist_id in refresh_last_date if artist_id)
+        if not deltas and not refresh_last_date:
+            return
+        cr = self.env.cr
+        changes = []
+        if deltas:
+            artist_ids = list(deltas)
+            cr.execute("""
+                UPDATE artist_artist a
+                   SET rating_sum = COALESCE(a.rating_sum, 0) + d.rating_sum,
+                       rating_count = COALESCE(a.rating_count, 0) + d.rating_count,
+                       overall_rating = CASE
+                           WHEN COALESCE(a.rating_count, 0) + d.rating_count > 0
+                           THEN (COALESCE(a.rating_sum, 0) + d.rating_sum)
+                                / (COALESCE(a.rating_count, 0) + d.rating_count)
+                           ELSE 0.0 END,
+                       total_performances = COALESCE(a.total_performances, 0) + d.performance_count,
+                       last_performance_date = GREATEST(a.last_performance_date, d.last_date)
+                  FROM unnest(%s::int[], %s::float8[], %s::int[], %s::int[], %s::date[])
+                       AS d(artist_id, rating_sum, rating_count, performance_count, last_date),
+                       artist_artist old
+                 WHERE a.id = d.artist_id AND old.id = a.id
+             RETURNING a.id, a.active, COALESCE(old.overall_rating, 0), a.overall_rating, d.performance_count
+            """, [
+                artist_ids,
+                [deltas[artist_id][0] for artist_id in artist_ids],
+                [deltas[artist_id][1] for artist_id in artist_ids],
+                [deltas[artist_id][2] for artist_id in artist_ids],
+                [deltas[artist_id][3] for artist_id in artist_ids],
+            ])
+            changes = cr.fetchall()
+        if refresh_last_date:
+            self.env['artist.performance.metric'].flush_model(['artist_id', 'performance_date'])
+            cr.execute("""
+                UPDATE artist_artist a
+                   SET last_performance_date = (
+                        SELECT MAX(p.performance_date)
+                          FROM artist_performance_metric p
+                         WHERE p.artist_id = a.id)
+                 WHERE a.id IN %s
+            """, [refresh_last_date])
+        self.invalidate_model(['overall_rating', 'rating_sum', 'rating_count',
+                               'total_performances', 'last_performance_date'])
+
+        # Forward member deltas of active artists to their associations
+        member_deltas = {}
+        for artist_id, active, old_rating, new_rating, performance_count in changes:
+            if not active:
+                continue
+            member_deltas[artist_id] = (
+                (new_rating if new_rating > 0 else 0.0) - (old_rating if old_rating > 0 else 0.0),
+                int(new_rating > 0) - int(old_rating > 0),
+                performance_count,
+            )
+        self.env['artist.association']._apply_member_deltas(member_deltas)
+
+    @api.model
+    def _reconcile_performance_stats(self, artist_ids=None):
+        """Recompute performance aggregates from scratch to repair any drift"""
+        self.env['artist.performance.metric'].flush_model(['artist_id', 'performance_date', 'overall_rating'])
+        where, params = '', []
+        if artist_ids is not None:
+            if not artist_ids:
+                return
+            where, params = 'WHERE x.id IN %s', [tuple(artist_ids)]
+        self.env.cr.execute(f"""
+            UPDATE artist_artist a
+               SET rating_sum = COALESCE(t.rating_sum, 0),
+                   rating_count = COALESCE(t.rating_count, 0),
+                   overall_rating = COALESCE(t.rating_sum / NULLIF(t.rating_count, 0), 0.0),
+                   total_performances = COALESCE(t.performance_count, 0),
+                   last_performance_date = t.last_date
+              FROM (
+                SELECT x.id, s.rating_sum, s.rating_count, s.performance_count, s.last_date
+                  FROM artist_artist x
+             LEFT JOIN (
+                    SELECT artist_id,
+                           SUM(overall_rating) FILTER (WHERE overall_rating > 0) AS rating_sum,
+                           COUNT(*) FILTER (WHERE overall_rating > 0) AS rating_count,
+                           COUNT(*) AS performance_count,
+                           MAX(performance_date) AS last_date
+                      FROM artist_performance_metric
+                  GROUP BY artist_id
+                  ) s ON s.artist_id = x.id
+                 {where}
+              ) t
+             WHERE t.id = a.id
+        """, params)
+        self.invalidate_model(['overall_rating', 'rating_sum', 'rating_count',
+                               'total_performances', 'last_performance_date'])
+
+    @api.model
+    def _cron_reconcile_performance_stats(self):
+        """Scheduled repair of artist and association running aggregates"""
+        self._reconcile_performance_stats()
+        self.env['artist.association']._reconcile_member_stats()
 
     def _compute_event_participants(self):
         """Compute method for event participants compatibility"""
@@ -145,16 +241,27 @@ class Artist(models.Model):
     def create(self, vals_list):
         # Handle both single dict and list of dicts
         if isinstance(vals_list, dict):
-            # Single record creation
-            if 'artist_id' not in vals_list or not vals_list['artist_id']:
-                vals_list['artist_id'] = self.env['ir.sequence'].next_by_code('artist.artist') or 'ART000'
-        else:
-            # Batch creation - list of dicts
-            for vals in vals_list:
-                if 'artist_id' not in vals or not vals['artist_id']:
-                    vals['artist_id'] = self.env['ir.sequence'].next_by_code('artist.artist') or 'ART000'
+            vals_list = [vals_list]
+        self._assign_sequence_numbers(vals_list)
         
-        return super(Artist, self).create(vals_list)
+        records = super(Artist, self).create(vals_list)
+        self.env['artist.association']._reconcile_member_stats(records.association_ids.ids)
+        return records
+
+    def write(self, vals):
+        membership_change = 'association_ids' in vals or 'active' in vals
+        association_ids = set(self.association_ids.ids) if membership_change else set()
+        result = super().write(vals)
+        if membership_change:
+            self.env['artist.association']._reconcile_member_stats(
+                list(association_ids | set(self.association_ids.ids)))
+        return result
+
+    def unlink(self):
+        association_ids = self.association_ids.ids
+        result = super().unlink()
+        self.env['artist.association']._reconcile_member_stats(association_ids)
+        return result
 
     def action_view_performances(self):
         """Action to view artist's performances"""
@@ -0,0 +1,36 @@
+from odoo import models
+
+
+class ArtistImportWizard(models.TransientModel):
+    _name = 'artist.import.wizard'
+    _inherit = 'streaming.import.mixin'
+    _description = 'Artist Registry Import'
+
+    _import_model = 'artist.artist'
+    # Headers of static/xls/artist_import_template.xlsx
+    _import_columns = {
+        'Full Name': 'name',
+        'Stage/Professional Name': 'stage_name',
+        'Date of Birth': 'date_of_birth',
+        'Gender': 'gender',
+        'Phone Number': 'phone',
+        'Email Address': 'email',
+        'Address': 'address',
+        'Emergency Contact': 'emergency_contact',
+        'Emergency Phone': 'emergency_phone',
+        'Primary Art Category': 'art_category',
+        'Skill Level': 'skill_level',
+        'Years of Experience': 'years_of_experience',
+        'Portfolio URL': 'portfolio_url',
+        'Education Level': 'education_background',
+        'Training Institution': 'education_background',
+        'Awards/Recognition': 'certifications',
+        'Performance History': 'performance_history',
+        'Status': 'status',
+        'Zone': 'zone_id',
+        'Association': 'association_ids',
+    }
+    _import_lookups = {
+        'zone_id': ('artist.zone', ['code', 'name']),
+        'association_ids': ('artist.association', ['association_id', 'name']),
+    }
@@ -4,13 +4,16 @@ from odoo import models, fields, api
 class ArtistAssociation(models.Model):
     _name = 'artist.association'
     _description = 'Artist Associations and Organizations'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['batch.sequence.mixin', 'mail.thread', 'mail.activity.mixin']
     _rec_name = 'name'
+    _sequence_code = 'artist.association'
+    _sequence_field = 'association_id'
+    _sequence_fallback = 'ASSOC000'
 
     # Basic Information
     name = fields.Char('Association Name', required=True, tracking=True)
     association_id = fields.Char('Association ID', required=True, copy=False, readonly=True,
-                                default=lambda self: self.env['ir.sequence'].next_by_code('artist.association'))
+                                default='NEW')
     acronym = fields.Char('Acronym/Short Name', tracking=True)
     description = fields.Text('Description', tracking=True)
     
@@ -101,8 +104,11 @@ class ArtistAssociation(models.Model):
     
     # Statistics and Analytics
     total_events_organized = fields.Integer('Total Events Organized', compute='_compute_event_stats', store=True)
-    total_performances = fields.Integer('Total Performances by Members', compute='_compute_performance_stats', store=True)
-    average_member_rating = fields.Float('Average Member Rating', compute='_compute_member_rating', store=True)
+    # Member aggregates are maintained incrementally from the members' running aggregates
+    total_performances = fields.Integer('Total Performances by Members', readonly=True, copy=False)
+    average_member_rating = fields.Float('Average Member Rating', readonly=True, copy=False)
+    member_rating_sum = fields.Float('Member Rating Sum', readonly=True, copy=False)
+    member_rating_count = fields.Integer('Rated Members', readonly=True, copy=False)
     
     # Images and Documents
     logo = fields.Binary('Logo', attachment=True)
@@ -116,20 +122,86 @@ class ArtistAssociation(models.Model):
         for record in self:
             record.member_count = len(record.member_ids)
 
-    @api.depends('member_ids.performance_ids')
-    def _compute_performance_stats(self):
-        for record in self:
-            record.total_performances = sum(len(member.performance_ids) for member in record.member_ids)
+    @api.model
+    def _apply_member_deltas(self, member_deltas):
+        """Apply member (rating sum, rated count, performance count) deltas to associations
 
-    @api.depends('member_ids.overall_rating')
-    def _compute_member_rating(self):
-        for record in self:
-            if record.member_ids:
-                ratings = record.member_ids.mapped('overall_rating')
-                valid_ratings = [r for r in ratings if r > 0]
-                record.average_member_rating = sum(valid_ratings) / len(valid_ratings) if valid_ratings else 0.0
-            else:
-                record.average_member_rating = 0.0
+        Deltas are summed per association through the membership table so every
+        association is updated once, whatever the number of changed members.
+        """
+        if not member_deltas:
+            return
+        field = self._fields['member_ids']
+        artist_ids = list(member_deltas)
+        self.env.cr.execute(f"""
+            UPDATE artist_association s
+               SET member_rating_sum = COALESCE(s.member_rating_sum, 0) + d.rating_sum,
+                   member_rating_count = COALESCE(s.member_rating_count, 0) + d.rating_count,
+                   average_member_rating = CASE
+                       WHEN COALESCE(s.member_rating_count, 0) + d.rating_count > 0
+                       THEN (COALESCE(s.member_rating_sum, 0) + d.rating_sum)
+                            / (COALESCE(s.member_rating_count, 0) + d.rating_count)
+                       ELSE 0.0 END,
+                   total_performances = COALESCE(s.total_performances, 0) + d.performance_count
+              FROM (
+                SELECT rel.{field.column1} AS association_id,
+                       SUM(v.rating_sum) AS rating_sum,
+                       SUM(v.rating_count) AS rating_count,
+                       SUM(v.performance_count) AS performance_count
+                  FROM {field.relation} rel
+                  JOIN unnest(%s::int[], %s::float8[], %s::int[], %s::int[])
+                       AS v(artist_id, rating_sum, rating_count, performance_count)
+                    ON v.artist_id = rel.{field.column2}
+              GROUP BY rel.{field.column1}
+              ) d
+             WHERE d.association_id = s.id
+        """, [
+            artist_ids,
+            [member_deltas[artist_id][0] for artist_id in artist_ids],
+            [member_deltas[artist_id][1] for artist_id in artist_ids],
+            [member_deltas[artist_id][2] for artist_id in artist_ids],
+        ])
+        self.invalidate_model(['member_rating_sum', 'member_rating_count',
+                               'average_member_rating', 'total_performances'])
+
+    @api.model
+    def _reconcile_member_stats(self, association_ids=None):
+        """Recompute member aggregates from the members' stored aggregates"""
+        where, params = '', []
+        if association_ids is not None:
+            if not association_ids:
+                return
+            where, params = 'WHERE x.id IN %s', [tuple(association_ids)]
+        self.flush_model(['member_ids'])
+        self.env['artist.artist'].flush_model(['active', 'overall_rating', 'total_performances'])
+        field = self._fields['member_ids']
+        self.env.cr.execute(f"""
+            UPDATE artist_association s
+               SET member_rating_sum = COALESCE(t.rating_sum, 0),
+                   member_rating_count = COALESCE(t.rating_count, 0),
+                   average_member_rating = COALESCE(t.rating_sum / NULLIF(t.rating_count, 0), 0.0),
+                   total_performances = COALESCE(t.performance_count, 0)
+              FROM (
+                SELECT x.id,
+                       SUM(a.overall_rating) FILTER (WHERE a.overall_rating > 0) AS rating_sum,
+                       COUNT(a.id) FILTER (WHERE a.overall_rating > 0) AS rating_count,
+                       SUM(a.total_performances) AS performance_count
+                  FROM artist_association x
+             LEFT JOIN {field.relation} rel ON rel.{field.column1} = x.id
+             LEFT JOIN artist_artist a ON a.id = rel.{field.column2} AND a.active
+                 {where}
+              GROUP BY x.id
+              ) t
+             WHERE t.id = s.id
+        """, params)
+        self.invalidate_model(['member_rating_sum', 'member_rating_count',
+                               'average_member_rating', 'total_performances'])
+
+    def write(self, vals):
+        result = super().write(vals)
+        if 'member_ids' in vals:
+            self._reconcile_member_stats(self.ids)
+        return result
 
     def _compute_event_stats(self):
         # This would be computed based on event management module integration
@@ -141,16 +213,12 @@ class ArtistAssociation(models.Model):
     def create(self, vals_list):
         # Handle both single dict and list of dicts
         if isinstance(vals_list, dict):
-            # Single record creation
-            if 'association_id' not in vals_list or not vals_list['association_id']:
-                vals_list['association_id'] = self.env['ir.sequence'].next_by_code('artist.association') or 'ASSOC000'
-        else:
-            # Batch creation - list of dicts
-            for vals in vals_list:
-                if 'association_id' not in vals or not vals['association_id']:
-                    vals['association_id'] = self.env['ir.sequence'].next_by_code('artist.association') or 'ASSOC000'
+            vals_list = [vals_list]
+        self._assign_sequence_numbers(vals_list)
         
-        return super(ArtistAssociation, self).create(vals_list)
+        records = super(ArtistAssociation, self).create(vals_list)
+        records._reconcile_member_stats(records.ids)
+        return records
 
     def action_view_members(self):
         """Action to view association members"""
@@ -1,6 +1,12 @@
-from odoo import models, fields, api
+from collections import defaultdict
 from datetime import datetime
 
+from odoo import models, fields, api
+
+# Fields feeding the artists' running performance aggregates
+ARTIST_AGGREGATE_FIELDS = {'artist_id', 'performance_date', 'self_rating', 'peer_rating',
+                           'instructor_rating', 'audience_rating'}
+
 
 class ArtistPerformanceMetric(models.Model):
     _name = 'artist.performance.metric'
@@ -11,7 +17,7 @@ class ArtistPerformanceMetric(models.Model):
 
     # Basic Information
     name = fields.Char('Performance Title', required=True, tracking=True)
-    artist_id = fields.Many2one('artist.artist', string='Artist', required=True, tracking=True)
+    artist_id = fields.Many2one('artist.artist', string='Artist', required=True, tracking=True, index=True)
     performance_date = fields.Date('Performance Date', required=True, tracking=True)
     performance_time = fields.Float('Performance Time', help='Time in 24-hour format (e.g., 14.5 for 2:30 PM)')
     
@@ -192,6 +198,61 @@ class ArtistPerformanceMetric(models.Model):
             
             record.overall_rating = sum(ratings) / len(ratings) if ratings else 0.0
 
+    def init(self):
+        # Seed the artist and association running aggregates from existing performances
+        self.env['artist.artist']._reconcile_performance_stats()
+        self.env['artist.association']._reconcile_member_stats()
+
+    @api.model
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records._update_artist_aggregates(records._get_aggregate_contributions())
+        return records
+
+    def write(self, vals):
+        if not ARTIST_AGGREGATE_FIELDS.intersection(vals):
+            return super().write(vals)
+        old = self._get_aggregate_contributions()
+        result = super().write(vals)
+        self._update_artist_aggregates(
+            self._get_aggregate_contributions(), old,
+            refresh_last_date='artist_id' in vals or 'performance_date' in vals)
+        return result
+
+    def unlink(self):
+        old = self._get_aggregate_contributions()
+        result = super().unlink()
+        self._update_artist_aggregates([], old)
+        return result
+
+    def _get_aggregate_contributions(self):
+        """Return what each performance adds to its artist's running aggregates"""
+        return [
+            (record.artist_id.id, record.overall_rating if record.overall_rating > 0 else 0.0,
+             int(record.overall_rating > 0), record.performance_date)
+            for record in self
+        ]
+
+    @api.model
+    def _update_artist_aggregates(self, added, removed=(), refresh_last_date=True):
+        """Turn added and removed contributions into per-artist deltas"""
+        deltas = defaultdict(lambda: [0.0, 0, 0, None])
+        for artist_id, rating, rated, date in added:
+            delta = deltas[artist_id]
+            delta[0] += rating
+            delta[1] += rated
+            delta[2] += 1
+            delta[3] = max(delta[3], date) if delta[3] and date else (delta[3] or date)
+        for artist_id, rating, rated, date in removed:
+            delta = deltas[artist_id]
+            delta[0] -= rating
+            delta[1] -= rated
+            delta[2] -= 1
+        # Removing a performance may remove the artist's latest date
+        stale_dates = {artist_id for artist_id, *__ in removed} if refresh_last_date else set()
+        self.env['artist.artist']._apply_performance_deltas(
+            {artist_id: tuple(delta) for artist_id, delta in deltas.items()}, stale_dates)
+
     @api.depends('performance_fee', 'expenses')
     def _compute_net_income(self):
         for record in self:
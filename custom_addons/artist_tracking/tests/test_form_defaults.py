@@ -0,0 +1,49 @@
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestFormDefaults(TransactionCase):
+    """Opening a new artist or association form must not consume a sequence number"""
+
+    MODELS = {
+        'artist.artist': 'artist_id',
+        'artist.association': 'association_id',
+    }
+
+    def _sequence_next(self, model_name):
+        sequence = self.env['ir.sequence'].search([('code', '=', model_name)], limit=1)
+        sequence.invalidate_recordset(['number_next_actual'])
+        return sequence.number_next_actual
+
+    def test_default_get_runs_no_queries(self):
+        for model_name, id_field in self.MODELS.items():
+            with self.subTest(model=model_name):
+                Model = self.env[model_name]
+                field_names = list(Model._fields)
+                # The first call fills the ir.default and registry caches
+                Model.default_get(field_names)
+                with self.assertQueryCount(0):
+                    defaults = Model.default_get(field_names)
+                self.assertEqual(defaults[id_field], 'NEW')
+
+    def test_onchange_keeps_sequence_untouched(self):
+        for model_name, id_field in self.MODELS.items():
+            with self.subTest(model=model_name):
+                Model = self.env[model_name]
+                before = self._sequence_next(model_name)
+                for __ in range(3):
+                    result = Model.onchange({}, [], {id_field: {}, 'name': {}})
+                    self.assertEqual(result['value'][id_field], 'NEW')
+                self.assertEqual(self._sequence_next(model_name), before)
+
+    def test_create_assigns_sequence_number(self):
+        zone = self.env['artist.zone'].create({'name': 'Matero', 'code': 'MTR'})
+        artist = self.env['artist.artist'].create({'name': 'Mwila Banda', 'art_category': 'music'})
+        association = self.env['artist.association'].create({
+            'name': 'Lusaka Drummers',
+            'association_type': 'community',
+            'art_focus': 'music',
+            'zone_id': zone.id,
+        })
+        self.assertNotEqual(artist.artist_id, 'NEW')
+        self.assertNotEqual(association.association_id, 'NEW')
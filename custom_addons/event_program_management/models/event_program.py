@@ -3,6 +3,7 @@ from odoo import models, fields, api
 class EventProgram(models.Model):
     _name = 'event.program'
     _description = 'Event or Program'
+    _inherit = ['mail.thread']
 
     name = fields.Char(string='Name', required=True)
     age = fields.Integer(string='Age')
@@ -3,6 +3,9 @@ from odoo import models, fields, api
 class EventParticipant(models.Model):
     _name = 'event.participant'
     _description = 'Event Participant'
+    _inherit = ['person.identity.mixin']
+    _identity_phone_field = 'contact'
+    _identity_birth_date_field = None
 
     name = fields.Char(string='Full Name', required=True)
     # athlete_id = fields.Many2one('sports.athlete', string='Athlete', 
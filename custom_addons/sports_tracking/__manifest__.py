@@ -24,11 +24,14 @@
         'security/ir.model.access.csv',
         'security/sports_tracking_security.xml',
         'data/sports_data.xml',
+        'data/ir_cron_data.xml',
         'views/athlete_views.xml',
         'views/zone_association_views.xml',
         'views/performance_achievement_views.xml',
         'views/analytics_menu_views.xml',
         'views/analytics_graph_views.xml',
+        'views/import_views.xml',
+        'views/person_identity_views.xml',
     ],
     'installable': True,
     'application': True,
@@ -1,6 +1,13 @@
+from . import sequence_mixin
+from . import import_mixin
+from . import person_identity
+from . import birthday_mixin
 from . import sports_zone
 from . import sports_association
 from . import athlete
 from . import performance_metric
+from . import personal_best
 from . import achievement
-from . import sports_analytics
\ No newline at end of file
+from . import medal_table
+from . import sports_analytics
+from . import athlete_import
\ No newline at end of file
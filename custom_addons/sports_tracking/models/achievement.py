@@ -1,5 +1,10 @@
 from odoo import models, fields, api
 
+# Fields feeding the cached zone leaderboard
+LEADERBOARD_FIELDS = {'athlete_id', 'medal_type', 'verified', 'date'}
+# Fields feeding the medal table
+MEDAL_TABLE_FIELDS = {'athlete_id', 'medal_type', 'verified', 'competition_level'}
+
 class SportsAchievement(models.Model):
     _name = 'sports.achievement'
     _description = 'Sports Achievement and Awards'
@@ -82,6 +87,39 @@ class SportsAchievement(models.Model):
     team_achievement = fields.Boolean(string='Team Achievement')
     team_members = fields.Char(string='Team Members')
 
+    @api.model
+    def create(self, vals_list):
+        result = super().create(vals_list)
+        self.env['sports.medal.table']._refresh_athletes(result.athlete_id.ids)
+        if result._has_verified_medals():
+            self.env['sports.analytics']._invalidate_zone_leaderboard()
+        return result
+
+    def write(self, vals):
+        athlete_ids = set(self.athlete_id.ids) if MEDAL_TABLE_FIELDS.intersection(vals) else set()
+        # A medal counts on the leaderboard if it was verified before or after the write
+        leaderboard_fields = LEADERBOARD_FIELDS.intersection(vals)
+        was_counted = bool(leaderboard_fields) and self._has_verified_medals()
+        result = super().write(vals)
+        if athlete_ids:
+            self.env['sports.medal.table']._refresh_athletes(athlete_ids | set(self.athlete_id.ids))
+        if leaderboard_fields and (was_counted or self._has_verified_medals()):
+            self.env['sports.analytics']._invalidate_zone_leaderboard()
+        return result
+
+    def unlink(self):
+        athlete_ids = self.athlete_id.ids
+        leaderboard_changed = self._has_verified_medals()
+        result = super().unlink()
+        self.env['sports.medal.table']._refresh_athletes(athlete_ids)
+        if leaderboard_changed:
+            self.env['sports.analytics']._invalidate_zone_leaderboard()
+        return result
+
+    def _has_verified_medals(self):
+        """Tell whether any of these achievements counts on the zone leaderboard"""
+        return any(record.verified and record.medal_type for record in self)
+
     @api.onchange('achievement_type')
     def _onchange_achievement_type(self):
         if self.achievement_type != 'medal':
@@ -128,57 +166,17 @@ class SportsAchievement(models.Model):
         return ' '.join(display_parts) if display_parts else self.name
 
     @api.model
-    def get_top_performers(self, sport_type=None, competition_level=None, limit=10):
+    def get_top_performers(self, sport_type=None, competition_level=None, limit=10, offset=0,
+                           zone_id=None, association_id=None):
         """Get top performing participants based on achievements"""
-        domain = [('verified', '=', True)]
-        
-        if sport_type:
-            domain.append(('athlete_id.primary_sport', '=', sport_type))
-        
-        if competition_level:
-            domain.append(('competition_level', '=', competition_level))
-        
-        # Group by participant and count achievements
-        achievements = self.search(domain)
-        participant_scores = {}
-        
-        for achievement in achievements:
-            athlete = achievement.athlete_id
-            if athlete.id not in participant_scores:
-                participant_scores[athlete.id] = {
-                    'participant': athlete,
-                    'total_achievements': 0,
-                    'gold_medals': 0,
-                    'silver_medals': 0,
-                    'bronze_medals': 0,
-                    'score': 0
-                }
-            
-            participant_scores[athlete.id]['total_achievements'] += 1
-            
-            # Calculate score (Gold=3, Silver=2, Bronze=1)
-            if achievement.medal_type == 'gold':
-                participant_scores[athlete.id]['gold_medals'] += 1
-                participant_scores[athlete.id]['score'] += 3
-            elif achievement.medal_type == 'silver':
-                participant_scores[athlete.id]['silver_medals'] += 1
-                participant_scores[athlete.id]['score'] += 2
-            elif achievement.medal_type == 'bronze':
-                participant_scores[athlete.id]['bronze_medals'] += 1
-                participant_scores[athlete.id]['score'] += 1
-        
-        # Sort by score and return top performers
-        top_performers = sorted(participant_scores.values(), 
-                              key=lambda x: (x['score'], x['gold_medals'], x['silver_medals']), 
-                              reverse=True)
-        
-        return top_performers[:limit]
-
-    def action_verify(self):
-        """Verify the achievement"""
-        self.verified = True
-        self.verified_by = self.env.user.id
-        self.verification_date = fields.Datetime.now()
+        return self.env['sports.medal.table'].get_ranking(
+            sport_type=sport_type,
+            competition_level=competition_level,
+            zone_id=zone_id,
+            association_id=association_id,
+            limit=limit,
+            offset=offset,
+        )
 
     def action_view_athlete_achievements(self):
         """View all achievements for this athlete"""
@@ -1,11 +1,32 @@
 from odoo import models, fields, api
 from datetime import datetime
 
+from .birthday_mixin import AGE_EXPRESSION
+
+# Upper age bound and label of each athlete age category, oldest last
+AGE_CATEGORIES = [
+    (12, 'Under 12'),
+    (15, 'Under 15'),
+    (18, 'Under 18'),
+    (21, 'Under 21'),
+    (30, 'Adult (18-30)'),
+    (40, 'Masters (31-40)'),
+    (50, 'Masters (41-50)'),
+]
+AGE_CATEGORY_OLDEST = 'Masters (50+)'
+
 class SportsAthlete(models.Model):
     _name = 'sports.athlete'
     _description = 'Sports Athlete'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['batch.sequence.mixin', 'person.identity.mixin', 'birthday.refresh.mixin',
+                'mail.thread', 'mail.activity.mixin']
     _rec_name = 'name'
+    _identity_national_id_field = 'national_id'
+    _age_fields = ('age', 'age_computed')
+    _sequence_code = 'sports.athlete'
+    _sequence_field = 'athlete_id'
+    _sequence_prefix = 'ATH'
+    _sequence_fallback = '000'
 
     # Basic Information
     name = fields.Char(string='Full Name', required=True)
@@ -121,6 +142,18 @@ class SportsAthlete(models.Model):
     # Medical Information (for athletes)
     medical_clearance = fields.Boolean(string='Medical Clearance')
     medical_clearance_date = fields.Date(string='Medical Clearance Date')
+    height_cm = fields.Float(string='Height (cm)')
+    weight_kg = fields.Float(string='Weight (kg)')
+    blood_type = fields.Selection([
+        ('a+', 'A+'),
+        ('a-', 'A-'),
+        ('b+', 'B+'),
+        ('b-', 'B-'),
+        ('ab+', 'AB+'),
+        ('ab-', 'AB-'),
+        ('o+', 'O+'),
+        ('o-', 'O-')
+    ], string='Blood Type')
     medical_notes = fields.Text(string='Medical Notes')
     
     # Emergency Contact (for athletes)
@@ -148,22 +181,15 @@ class SportsAthlete(models.Model):
     def _compute_age_category(self):
         for record in self:
             age = record.age_computed
-            if age <= 12:
-                record.age_category = 'Under 12'
-            elif age <= 15:
-                record.age_category = 'Under 15'
-            elif age <= 18:
-                record.age_category = 'Under 18'
-            elif age <= 21:
-                record.age_category = 'Under 21'
-            elif age <= 30:
-                record.age_category = 'Adult (18-30)'
-            elif age <= 40:
-                record.age_category = 'Masters (31-40)'
-            elif age <= 50:
-                record.age_category = 'Masters (41-50)'
-            else:
-                record.age_category = 'Masters (50+)'
+            record.age_category = next(
+                (label for limit, label in AGE_CATEGORIES if age <= limit), AGE_CATEGORY_OLDEST)
+
+    @api.model
+    def _get_age_assignments(self):
+        assignments = super()._get_age_assignments()
+        cases = ' '.join(f"WHEN {AGE_EXPRESSION} <= {limit} THEN '{label}'" for limit, label in AGE_CATEGORIES)
+        assignments['age_category'] = f"CASE {cases} ELSE '{AGE_CATEGORY_OLDEST}' END"
+        return assignments
 
     @api.depends('career_start_date')
     def _compute_years_active(self):
@@ -189,14 +215,20 @@ class SportsAthlete(models.Model):
         if not isinstance(vals_list, list):
             vals_list = [vals_list]
         
-        for vals in vals_list:
-            # Auto-generate athlete ID
-            if not vals.get('athlete_id'):
-                sequence = self.env['ir.sequence'].next_by_code('sports.athlete') or '000'
-                vals['athlete_id'] = f"ATH{sequence}"
+        # Auto-generate athlete IDs
+        self._assign_sequence_numbers(vals_list)
         
         return super().create(vals_list)
 
+    def write(self, vals):
+        result = super().write(vals)
+        if 'association_id' in vals or 'primary_sport' in vals:
+            self.env['sports.medal.table']._refresh_athletes(self.ids)
+        if 'association_id' in vals and self.achievement_ids._has_verified_medals():
+            # Moves medals between zones of the cached leaderboard
+            self.env['sports.analytics']._invalidate_zone_leaderboard()
+        return result
+
     def action_retire_athlete(self):
         """Retire the athlete"""
         self.athlete_status = 'retired'
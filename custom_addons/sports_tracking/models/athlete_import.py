@@ -0,0 +1,36 @@
+from odoo import models
+
+
+class SportsAthleteImportWizard(models.TransientModel):
+    _name = 'sports.athlete.import.wizard'
+    _inherit = 'streaming.import.mixin'
+    _description = 'Athlete Registry Import'
+
+    _import_model = 'sports.athlete'
+    # Headers of static/xls/athlete_import_template.xlsx
+    _import_columns = {
+        'Full Name': 'name',
+        'Email': 'email',
+        'Phone Number': 'phone',
+        'Gender': 'gender',
+        'Address': 'address',
+        'Date of Birth': 'date_of_birth',
+        'National ID': 'national_id',
+        'Primary Sport': 'primary_sport',
+        'Secondary Sport': 'secondary_sports',
+        'Position/Event': 'position',
+        'Skill Level': 'playing_level',
+        'Club/Team': None,
+        'Coach Name': None,
+        'Height (cm)': 'height_cm',
+        'Weight (kg)': 'weight_kg',
+        'Blood Type': 'blood_type',
+        'Medical Conditions': 'medical_notes',
+        'Emergency Contact': 'emergency_contact_name',
+        'Emergency Phone': 'emergency_contact_phone',
+        'Status': 'athlete_status',
+        'Association': 'association_id',
+    }
+    _import_lookups = {
+        'association_id': ('sports.association', ['registration_number', 'name']),
+    }
@@ -0,0 +1,82 @@
+import calendar
+from datetime import timedelta
+
+from odoo import models, fields, api
+
+# SQL expression of the age in whole years on the refresh date
+AGE_EXPRESSION = "date_part('year', age(%(today)s, date_of_birth))::int"
+
+
+class BirthdayRefreshMixin(models.AbstractModel):
+    _name = 'birthday.refresh.mixin'
+    _description = 'Birthday Age Refresh Mixin'
+
+    # Stored age fields computed from date_of_birth and refreshed on birthdays
+    _age_fields = ('age',)
+
+    birthday_key = fields.Integer(
+        string='Birthday (MMDD)',
+        compute='_compute_birthday_key',
+        store=True,
+        index=True,
+        help='Month and day of birth, used to find the records whose age changes on a given day'
+    )
+
+    @api.depends('date_of_birth')
+    def _compute_birthday_key(self):
+        for record in self:
+            dob = record.date_of_birth
+            record.birthday_key = dob.month * 100 + dob.day if dob else 0
+
+    @api.model
+    def _birthday_keys_between(self, date_from, date_to):
+        """Return the birthday keys whose anniversary falls after date_from and up to date_to
+
+        Returns None when the period spans a whole year, meaning every key.
+        """
+        if (date_to - date_from).days >= 366:
+            return None
+        keys = set()
+        day = date_from + timedelta(days=1)
+        while day <= date_to:
+            keys.add(day.month * 100 + day.day)
+            # 29 February birthdays are celebrated on 1 March in common years
+            if (day.month, day.day) == (3, 1) and not calendar.isleap(day.year):
+                keys.add(229)
+            day += timedelta(days=1)
+        return keys
+
+    @api.model
+    def _get_age_assignments(self):
+        """Return {column: SQL expression} of the age fields updated on birthdays"""
+        return {field_name: AGE_EXPRESSION for field_name in self._age_fields}
+
+    @api.model
+    def _cron_refresh_ages(self):
+        """Recompute the ages of the records whose birthday passed since the last run"""
+        param = f'{self._name}.age_refresh_date'
+        config = self.env['ir.config_parameter'].sudo()
+        today = fields.Date.context_today(self)
+        last_run = fields.Date.to_date(config.get_param(param) or False)
+        if last_run and last_run >= today:
+            return
+        # The first run refreshes every record
+        self._refresh_ages(self._birthday_keys_between(last_run, today) if last_run else None, today)
+        config.set_param(param, fields.Date.to_string(today))
+
+    @api.model
+    def _refresh_ages(self, birthday_keys, today):
+        """Update the age fields of the records with the given birthday keys, or of all records"""
+        if birthday_keys is not None and not birthday_keys:
+            return
+        assignments = self._get_age_assignments()
+        self.flush_model(['date_of_birth', 'birthday_key'] + list(assignments))
+        key_clause = 'AND birthday_key IN %(keys)s' if birthday_keys is not None else ''
+        set_clause = ', '.join(f'{column} = {expression}' for column, expression in assignments.items())
+        self.env.cr.execute(f"""
+            UPDATE {self._table}
+               SET {set_clause}
+             WHERE date_of_birth IS NOT NULL {key_clause}
+         RETURNING id
+        """, {'today': today, 'keys': tuple(birthday_keys or ())})
+        self.browse([row[0] for row in self.env.cr.fetchall()]).invalidate_recordset(list(assignments))
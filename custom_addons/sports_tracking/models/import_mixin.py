@@ -0,0 +1,231 @@
+import base64
+import csv
+import io
+from datetime import date, datetime
+
+from odoo import models, fields, api
+from odoo.exceptions import UserError
+
+IMPORT_CHUNK_SIZE = 2000
+
+
+def create_in_savepoints(Model, rows):
+    """Create [(key, vals)] rows in one savepoint, or one savepoint per row if that fails
+
+    Returns the created records and a list of (key, error message) for the
+    rows the database rejected.
+    """
+    env = Model.env
+    try:
+        with env.cr.savepoint():
+            return Model.create([vals for __, vals in rows]), []
+    except Exception:
+        env.invalidate_all()
+
+    # Isolate the offending rows when the chunk as a whole is rejected
+    created, failures = Model.browse(), []
+    for key, vals in rows:
+        try:
+            with env.cr.savepoint():
+                created |= Model.create(vals)
+        except Exception as e:
+            env.invalidate_all()
+            failures.append((key, str(e)))
+    return created, failures
+
+
+class StreamingImportMixin(models.AbstractModel):
+    _name = 'streaming.import.mixin'
+    _description = 'Streaming Spreadsheet Import Mixin'
+
+    # Target model, template header -> field mapping, and many2one/many2many
+    # fields resolved by code: {field: (comodel, [lookup fields])}
+    _import_model = None
+    _import_columns = {}
+    _import_lookups = {}
+
+    import_file = fields.Binary(string='File', required=True)
+    import_filename = fields.Char(string='File Name')
+    chunk_size = fields.Integer(string='Rows per Batch', default=IMPORT_CHUNK_SIZE)
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('done', 'Done')
+    ], string='State', default='draft')
+    imported_count = fields.Integer(string='Imported Rows', readonly=True)
+    rejected_count = fields.Integer(string='Rejected Rows', readonly=True)
+    rejected_file = fields.Binary(string='Rejected Rows File', readonly=True)
+    rejected_filename = fields.Char(string='Rejected File Name', readonly=True)
+
+    def action_import(self):
+        """Stream the uploaded file into the target model chunk by chunk"""
+        self.ensure_one()
+        Model = self.env[self._import_model].with_context(
+            tracking_disable=True,
+            mail_create_nolog=True,
+            mail_notrack=True,
+        )
+        rows = self._iter_import_rows()
+        header = next(rows, None)
+        if not header:
+            raise UserError("The uploaded file is empty.")
+        header = [str(column or '').strip() for column in header]
+        unknown = [column for column in header if column and column not in self._import_columns]
+        if len(unknown) == len([column for column in header if column]):
+            raise UserError("The uploaded file does not match the import template.")
+
+        rejected = io.StringIO()
+        rejected_writer = csv.writer(rejected)
+        rejected_writer.writerow(header + ['Error'])
+        imported = rejected_count = 0
+
+        chunk = []
+        chunk_size = max(self.chunk_size, 1)
+        for row_number, values in enumerate(rows, start=2):
+            if not any(value not in (None, '') for value in values):
+                continue
+            chunk.append((row_number, values))
+            if len(chunk) >= chunk_size:
+                created, failed = self._import_chunk(Model, header, chunk, rejected_writer)
+                imported, rejected_count, chunk = imported + created, rejected_count + failed, []
+        if chunk:
+            created, failed = self._import_chunk(Model, header, chunk, rejected_writer)
+            imported, rejected_count = imported + created, rejected_count + failed
+
+        vals = {
+            'state': 'done',
+            'imported_count': imported,
+            'rejected_count': rejected_count,
+            'rejected_file': False,
+            'rejected_filename': False,
+        }
+        if rejected_count:
+            vals.update({
+                'rejected_file': base64.b64encode(rejected.getvalue().encode('utf-8')),
+                'rejected_filename': 'rejected_rows.csv',
+            })
+        self.write(vals)
+        return {
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
+
+    def _iter_import_rows(self):
+        """Yield the rows of the uploaded workbook or CSV file without loading it whole"""
+        content = base64.b64decode(self.import_file)
+        if (self.import_filename or '').lower().endswith('.csv'):
+            yield from csv.reader(io.StringIO(content.decode('utf-8-sig')))
+            return
+        import openpyxl
+        try:
+            workbook = openpyxl.load_workbook(io.BytesIO(content), read_only=True, data_only=True)
+        except Exception as e:
+            raise UserError(f"Could not read the uploaded workbook: {e}")
+        try:
+            yield from workbook.worksheets[0].iter_rows(values_only=True)
+        finally:
+            workbook.close()
+
+    def _import_chunk(self, Model, header, chunk, rejected_writer):
+        """Validate and create one chunk, returning (created, rejected) counts"""
+        rows = [(row_number, dict(zip(header, values)), values) for row_number, values in chunk]
+        lookups = self._resolve_import_lookups([row for __, row, __ in rows])
+
+        valid = []
+        rejected = 0
+        for row_number, row, values in rows:
+            try:
+                valid.append((values, self._convert_import_row(Model, row, lookups)))
+            except ValueError as e:
+                rejected_writer.writerow(list(values) + [f"Row {row_number}: {e}"])
+                rejected += 1
+        if not valid:
+            return 0, rejected
+
+        created, failures = create_in_savepoints(Model, valid)
+        for values, error in failures:
+            rejected_writer.writerow(list(values) + [error])
+        return len(created), rejected + len(failures)
+
+    def _resolve_import_lookups(self, rows):
+        """Resolve every relational cell of a chunk with one search per comodel"""
+        lookups = {}
+        for field_name, (comodel, keys) in self._import_lookups.items():
+            columns = [column for column, name in self._import_columns.items() if name == field_name]
+            codes = set()
+            for row in rows:
+                for column in columns:
+                    codes.update(self._split_import_codes(row.get(column)))
+            mapping = {}
+            if codes:
+                domain = ['|'] * (len(keys) - 1) + [(key, 'in', list(codes)) for key in keys]
+                for record in self.env[comodel].search_read(domain, keys):
+                    for key in keys:
+                        if record[key]:
+                            mapping.setdefault(str(record[key]).strip().lower(), record['id'])
+            lookups[field_name] = mapping
+        return lookups
+
+    @api.model
+    def _split_import_codes(self, value):
+        if value in (None, ''):
+            return []
+        return [code.strip() for code in str(value).split(',') if code.strip()]
+
+    def _convert_import_row(self, Model, row, lookups):
+        """Convert a template row into create values, raising ValueError on bad data"""
+        vals = {}
+        for column, field_name in self._import_columns.items():
+            value = row.get(column)
+            if field_name is None or value in (None, ''):
+                continue
+            field = Model._fields[field_name]
+            if field.type in ('many2one', 'many2many'):
+                ids = []
+                for code in self._split_import_codes(value):
+                    record_id = lookups[field_name].get(code.lower())
+                    if not record_id:
+                        raise ValueError(f"{column}: unknown value '{code}'")
+                    ids.append(record_id)
+                vals[field_name] = ids[0] if field.type == 'many2one' else [fields.Command.set(ids)]
+            elif field.type == 'selection':
+                vals[field_name] = self._convert_import_selection(Model, field, column, value)
+            elif field.type == 'date':
+                vals[field_name] = self._convert_import_date(column, value)
+            elif field.type in ('integer', 'float'):
+                try:
+                    vals[field_name] = float(value) if field.type == 'float' else int(float(value))
+                except (TypeError, ValueError):
+                    raise ValueError(f"{column}: '{value}' is not a number")
+            elif field.type == 'text' and list(self._import_columns.values()).count(field_name) > 1:
+                # Several template columns feed the same text field
+                line = f"{column}: {value}"
+                vals[field_name] = f"{vals[field_name]}\n{line}" if vals.get(field_name) else line
+            else:
+                vals[field_name] = str(value).strip()
+        for field_name in set(self._import_columns.values()) - set(vals):
+            field = field_name and Model._fields[field_name]
+            if field and field.required and not field.default:
+                raise ValueError(f"Missing required value for '{field.string}'")
+        return vals
+
+    @api.model
+    def _convert_import_selection(self, Model, field, column, value):
+        value = str(value).strip().lower()
+        for key, label in field._description_selection(self.env):
+            if value in (key.lower(), str(label).lower()):
+                return key
+        raise ValueError(f"{column}: invalid value '{value}'")
+
+    @api.model
+    def _convert_import_date(self, column, value):
+        if isinstance(value, datetime):
+            return value.date()
+        if isinstance(value, date):
+            return value
+        try:
+            return fields.Date.to_date(str(value).strip()[:10])
+        except ValueError:
+            raise ValueError(f"{column}: '{value}' is not a valid date (YYYY-MM-DD)")
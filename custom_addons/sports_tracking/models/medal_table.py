@@ -0,0 +1,110 @@
+from odoo import models, fields, api
+
+
+class SportsMedalTable(models.Model):
+    _name = 'sports.medal.table'
+    _description = 'Sports Medal Table'
+    _order = 'score desc, gold_medals desc, silver_medals desc'
+
+    athlete_id = fields.Many2one('sports.athlete', string='Athlete', required=True, ondelete='cascade', index=True)
+    association_id = fields.Many2one('sports.association', string='Association', index=True)
+    zone_id = fields.Many2one('sports.zone', string='Zone', index=True)
+    sport_type = fields.Selection(
+        selection=lambda self: self.env['sports.athlete']._fields['primary_sport'].selection,
+        string='Sport', index=True)
+    competition_level = fields.Selection(
+        selection=lambda self: self.env['sports.achievement']._fields['competition_level'].selection,
+        string='Competition Level', index=True)
+
+    gold_medals = fields.Integer(string='Gold Medals')
+    silver_medals = fields.Integer(string='Silver Medals')
+    bronze_medals = fields.Integer(string='Bronze Medals')
+    total_achievements = fields.Integer(string='Total Achievements')
+    score = fields.Integer(string='Score', help="Gold=3, Silver=2, Bronze=1")
+
+    _sql_constraints = [
+        ('athlete_level_uniq', 'unique(athlete_id, competition_level)',
+         'There can only be one medal table row per athlete and competition level.'),
+    ]
+
+    def init(self):
+        # Populate the table from existing verified achievements
+        self._refresh_athletes()
+
+    @api.model
+    def _refresh_athletes(self, athlete_ids=None):
+        """Recompute the medal table rows of the given athletes, or of every athlete"""
+        if athlete_ids is not None:
+            athlete_ids = tuple(set(athlete_ids))
+            if not athlete_ids:
+                return
+        athlete_clause = 'AND ach.athlete_id IN %s' if athlete_ids else ''
+        params = [athlete_ids] if athlete_ids else []
+        cr = self.env.cr
+        self.env['sports.achievement'].flush_model(
+            ['athlete_id', 'medal_type', 'verified', 'competition_level'])
+        self.env['sports.athlete'].flush_model(['association_id', 'zone_id', 'primary_sport'])
+
+        if athlete_ids:
+            cr.execute("DELETE FROM sports_medal_table WHERE athlete_id IN %s", params)
+        else:
+            cr.execute("DELETE FROM sports_medal_table")
+        cr.execute(f"""
+            INSERT INTO sports_medal_table
+                   (athlete_id, association_id, zone_id, sport_type, competition_level,
+                    gold_medals, silver_medals, bronze_medals, total_achievements, score,
+                    create_uid, create_date, write_uid, write_date)
+            SELECT a.id, a.association_id, a.zone_id, a.primary_sport, ach.competition_level,
+                   COUNT(*) FILTER (WHERE ach.medal_type = 'gold'),
+                   COUNT(*) FILTER (WHERE ach.medal_type = 'silver'),
+                   COUNT(*) FILTER (WHERE ach.medal_type = 'bronze'),
+                   COUNT(*),
+                   COALESCE(SUM(CASE ach.medal_type
+                                    WHEN 'gold' THEN 3
+                                    WHEN 'silver' THEN 2
+                                    WHEN 'bronze' THEN 1
+                                END), 0),
+                   %s, now() AT TIME ZONE 'UTC', %s, now() AT TIME ZONE 'UTC'
+              FROM sports_achievement ach
+              JOIN sports_athlete a ON a.id = ach.athlete_id
+             WHERE ach.verified {athlete_clause}
+          GROUP BY a.id, a.association_id, a.zone_id, a.primary_sport, ach.competition_level
+        """, [self.env.uid, self.env.uid] + params)
+        self.invalidate_model()
+
+    @api.model
+    def get_ranking(self, sport_type=None, competition_level=None, zone_id=None,
+                    association_id=None, limit=10, offset=0):
+        """Rank athletes by medal score for any filter combination, ties sharing a rank"""
+        conditions = ['TRUE']
+        params = []
+        for column, value in (('sport_type', sport_type), ('competition_level', competition_level),
+                              ('zone_id', zone_id), ('association_id', association_id)):
+            if value:
+                conditions.append(f'{column} = %s')
+                params.append(value)
+
+        self.flush_model()
+        self.env.cr.execute(f"""
+            WITH totals AS (
+                SELECT athlete_id,
+                       SUM(total_achievements) AS total_achievements,
+                       SUM(gold_medals) AS gold_medals,
+                       SUM(silver_medals) AS silver_medals,
+                       SUM(bronze_medals) AS bronze_medals,
+                       SUM(score) AS score
+                  FROM sports_medal_table
+                 WHERE {' AND '.join(conditions)}
+              GROUP BY athlete_id
+            )
+            SELECT RANK() OVER (ORDER BY score DESC, gold_medals DESC, silver_medals DESC) AS rank,
+                   athlete_id, total_achievements, gold_medals, silver_medals, bronze_medals, score
+              FROM totals
+          ORDER BY rank, athlete_id
+             LIMIT %s OFFSET %s
+        """, params + [limit or None, offset or 0])
+        rows = self.env.cr.dictfetchall()
+        athletes = self.env['sports.athlete'].browse([row['athlete_id'] for row in rows])
+        for row, athlete in zip(rows, athletes):
+            row['participant'] = athlete
+        return rows
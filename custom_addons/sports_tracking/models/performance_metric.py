@@ -1,5 +1,22 @@
+import csv
+import io
+import json
+from collections import defaultdict
+
 from odoo import models, fields, api
 
+from .import_mixin import create_in_savepoints
+from .personal_best import CAREER_SEASON
+
+# Changing any of these moves a metric in or out of a personal best history
+PERSONAL_BEST_KEY_FIELDS = {'athlete_id', 'name', 'metric_type', 'value', 'date'}
+
+# Columns accepted by the bulk ingestion entry point besides the key columns
+INGEST_OPTIONAL_FIELDS = ('unit', 'event_name', 'location', 'competition_level',
+                          'weather_conditions', 'equipment_used', 'coach_notes', 'notes')
+INGEST_CHUNK_SIZE = 1000
+
+
 class SportsPerformanceMetric(models.Model):
     _name = 'sports.performance.metric'
     _description = 'Sports Performance Metrics'
@@ -77,40 +94,300 @@ class SportsPerformanceMetric(models.Model):
         
         result = super().create(vals_list)
         # Check if this is a personal best
-        result._check_personal_best()
+        if not self.env.context.get('skip_personal_best'):
+            result._check_personal_best()
         return result
 
     def write(self, vals):
+        rebuild = bool(PERSONAL_BEST_KEY_FIELDS.intersection(vals))
+        old_keys = self._get_personal_best_keys() if rebuild else set()
         result = super().write(vals)
-        if 'value' in vals:
-            self._check_personal_best()
+        if rebuild:
+            self._rebuild_personal_best_index(old_keys | self._get_personal_best_keys())
         return result
 
+    def unlink(self):
+        keys = self._get_personal_best_keys()
+        result = super().unlink()
+        self._rebuild_personal_best_index(keys)
+        return result
+
+    def _get_personal_best_keys(self):
+        """Return the (athlete, metric name, metric type) keys of these metrics"""
+        return {(record.athlete_id.id, record.name, record.metric_type) for record in self}
+
     def _check_personal_best(self):
         """Check if this metric is a personal best for the participant"""
+        if not self:
+            return
+        PersonalBest = self.env['sports.personal.best']
+        # Load every index entry these metrics can touch in a single query
+        entries = PersonalBest.search([
+            ('athlete_id', 'in', self.athlete_id.ids),
+            ('name', 'in', list(set(self.mapped('name')))),
+            ('metric_type', 'in', list(set(self.mapped('metric_type')))),
+        ])
+        index = {(e.athlete_id.id, e.name, e.metric_type, e.season): e for e in entries}
+        # A metric dated before any recorded one changes the best and previous
+        # best seen by the later metrics, so its keys are replayed in date order
+        latest = {
+            (athlete.id, name, metric_type): date
+            for athlete, name, metric_type, date in self._read_group(
+                [('athlete_id', 'in', self.athlete_id.ids),
+                 ('name', 'in', list(set(self.mapped('name')))),
+                 ('id', 'not in', self.ids)],
+                groupby=['athlete_id', 'name', 'metric_type'],
+                aggregates=['date:max'],
+            )
+        }
+        backdated = set()
         for record in self:
-            # Get all metrics of the same type for this athlete
-            similar_metrics = self.search([
-                ('athlete_id', '=', record.athlete_id.id),
-                ('metric_type', '=', record.metric_type),
-                ('name', '=', record.name),
-                ('id', '!=', record.id)
-            ])
-            
-            if similar_metrics:
-                # For time-based metrics, lower is better
-                if record.metric_type == 'time':
-                    best_value = min(similar_metrics.mapped('value'))
-                    record.is_personal_best = record.value < best_value
+            key = (record.athlete_id.id, record.name, record.metric_type)
+            if key in latest and latest[key] > record.date:
+                backdated.add(key)
+        new_entries = {}
+        # Records sharing the same outcome are written together
+        updates = defaultdict(list)
+
+        for record in self.sorted(lambda r: (r.date, r.id)):
+            key = (record.athlete_id.id, record.name, record.metric_type)
+            if key in backdated:
+                continue
+            flags = {}
+            for season, flag in ((CAREER_SEASON, 'is_personal_best'),
+                                 (str(record.date.year), 'is_seasonal_best')):
+                entry = index.get(key + (season,)) or new_entries.get(key + (season,))
+                if isinstance(entry, dict):
+                    best_value = entry['best_value']
+                elif entry:
+                    best_value = entry.best_value
                 else:
-                    # For other metrics, higher is usually better
-                    best_value = max(similar_metrics.mapped('value'))
-                    record.is_personal_best = record.value > best_value
-                
-                record.previous_best = best_value
+                    best_value = None
+
+                # First record is automatically a best
+                improved = best_value is None or PersonalBest._is_better(record.metric_type, record.value, best_value)
+                flags[flag] = improved
+                if season == CAREER_SEASON:
+                    flags['previous_best'] = best_value or 0.0
+                if not improved:
+                    continue
+
+                entry_vals = {'best_value': record.value, 'previous_best': best_value or 0.0, 'metric_id': record.id}
+                if isinstance(entry, dict):
+                    entry.update(entry_vals)
+                elif entry:
+                    entry.write(entry_vals)
+                else:
+                    new_entries[key + (season,)] = dict(
+                        entry_vals, athlete_id=key[0], name=key[1], metric_type=key[2], season=season)
+            updates[tuple(sorted(flags.items()))].append(record.id)
+
+        for flags, record_ids in updates.items():
+            self.browse(record_ids).write(dict(flags))
+        if new_entries:
+            PersonalBest.create(list(new_entries.values()))
+        if backdated:
+            self._rebuild_personal_best_index(backdated)
+
+    def _personal_best_replay_query(self, keys=None):
+        """Return the query replaying metrics in chronological order per index key"""
+        where, params = '', []
+        if keys:
+            where = 'WHERE (m.athlete_id, m.name, m.metric_type) IN %s'
+            params = [tuple(keys)]
+        query = f"""
+            WITH scoped AS (
+                SELECT m.id, m.athlete_id, m.name, m.metric_type, m.value, m.date,
+                       %s AS season
+                  FROM sports_performance_metric m {where}
+                 UNION ALL
+                SELECT m.id, m.athlete_id, m.name, m.metric_type, m.value, m.date,
+                       to_char(m.date, 'YYYY') AS season
+                  FROM sports_performance_metric m {where}
+            ), windowed AS (
+                SELECT s.*,
+                       CASE WHEN s.metric_type = 'time' THEN min(s.value) OVER w
+                            ELSE max(s.value) OVER w END AS best_before
+                  FROM scoped s
+                WINDOW w AS (PARTITION BY s.athlete_id, s.name, s.metric_type, s.season
+                             ORDER BY s.date, s.id
+                             ROWS BETWEEN UNBOUNDED PRECEDING AND 1 PRECEDING)
+            ), replay AS (
+                SELECT w.*,
+                       (w.best_before IS NULL
+                        OR (w.metric_type = 'time' AND w.value < w.best_before)
+                        OR (w.metric_type != 'time' AND w.value > w.best_before)) AS improved
+                  FROM windowed w
+            )
+        """
+        return query, [CAREER_SEASON] + params + params
+
+    def _rebuild_personal_best_index(self, keys=None):
+        """Recompute best flags and index entries from history, for the given keys or everything"""
+        keys = {key for key in keys if all(key)} if keys is not None else None
+        if keys is not None and not keys:
+            return
+        self.env.flush_all()
+        cr = self.env.cr
+        replay, params = self._personal_best_replay_query(keys)
+
+        cr.execute(replay + """
+            UPDATE sports_performance_metric m
+               SET is_personal_best = p.improved,
+                   is_seasonal_best = s.improved,
+                   previous_best = COALESCE(p.best_before, 0.0)
+              FROM replay p
+              JOIN replay s ON s.id = p.id AND s.season != p.season
+             WHERE p.id = m.id AND p.season = %s
+        """, params + [CAREER_SEASON])
+
+        if keys:
+            cr.execute("""
+                DELETE FROM sports_personal_best
+                 WHERE (athlete_id, name, metric_type) IN %s
+            """, [tuple(keys)])
+        else:
+            cr.execute("DELETE FROM sports_personal_best")
+
+        # The last improving row of each key holds the current best
+        cr.execute(replay + """
+            INSERT INTO sports_personal_best
+                   (athlete_id, name, metric_type, season, best_value, previous_best, metric_id,
+                    create_uid, create_date, write_uid, write_date)
+            SELECT DISTINCT ON (athlete_id, name, metric_type, season)
+                   athlete_id, name, metric_type, season, value, COALESCE(best_before, 0.0), id,
+                   %s, now() AT TIME ZONE 'UTC', %s, now() AT TIME ZONE 'UTC'
+              FROM replay
+             WHERE improved
+             ORDER BY athlete_id, name, metric_type, season, date DESC, id DESC
+        """, params + [self.env.uid, self.env.uid])
+
+        self.invalidate_model(['is_personal_best', 'is_seasonal_best', 'previous_best'])
+        self.env['sports.personal.best'].invalidate_model()
+
+    @api.model
+    def action_rebuild_personal_bests(self):
+        """Rebuild the whole personal best index from recorded metrics"""
+        self._rebuild_personal_best_index()
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'reload',
+        }
+
+    @api.model
+    def ingest_metrics(self, data, data_format='csv', chunk_size=INGEST_CHUNK_SIZE):
+        """Bulk ingest timing data from a CSV or JSON batch
+
+        Rows reference athletes by their athlete ID code. Returns a report with the
+        number of created metrics and the per-row errors; invalid rows are skipped
+        without aborting the rest of the batch.
+        """
+        rows = self._iter_ingest_rows(data, data_format)
+        Metric = self.with_context(
+            tracking_disable=True,
+            mail_create_nolog=True,
+            mail_notrack=True,
+            skip_personal_best=True,
+        )
+        created = self.browse()
+        errors = []
+
+        chunk = []
+        for row_number, row in rows:
+            chunk.append((row_number, row))
+            if len(chunk) >= chunk_size:
+                created |= Metric._ingest_chunk(chunk, errors)
+                chunk = []
+        if chunk:
+            created |= Metric._ingest_chunk(chunk, errors)
+
+        # Compute personal bests for the whole batch in a single pass
+        created.with_context(tracking_disable=True)._check_personal_best()
+        return {
+            'created': len(created),
+            'metric_ids': created.ids,
+            'errors': errors,
+        }
+
+    @api.model
+    def _iter_ingest_rows(self, data, data_format):
+        """Yield (row number, row dict) pairs from a CSV or JSON payload"""
+        if isinstance(data, bytes):
+            data = data.decode('utf-8-sig')
+        if data_format == 'csv':
+            stream = io.StringIO(data) if isinstance(data, str) else data
+            # Row 1 is the header line
+            yield from enumerate(csv.DictReader(stream), start=2)
+        elif data_format == 'json':
+            rows = json.loads(data) if isinstance(data, str) else data
+            if isinstance(rows, dict):
+                rows = rows.get('metrics', [])
+            if not isinstance(rows, list):
+                raise ValueError("A JSON batch must be a list of metric objects")
+            yield from enumerate(rows, start=1)
+        else:
+            raise ValueError(f"Unsupported ingestion format: {data_format}")
+
+    @api.model
+    def _ingest_chunk(self, chunk, errors):
+        """Validate and create one chunk of ingested rows, collecting errors"""
+        rows = []
+        for row_number, row in chunk:
+            if isinstance(row, dict):
+                rows.append((row_number, row))
             else:
-                # First record is automatically a personal best
-                record.is_personal_best = True
+                errors.append({'row': row_number, 'error': f"Expected an object, got {type(row).__name__}"})
+        codes = {str(row.get('athlete_id') or '').strip() for __, row in rows}
+        codes.discard('')
+        athletes = self.env['sports.athlete'].with_context(active_test=False).search_read(
+            [('athlete_id', 'in', list(codes))], ['athlete_id'])
+        athlete_map = {athlete['athlete_id']: athlete['id'] for athlete in athletes}
+
+        valid = []
+        for row_number, row in rows:
+            try:
+                valid.append((row_number, self._prepare_ingest_vals(row, athlete_map)))
+            except ValueError as e:
+                errors.append({'row': row_number, 'error': str(e)})
+        if not valid:
+            return self.browse()
+
+        created, failures = create_in_savepoints(self, valid)
+        errors += [{'row': row_number, 'error': error} for row_number, error in failures]
+        return created
+
+    @api.model
+    def _prepare_ingest_vals(self, row, athlete_map):
+        """Convert an ingested row into create values, raising ValueError on bad data"""
+        code = str(row.get('athlete_id') or '').strip()
+        if code not in athlete_map:
+            raise ValueError(f"Unknown athlete ID '{code}'")
+        name = str(row.get('name') or '').strip()
+        if not name:
+            raise ValueError("Missing metric name")
+        metric_type = str(row.get('metric_type') or '').strip()
+        if metric_type not in dict(self._fields['metric_type'].selection):
+            raise ValueError(f"Invalid metric type '{metric_type}'")
+        try:
+            value = float(row.get('value'))
+        except (TypeError, ValueError):
+            raise ValueError(f"Invalid value '{row.get('value')}'")
+        date = fields.Date.to_date(row.get('date')) if row.get('date') else fields.Date.context_today(self)
+
+        vals = {
+            'athlete_id': athlete_map[code],
+            'name': name,
+            'metric_type': metric_type,
+            'value': value,
+            'date': date,
+        }
+        for field_name in INGEST_OPTIONAL_FIELDS:
+            if row.get(field_name) not in (None, ''):
+                vals[field_name] = row[field_name]
+        if vals.get('competition_level') and \
+                vals['competition_level'] not in dict(self._fields['competition_level'].selection):
+            raise ValueError(f"Invalid competition level '{vals['competition_level']}'")
+        return vals
 
     def action_verify(self):
         """Verify the performance metric"""
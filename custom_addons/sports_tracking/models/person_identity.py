@@ -0,0 +1,198 @@
+import re
+import unicodedata
+from collections import defaultdict
+
+from odoo import models, fields, api
+
+# Records resolved per batch by the backfill job
+IDENTITY_BACKFILL_BATCH = 5000
+
+
+def normalize_name(name):
+    """Lowercase, strip accents and punctuation, and sort the name parts"""
+    name = unicodedata.normalize('NFKD', name or '').encode('ascii', 'ignore').decode()
+    parts = re.sub(r'[^a-z ]', ' ', name.lower()).split()
+    return ' '.join(sorted(parts)) or False
+
+
+def normalize_phone(phone):
+    """Keep the 9-digit subscriber number so +260 and 0 prefixes match"""
+    digits = re.sub(r'\D', '', phone or '')
+    return digits[-9:] if len(digits) >= 9 else (digits or False)
+
+
+def normalize_national_id(national_id):
+    """Keep the letters and digits of an NRC/national ID number"""
+    return re.sub(r'[^0-9A-Z]', '', (national_id or '').upper()) or False
+
+
+class PersonIdentity(models.Model):
+    _name = 'person.identity'
+    _description = 'Person Identity'
+    _order = 'name'
+
+    name = fields.Char(string='Name', required=True)
+    name_key = fields.Char(string='Normalized Name', index=True)
+    date_of_birth = fields.Date(string='Date of Birth', index=True)
+    national_id_key = fields.Char(string='Normalized National ID', index=True)
+    phone_key = fields.Char(string='Normalized Phone', index=True)
+
+    @api.model
+    def _lookup_keys(self, keys):
+        """Return the matching keys of a keys dict, strongest first
+
+        A phone number is shared within families, so it only matches together
+        with the name.
+        """
+        lookup_keys = []
+        if keys['national_id_key']:
+            lookup_keys.append(('national_id_key', keys['national_id_key']))
+        if keys['name_key'] and keys['date_of_birth']:
+            lookup_keys.append(('name_dob', (keys['name_key'], keys['date_of_birth'])))
+        if keys['name_key'] and keys['phone_key']:
+            lookup_keys.append(('name_phone', (keys['name_key'], keys['phone_key'])))
+        return lookup_keys
+
+    @api.model
+    def _conflicts(self, keys, identity):
+        """Tell whether an identity holds a different national ID or birth date than the keys"""
+        return any(
+            keys[field_name] and identity[field_name] and keys[field_name] != identity[field_name]
+            for field_name in ('national_id_key', 'date_of_birth')
+        )
+
+    @api.model
+    def _match_or_create(self, keys_list):
+        """Return one identity per keys dict
+
+        Records match on national ID, then name and birth date, then name and
+        phone, never against an identity with a different national ID or birth date.
+        """
+        domain = []
+        for field_name in ('national_id_key', 'name_key'):
+            values = {keys[field_name] for keys in keys_list if keys[field_name]}
+            if values:
+                domain = (['|'] + domain if domain else []) + [(field_name, 'in', list(values))]
+        known = defaultdict(list)
+        for identity in (self.search(domain, order='id') if domain else self.browse()):
+            for lookup_key in self._lookup_keys(identity):
+                known[lookup_key].append(identity)
+
+        result = []
+        pending = []
+        for keys in keys_list:
+            lookup_keys = self._lookup_keys(keys)
+            if not lookup_keys:
+                result.append(None)
+                continue
+            identity = next((
+                candidate for key in lookup_keys for candidate in known[key]
+                if not self._conflicts(keys, candidate)
+            ), None)
+            if identity is None:
+                # Records of the same batch sharing a key share the new identity
+                identity = dict(keys)
+                pending.append(identity)
+            else:
+                # Complete the identity with keys it did not know yet
+                missing = {key: value for key, value in keys.items()
+                           if key != 'name' and value and not identity[key]}
+                if missing:
+                    if isinstance(identity, dict):
+                        identity.update(missing)
+                    else:
+                        identity.write(missing)
+            for key in self._lookup_keys(identity):
+                if not any(candidate is identity for candidate in known[key]):
+                    known[key].append(identity)
+            result.append(identity)
+
+        created = self.create(pending) if pending else self.browse()
+        created_map = {id(vals): identity for vals, identity in zip(pending, created)}
+        return [created_map[id(item)] if isinstance(item, dict) else item for item in result]
+
+    def _get_linked_records(self, model_name):
+        """Return the records of a registry linked to these identities"""
+        if model_name not in self.env:
+            # Registry not installed: an empty recordset keeps callers uniform
+            return self.browse()
+        return self.env[model_name].search([('person_identity_id', 'in', self.ids)])
+
+    def get_participations(self):
+        """Return all event participations of these persons"""
+        return self._get_linked_records('event.participant')
+
+    @api.model
+    def _cron_backfill_identities(self):
+        """Link registry records created before identity resolution existed"""
+        for model_name in self.env.registry.descendants(['person.identity.mixin'], '_inherit'):
+            Model = self.env[model_name]
+            if Model._abstract or Model._transient:
+                continue
+            while True:
+                records = Model.with_context(active_test=False).search(
+                    [('person_identity_id', '=', False), ('person_identity_checked', '=', False)],
+                    limit=IDENTITY_BACKFILL_BATCH)
+                if not records:
+                    break
+                records._resolve_person_identities()
+
+
+class PersonIdentityMixin(models.AbstractModel):
+    _name = 'person.identity.mixin'
+    _description = 'Person Identity Mixin'
+
+    # Maps identity keys to the fields holding them on the inheriting model
+    _identity_name_field = 'name'
+    _identity_national_id_field = None
+    _identity_phone_field = 'phone'
+    _identity_birth_date_field = 'date_of_birth'
+
+    person_identity_id = fields.Many2one('person.identity', string='Person', index=True,
+                                         readonly=True, copy=False, ondelete='set null')
+    person_identity_checked = fields.Boolean(string='Identity Checked', readonly=True, copy=False)
+
+    @api.model_create_multi
+    def create(self, vals_list):
+        records = super().create(vals_list)
+        records.filtered(lambda r: not r.person_identity_id)._resolve_person_identities()
+        return records
+
+    def write(self, vals):
+        result = super().write(vals)
+        if set(self._get_identity_source_fields()).intersection(vals) and 'person_identity_id' not in vals:
+            self._resolve_person_identities()
+        return result
+
+    @api.model
+    def _get_identity_source_fields(self):
+        return [field_name for field_name in (
+            self._identity_name_field, self._identity_national_id_field,
+            self._identity_phone_field, self._identity_birth_date_field) if field_name]
+
+    def _get_identity_keys(self):
+        """Return the normalised identity keys of this record"""
+        self.ensure_one()
+        return {
+            'name': self[self._identity_name_field] if self._identity_name_field else False,
+            'name_key': normalize_name(self[self._identity_name_field]) if self._identity_name_field else False,
+            'date_of_birth': self[self._identity_birth_date_field] if self._identity_birth_date_field else False,
+            'national_id_key': normalize_national_id(self[self._identity_national_id_field])
+                if self._identity_national_id_field else False,
+            'phone_key': normalize_phone(self[self._identity_phone_field]) if self._identity_phone_field else False,
+        }
+
+    def _resolve_person_identities(self):
+        """Link these records to their person identity, creating identities as needed"""
+        if not self:
+            return
+        identities = self.env['person.identity']._match_or_create(
+            [record._get_identity_keys() for record in self])
+        groups = defaultdict(list)
+        for record, identity in zip(self, identities):
+            groups[identity.id if identity else False].append(record.id)
+        for identity_id, record_ids in groups.items():
+            self.browse(record_ids).write({
+                'person_identity_id': identity_id,
+                'person_identity_checked': True,
+            })
@@ -0,0 +1,35 @@
+from odoo import models, fields, api
+
+# Season key used for the career (all-time) personal best rows
+CAREER_SEASON = 'all'
+
+
+class SportsPersonalBest(models.Model):
+    _name = 'sports.personal.best'
+    _description = 'Sports Personal Best Index'
+    _order = 'athlete_id, name, metric_type, season'
+
+    athlete_id = fields.Many2one('sports.athlete', string='Athlete', required=True, ondelete='cascade', index=True)
+    name = fields.Char(string='Metric Name', required=True)
+    metric_type = fields.Selection(
+        selection=lambda self: self.env['sports.performance.metric']._fields['metric_type'].selection,
+        string='Metric Type', required=True)
+    season = fields.Char(string='Season', required=True,
+                         help="Year of the season best, or 'all' for the career personal best")
+    best_value = fields.Float(string='Best Value')
+    previous_best = fields.Float(string='Previous Best')
+    metric_id = fields.Many2one('sports.performance.metric', string='Best Performance', ondelete='set null')
+    date = fields.Date(string='Date Achieved', related='metric_id.date')
+
+    _sql_constraints = [
+        ('athlete_metric_season_uniq', 'unique(athlete_id, name, metric_type, season)',
+         'There can only be one best entry per athlete, metric and season.'),
+    ]
+
+    @api.model
+    def _is_better(self, metric_type, value, best_value):
+        """Return True if value beats best_value for the given metric type"""
+        # For time-based metrics, lower is better
+        if metric_type == 'time':
+            return value < best_value
+        return value > best_value
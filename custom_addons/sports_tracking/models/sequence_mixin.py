@@ -0,0 +1,60 @@
+from odoo import models, api
+
+# Placeholder shown on unsaved records before their identifier is assigned
+SEQUENCE_PLACEHOLDER = 'NEW'
+
+
+class BatchSequenceMixin(models.AbstractModel):
+    _name = 'batch.sequence.mixin'
+    _description = 'Batch Sequence Allocation Mixin'
+
+    # ir.sequence code, identifier field, prefix prepended to every number and
+    # value used when the sequence is missing
+    _sequence_code = None
+    _sequence_field = None
+    _sequence_prefix = ''
+    _sequence_fallback = False
+
+    @api.model
+    def _assign_sequence_numbers(self, vals_list):
+        """Give every vals dict without an identifier the next number of a reserved block"""
+        field = self._sequence_field
+        missing = [vals for vals in vals_list if not vals.get(field) or vals[field] == SEQUENCE_PLACEHOLDER]
+        if not missing:
+            return vals_list
+        numbers = self._reserve_sequence_numbers(self._sequence_code, len(missing))
+        for vals, number in zip(missing, numbers):
+            vals[field] = self._sequence_prefix + (number or self._sequence_fallback)
+        return vals_list
+
+    @api.model
+    def _reserve_sequence_numbers(self, code, count):
+        """Reserve count numbers of the sequence with the given code in one statement"""
+        company_id = self.env.company.id
+        sequence = self.env['ir.sequence'].sudo().search(
+            [('code', '=', code), ('company_id', 'in', [company_id, False])],
+            order='company_id', limit=1)
+        if not sequence:
+            return [False] * count
+        if sequence.use_date_range:
+            # Date range sub-sequences keep their own counters
+            return [sequence._next() for __ in range(count)]
+
+        cr = self.env.cr
+        if sequence.implementation == 'standard':
+            # nextval() never blocks concurrent workers
+            cr.execute("SELECT nextval(%s) FROM generate_series(1, %s)",
+                       ['ir_sequence_%03d' % sequence.id, count])
+            numbers = [row[0] for row in cr.fetchall()]
+        else:
+            # The row lock taken by the update serialises no_gap reservations
+            cr.execute("""
+                UPDATE ir_sequence
+                   SET number_next = number_next + number_increment * %s
+                 WHERE id = %s
+             RETURNING number_next - number_increment * %s, number_increment
+            """, [count, sequence.id, count])
+            start, increment = cr.fetchone()
+            numbers = [start + increment * index for index in range(count)]
+            sequence.invalidate_recordset(['number_next'])
+        return [sequence.get_next_char(number) for number in numbers]
@@ -1,6 +1,15 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
 from datetime import datetime, timedelta
 
+# to_char() patterns labelling each trend period
+TREND_PERIOD_LABELS = {
+    'week': 'IYYY-"W"IW',
+    'month': 'YYYY-MM',
+    'quarter': 'YYYY-"Q"Q',
+}
+# Single-row table versioning the cached zone leaderboards
+LEADERBOARD_VERSION_TABLE = 'sports_zone_leaderboard_version'
+
 class SportsAnalytics(models.TransientModel):
     _name = 'sports.analytics'
     _description = 'Sports Analytics and Reporting'
@@ -108,7 +117,7 @@ class SportsAnalytics(models.TransientModel):
             record.avg_performance_improvement = record._calculate_performance_improvement(athletes)
             
             # Find top performing zone
-            record.top_performing_zone = record._get_top_performing_zone()
+            record.top_performing_zone = record._get_top_performing_zone(record.date_from, record.date_to)
 
     def _calculate_performance_improvement(self, athletes):
         """Calculate average performance improvement"""
@@ -128,34 +137,112 @@ class SportsAnalytics(models.TransientModel):
         
         return (total_improvement / improvement_count) if improvement_count > 0 else 0.0
 
-    def _get_top_performing_zone(self):
-        """Get the zone with the most achievements"""
-        zones = self.env['sports.zone'].search([])
-        zone_scores = {}
-        
-        for zone in zones:
-            athletes = self.env['sports.athlete'].search([('zone_id', '=', zone.id)])
-            achievements = self.env['sports.achievement'].search([
-                ('athlete_id', 'in', athletes.ids),
-                ('verified', '=', True)
-            ])
-            
-            # Calculate zone score (Gold=3, Silver=2, Bronze=1)
-            score = 0
-            for achievement in achievements:
-                if achievement.medal_type == 'gold':
-                    score += 3
-                elif achievement.medal_type == 'silver':
-                    score += 2
-                elif achievement.medal_type == 'bronze':
-                    score += 1
-            
-            zone_scores[zone.name] = score
-        
-        if zone_scores:
-            return max(zone_scores, key=zone_scores.get)
+    def _get_top_performing_zone(self, date_from=False, date_to=False):
+        """Get the zone with the highest medal score"""
+        leaderboard = self.get_zone_leaderboard(date_from, date_to)
+        if leaderboard and leaderboard[0]['score'] > 0:
+            return leaderboard[0]['zone_name']
         return ''
 
+    @api.model
+    def get_zone_leaderboard(self, date_from=False, date_to=False):
+        """Get every active zone ranked by medal score (Gold=3, Silver=2, Bronze=1)"""
+        rows = self._zone_leaderboard_rows(
+            fields.Date.to_string(date_from) if date_from else False,
+            fields.Date.to_string(date_to) if date_to else False,
+        )
+        zones = self.env['sports.zone'].browse([row[1] for row in rows])
+        zone_names = dict(zip(zones.ids, zones.mapped('name')))
+        return [{
+            'rank': rank,
+            'zone_id': zone_id,
+            'zone_name': zone_names.get(zone_id, ''),
+            'gold_medals': gold,
+            'silver_medals': silver,
+            'bronze_medals': bronze,
+            'score': score,
+        } for rank, zone_id, gold, silver, bronze, score in rows]
+
+    def init(self):
+        # Cached leaderboards are keyed on this version, bumped in the transactions changing medals
+        self.env.cr.execute(f"""
+            CREATE TABLE IF NOT EXISTS {LEADERBOARD_VERSION_TABLE} (version integer NOT NULL);
+            INSERT INTO {LEADERBOARD_VERSION_TABLE} (version)
+            SELECT 0 WHERE NOT EXISTS (SELECT 1 FROM {LEADERBOARD_VERSION_TABLE})
+        """)
+
+    @api.model
+    def _get_leaderboard_version(self):
+        # Read in the same snapshot as the medals, so a version always matches its data
+        self.env.cr.execute(f"SELECT version FROM {LEADERBOARD_VERSION_TABLE}")
+        return self.env.cr.fetchone()[0]
+
+    @api.model
+    def _invalidate_zone_leaderboard(self):
+        """Bump the leaderboard version in the current transaction
+
+        Other workers keep seeing the old version, and the old medals, until
+        this transaction commits; a rollback undoes the bump with the changes.
+        """
+        cr = self.env.cr
+        if cr.precommit.data.get(LEADERBOARD_VERSION_TABLE):
+            return
+        cr.execute(f"UPDATE {LEADERBOARD_VERSION_TABLE} SET version = version + 1")
+        # Marks this transaction as holding uncommitted medal changes until it ends
+        cr.precommit.data[LEADERBOARD_VERSION_TABLE] = True
+
+    @api.model
+    def _zone_leaderboard_rows(self, date_from, date_to):
+        if self.env.cr.precommit.data.get(LEADERBOARD_VERSION_TABLE):
+            # Uncommitted medal changes must not reach the cache shared by every worker
+            return self._compute_zone_leaderboard_rows(date_from, date_to)
+        return self._zone_leaderboard_rows_cached(self._get_leaderboard_version(), date_from, date_to)
+
+    @api.model
+    @tools.ormcache('version', 'date_from', 'date_to')
+    def _zone_leaderboard_rows_cached(self, version, date_from, date_to):
+        """Cache the zone ranking per leaderboard version and date range"""
+        return self._compute_zone_leaderboard_rows(date_from, date_to)
+
+    @api.model
+    def _compute_zone_leaderboard_rows(self, date_from, date_to):
+        """Rank zones on verified medals in one aggregated query"""
+        date_clause = ''
+        params = []
+        if date_from:
+            date_clause += ' AND ach.date >= %s'
+            params.append(date_from)
+        if date_to:
+            date_clause += ' AND ach.date <= %s'
+            params.append(date_to)
+        self.env['sports.achievement'].flush_model(['athlete_id', 'medal_type', 'verified', 'date'])
+        self.env['sports.athlete'].flush_model(['zone_id'])
+        self.env.cr.execute(f"""
+            WITH scores AS (
+                SELECT z.id AS zone_id, z.name AS zone_name,
+                       COUNT(*) FILTER (WHERE ach.medal_type = 'gold') AS gold,
+                       COUNT(*) FILTER (WHERE ach.medal_type = 'silver') AS silver,
+                       COUNT(*) FILTER (WHERE ach.medal_type = 'bronze') AS bronze,
+                       COALESCE(SUM(CASE ach.medal_type
+                                        WHEN 'gold' THEN 3
+                                        WHEN 'silver' THEN 2
+                                        WHEN 'bronze' THEN 1
+                                    END), 0) AS score
+                  FROM sports_zone z
+             LEFT JOIN sports_athlete a ON a.zone_id = z.id
+             LEFT JOIN sports_achievement ach ON ach.athlete_id = a.id
+                                             AND ach.verified
+                                             AND ach.medal_type IS NOT NULL{date_clause}
+                 WHERE z.active
+              GROUP BY z.id, z.name
+            )
+            SELECT RANK() OVER (ORDER BY score DESC, gold DESC, silver DESC),
+                   zone_id, gold, silver, bronze, score
+              FROM scores
+          ORDER BY score DESC, gold DESC, silver DESC, zone_name
+        """, params)
+        return tuple(tuple(row) for row in self.env.cr.fetchall())
+
     def action_generate_report(self):
         """Generate detailed analytics report"""
         return {
@@ -205,38 +292,66 @@ class SportsAnalytics(models.TransientModel):
         
         return zone_data
 
-    def get_performance_trends(self):
-        """Get performance trends over time"""
-        domain = []
-        if self.date_from and self.date_to:
-            domain.extend([
-                ('date', '>=', self.date_from),
-                ('date', '<=', self.date_to)
-            ])
-        
-        metrics = self.env['sports.performance.metric'].search(domain, order='date')
-        
-        # Group by month
-        monthly_data = {}
-        for metric in metrics:
-            month_key = metric.date.strftime('%Y-%m')
-            if month_key not in monthly_data:
-                monthly_data[month_key] = {
-                    'total_metrics': 0,
-                    'personal_bests': 0,
-                    'avg_improvement': 0.0,
-                    'improvements': []
-                }
-            
-            monthly_data[month_key]['total_metrics'] += 1
-            if metric.is_personal_best:
-                monthly_data[month_key]['personal_bests'] += 1
-            if metric.improvement:
-                monthly_data[month_key]['improvements'].append(metric.improvement)
-        
-        # Calculate averages
-        for month_data in monthly_data.values():
-            if month_data['improvements']:
-                month_data['avg_improvement'] = sum(month_data['improvements']) / len(month_data['improvements'])
-        
-        return monthly_data
\ No newline at end of file
+    def get_performance_trends(self, granularity='month'):
+        """Get performance trends over time using the wizard filters"""
+        self.ensure_one()
+        return self._get_performance_trend_series(
+            date_from=self.date_from,
+            date_to=self.date_to,
+            granularity=granularity,
+            sport_type=self.sport_type if self.sport_type != 'all' else False,
+            zone_id=self.zone_id.id,
+            association_id=self.association_id.id,
+        )
+
+    @api.model
+    def _get_performance_trend_series(self, date_from=False, date_to=False, granularity='month',
+                                      sport_type=False, zone_id=False, association_id=False):
+        """Aggregate performance metrics per week, month or quarter in the database"""
+        if granularity not in TREND_PERIOD_LABELS:
+            raise ValueError(f"Unsupported trend granularity: {granularity}")
+
+        conditions = ['TRUE']
+        params = []
+        if date_from:
+            conditions.append('m.date >= %s')
+            params.append(date_from)
+        if date_to:
+            conditions.append('m.date <= %s')
+            params.append(date_to)
+        if sport_type:
+            conditions.append('a.primary_sport = %s')
+            params.append(sport_type)
+        if zone_id:
+            conditions.append('a.zone_id = %s')
+            params.append(zone_id)
+        if association_id:
+            conditions.append('a.association_id = %s')
+            params.append(association_id)
+
+        self.env['sports.performance.metric'].flush_model(
+            ['athlete_id', 'date', 'metric_type', 'value', 'previous_best', 'is_personal_best'])
+        self.env['sports.athlete'].flush_model(['primary_sport', 'zone_id', 'association_id'])
+        # Improvement mirrors SportsPerformanceMetric._compute_improvement
+        self.env.cr.execute(f"""
+            WITH metrics AS (
+                SELECT date_trunc(%s, m.date)::date AS period_start,
+                       m.is_personal_best,
+                       CASE WHEN m.previous_best != 0 AND m.value != 0 THEN
+                            CASE WHEN m.metric_type = 'time' THEN m.previous_best - m.value
+                                 ELSE m.value - m.previous_best END
+                       END AS improvement
+                  FROM sports_performance_metric m
+                  JOIN sports_athlete a ON a.id = m.athlete_id
+                 WHERE {' AND '.join(conditions)}
+            )
+            SELECT period_start,
+                   to_char(period_start, %s) AS period,
+                   COUNT(*) AS total_metrics,
+                   COUNT(*) FILTER (WHERE is_personal_best) AS personal_bests,
+                   COALESCE(AVG(improvement) FILTER (WHERE improvement != 0), 0.0) AS avg_improvement
+              FROM metrics
+          GROUP BY period_start
+          ORDER BY period_start
+        """, [granularity] + params + [TREND_PERIOD_LABELS[granularity]])
+        return self.env.cr.dictfetchall()
@@ -73,6 +73,14 @@ class SportsAssociation(models.Model):
             record.active_athletes = len(record.athlete_ids.filtered(lambda x: x.athlete_status == 'active'))
             record.total_events = 0  # Will be calculated when event integration is added
 
+    def write(self, vals):
+        result = super().write(vals)
+        if 'zone_id' in vals:
+            self.env['sports.medal.table']._refresh_athletes(self.athlete_ids.ids)
+            # Moves athletes between zones of the cached leaderboard
+            self.env['sports.analytics']._invalidate_zone_leaderboard()
+        return result
+
     def action_register(self):
         """Register the association"""
         self.status = 'registered'
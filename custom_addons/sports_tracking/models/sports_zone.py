@@ -32,6 +32,13 @@ class SportsZone(models.Model):
             # Active programs would need event integration
             record.active_programs = 0
 
+    def write(self, vals):
+        result = super().write(vals)
+        if 'active' in vals:
+            # Archived zones drop out of the cached leaderboard
+            self.env['sports.analytics']._invalidate_zone_leaderboard()
+        return result
+
     def name_get(self):
         result = []
         for record in self:
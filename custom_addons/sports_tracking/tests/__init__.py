@@ -0,0 +1,2 @@
+from . import test_ingest_metrics
+from . import test_personal_best
@@ -0,0 +1,29 @@
+import json
+
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestIngestMetrics(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.athlete = cls.env['sports.athlete'].create({'name': 'Chisomo Phiri'})
+
+    def test_json_rows_that_are_not_objects_are_reported(self):
+        payload = json.dumps([
+            {'athlete_id': self.athlete.athlete_id, 'name': '400m', 'metric_type': 'time',
+             'value': 49.8, 'date': '2024-04-12'},
+            1,
+            'x',
+            {'athlete_id': 'UNKNOWN', 'name': '400m', 'metric_type': 'time', 'value': 50.1},
+        ])
+
+        report = self.env['sports.performance.metric'].ingest_metrics(payload, data_format='json')
+
+        self.assertEqual(report['created'], 1)
+        self.assertEqual([error['row'] for error in report['errors']], [2, 3, 4])
+        metric = self.env['sports.performance.metric'].browse(report['metric_ids'])
+        self.assertEqual(metric.athlete_id, self.athlete)
+        self.assertTrue(metric.is_personal_best)
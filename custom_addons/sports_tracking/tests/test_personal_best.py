@@ -0,0 +1,53 @@
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestPersonalBest(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.athlete = cls.env['sports.athlete'].create({'name': 'Precious Mulenga'})
+        cls.Metric = cls.env['sports.performance.metric']
+
+    def _create_metric(self, date, value):
+        return self.Metric.create({
+            'name': '100m',
+            'athlete_id': self.athlete.id,
+            'metric_type': 'time',
+            'value': value,
+            'date': date,
+        })
+
+    def _snapshot(self, metrics):
+        metrics.invalidate_recordset()
+        best = self.env['sports.personal.best'].search([('athlete_id', '=', self.athlete.id)])
+        return (
+            [(m.date, m.is_personal_best, m.is_seasonal_best, m.previous_best, m.improvement)
+             for m in metrics.sorted(lambda m: (m.date, m.id))],
+            sorted((b.season, b.best_value, b.previous_best, b.metric_id.id) for b in best),
+        )
+
+    def test_incremental_matches_replay(self):
+        metrics = self.Metric
+        # In order, then backdated before the best, then between later non-best rows
+        for date, value in [('2024-03-01', 11.2), ('2024-05-01', 10.9), ('2024-07-01', 11.0),
+                            ('2024-09-01', 11.1), ('2024-02-01', 10.8), ('2024-06-01', 10.7),
+                            ('2023-12-01', 11.5)]:
+            metrics |= self._create_metric(date, value)
+            incremental = self._snapshot(metrics)
+            self.Metric._rebuild_personal_best_index()
+            self.assertEqual(self._snapshot(metrics), incremental, f"after the {date} metric")
+
+    def test_backdated_metric_updates_later_previous_best(self):
+        first = self._create_metric('2024-03-01', 11.2)
+        later = self._create_metric('2024-09-01', 11.4)
+        self.assertFalse(later.is_personal_best)
+        self.assertEqual(later.previous_best, 11.2)
+
+        backdated = self._create_metric('2024-06-01', 10.9)
+
+        self.assertTrue(backdated.is_personal_best)
+        self.assertEqual(backdated.previous_best, 11.2)
+        self.assertEqual(later.previous_best, 10.9)
+        self.assertTrue(first.is_personal_best)
@@ -29,10 +29,15 @@
         'security/youth_security.xml',
         'security/ir.model.access.csv',
         'data/youth_data.xml',
+        'data/ir_cron_data.xml',
         'views/youth_views.xml',
         'views/zone_views.xml',
         'views/application_views.xml',
         'views/other_views.xml',
+        'views/analytics_views.xml',
+        'views/import_views.xml',
+        'views/disbursement_views.xml',
+        'views/budget_views.xml',
         'views/menu.xml',
     ],
     'assets': {
@@ -0,0 +1,35 @@
+from odoo import api, http
+from odoo.http import request, Response
+
+PAYMENT_FILE_FORMATS = {
+    'csv': 'text/csv',
+    'txt': 'text/plain',
+}
+
+
+class DisbursementController(http.Controller):
+
+    @http.route('/youth_tracking/disbursement/<int:batch_id>/<string:file_format>', type='http', auth='user')
+    def download_payment_file(self, batch_id, file_format):
+        """Stream a disbursement batch payment file without building it in memory"""
+        if file_format not in PAYMENT_FILE_FORMATS:
+            return request.not_found()
+        batch = request.env['youth.disbursement.batch'].browse(batch_id).exists()
+        if not batch:
+            return request.not_found()
+        batch.check_access('read')
+
+        registry, uid, context = request.env.registry, request.env.uid, dict(request.env.context)
+
+        def generate():
+            # The request cursor is closed once streaming starts, so read with a cursor of our own
+            with registry.cursor() as cr:
+                env = api.Environment(cr, uid, context)
+                for chunk in env['youth.disbursement.batch'].browse(batch_id)._iter_payment_file(file_format):
+                    yield chunk.encode('utf-8')
+
+        filename = f"{batch.name}.{file_format}"
+        return Response(generate(), direct_passthrough=True, headers=[
+            ('Content-Type', PAYMENT_FILE_FORMATS[file_format]),
+            ('Content-Disposition', f'attachment; filename="{filename}"'),
+        ])
@@ -1,8 +1,11 @@
 from . import youth
 from . import zone
+from . import budget
 from . import organization
 from . import program
 from . import application
 from . import analytics
 from . import program_integration
-from . import program_integration
\ No newline at end of file
+from . import program_integration
+from . import youth_import
+from . import disbursement
@@ -1,3 +1,5 @@
+import hashlib
+
 from odoo import models, fields, api, tools
 from odoo.exceptions import UserError
 
@@ -6,157 +8,389 @@ class YouthAnalytics(models.Model):
     _name = 'youth.analytics'
     _description = 'Youth Analytics & Dashboard'
     _auto = False
+    _order = 'date desc, zone_id'
 
-    # Dashboard Filters
-    zone_id = fields.Many2one('youth.zone', string='Zone Filter')
-    date_from = fields.Date(string='Date From', default=fields.Date.context_today)
-    date_to = fields.Date(string='Date To', default=fields.Date.context_today)
+    # Report Dimensions
+    zone_id = fields.Many2one('youth.zone', string='Zone', readonly=True)
+    date = fields.Date(string='Month', readonly=True)
     
     # Youth Statistics
-    total_youth = fields.Integer(string='Total Youth Registered')
-    active_youth = fields.Integer(string='Active Youth')
-    inactive_youth = fields.Integer(string='Inactive Youth')
-    new_registrations_month = fields.Integer(string='New Registrations This Month')
+    total_youth = fields.Integer(string='Total Youth Registered', readonly=True)
+    active_youth = fields.Integer(string='Active Youth', readonly=True)
+    inactive_youth = fields.Integer(string='Inactive Youth', readonly=True)
+    new_registrations_month = fields.Integer(string='New Registrations This Month', readonly=True)
     
     # Age Demographics
-    youth_18_25 = fields.Integer(string='Youth 18-25')
-    youth_26_30 = fields.Integer(string='Youth 26-30')
-    youth_31_35 = fields.Integer(string='Youth 31-35')
+    youth_18_25 = fields.Integer(string='Youth 18-25', readonly=True)
+    youth_26_30 = fields.Integer(string='Youth 26-30', readonly=True)
+    youth_31_35 = fields.Integer(string='Youth 31-35', readonly=True)
     
     # Gender Distribution
-    male_youth = fields.Integer(string='Male Youth')
-    female_youth = fields.Integer(string='Female Youth')
-    gender_ratio = fields.Float(string='Gender Ratio (F/M)')
+    male_youth = fields.Integer(string='Male Youth', readonly=True)
+    female_youth = fields.Integer(string='Female Youth', readonly=True)
+    gender_ratio = fields.Float(string='Gender Ratio (F/M)', readonly=True, aggregator='avg')
     
     # Education Levels
-    primary_education = fields.Integer(string='Primary Education')
-    secondary_education = fields.Integer(string='Secondary Education')
-    tertiary_education = fields.Integer(string='Tertiary Education')
-    university_education = fields.Integer(string='University Education')
+    primary_education = fields.Integer(string='Primary Education', readonly=True)
+    secondary_education = fields.Integer(string='Secondary Education', readonly=True)
+    tertiary_education = fields.Integer(string='Tertiary Education', readonly=True)
+    university_education = fields.Integer(string='University Education', readonly=True)
     
     # Employment Status
-    employed_youth = fields.Integer(string='Employed Youth')
-    unemployed_youth = fields.Integer(string='Unemployed Youth')
-    student_youth = fields.Integer(string='Student Youth')
-    self_employed_youth = fields.Integer(string='Self-Employed Youth')
+    employed_youth = fields.Integer(string='Employed Youth', readonly=True)
+    unemployed_youth = fields.Integer(string='Unemployed Youth', readonly=True)
+    student_youth = fields.Integer(string='Student Youth', readonly=True)
+    self_employed_youth = fields.Integer(string='Self-Employed Youth', readonly=True)
     
     # Program Statistics
-    total_programs = fields.Integer(string='Total Programs')
-    active_programs = fields.Integer(string='Active Programs')
-    completed_programs = fields.Integer(string='Completed Programs')
-    total_program_participants = fields.Integer(string='Total Program Participants')
+    total_programs = fields.Integer(string='Total Programs', readonly=True)
+    active_programs = fields.Integer(string='Active Programs', readonly=True)
+    completed_programs = fields.Integer(string='Completed Programs', readonly=True)
+    total_program_participants = fields.Integer(string='Total Program Participants', readonly=True)
     
     # Application Statistics
-    total_applications = fields.Integer(string='Total Applications')
-    pending_applications = fields.Integer(string='Pending Applications')
-    approved_applications = fields.Integer(string='Approved Applications')
-    rejected_applications = fields.Integer(string='Rejected Applications')
-    application_success_rate = fields.Float(string='Application Success Rate (%)')
+    total_applications = fields.Integer(string='Total Applications', readonly=True)
+    pending_applications = fields.Integer(string='Pending Applications', readonly=True)
+    approved_applications = fields.Integer(string='Approved Applications', readonly=True)
+    rejected_applications = fields.Integer(string='Rejected Applications', readonly=True)
+    application_success_rate = fields.Float(string='Application Success Rate (%)', readonly=True, aggregator='avg')
     
     # CDF Statistics
-    cdf_applications = fields.Integer(string='CDF Applications')
-    cdf_approved = fields.Integer(string='CDF Approved')
-    cdf_total_amount = fields.Float(string='Total CDF Amount Disbursed')
-    cdf_average_amount = fields.Float(string='Average CDF Amount')
+    cdf_applications = fields.Integer(string='CDF Applications', readonly=True)
+    cdf_approved = fields.Integer(string='CDF Approved', readonly=True)
+    cdf_total_amount = fields.Float(string='Total CDF Amount Disbursed', readonly=True)
+    cdf_average_amount = fields.Float(string='Average CDF Amount', readonly=True, aggregator='avg')
     
     # Financial Statistics
-    total_budget_allocated = fields.Float(string='Total Budget Allocated')
-    total_budget_utilized = fields.Float(string='Total Budget Utilized')
-    budget_utilization_rate = fields.Float(string='Budget Utilization Rate (%)')
+    total_budget_allocated = fields.Float(string='Total Budget Allocated', readonly=True)
+    total_budget_utilized = fields.Float(string='Total Budget Utilized', readonly=True)
+    budget_utilization_rate = fields.Float(string='Budget Utilization Rate (%)', readonly=True, aggregator='avg')
     
     # Organization Statistics
-    total_organizations = fields.Integer(string='Total Youth Organizations')
-    active_organizations = fields.Integer(string='Active Organizations')
-    registered_organizations = fields.Integer(string='Registered Organizations')
+    total_organizations = fields.Integer(string='Total Youth Organizations', readonly=True)
+    active_organizations = fields.Integer(string='Active Organizations', readonly=True)
+    registered_organizations = fields.Integer(string='Registered Organizations', readonly=True)
     
     # Zone Performance
-    top_performing_zone_id = fields.Many2one('youth.zone', string='Top Performing Zone')
-    zone_participation_rate = fields.Float(string='Zone Participation Rate (%)')
+    top_performing_zone_id = fields.Many2one('youth.zone', string='Top Performing Zone', readonly=True)
+    zone_participation_rate = fields.Float(string='Zone Participation Rate (%)', readonly=True, aggregator='avg')
 
-    def init(self):
-        """Initialize the SQL view for analytics"""
-        tools.drop_view_if_exists(self.env.cr, 'youth_analytics')
-        self.env.cr.execute("""
-            CREATE OR REPLACE VIEW youth_analytics AS (
-                SELECT 
-                    row_number() OVER () AS id,
-                    'Youth Analytics' AS name,
-                    CURRENT_DATE AS date,
-                    NULL::INTEGER AS zone_id
+    def _query(self):
+        """Return the SELECT feeding the materialized view: one row per zone and month"""
+        participant_field = self.env['youth.program']._fields['participant_ids']
+        return """
+            WITH youth AS (
+                SELECT
+                    y.zone_id,
+                    date_trunc('month', COALESCE(y.registration_date, y.create_date))::date AS date,
+                    count(*) AS total_youth,
+                    count(*) FILTER (WHERE y.status = 'active') AS active_youth,
+                    count(*) FILTER (WHERE y.status = 'inactive') AS inactive_youth,
+                    count(*) FILTER (
+                        WHERE date_trunc('month', y.registration_date) = date_trunc('month', CURRENT_DATE)
+                    ) AS new_registrations_month,
+                    count(*) FILTER (
+                        WHERE date_part('year', age(CURRENT_DATE, y.date_of_birth)) BETWEEN 18 AND 25
+                    ) AS youth_18_25,
+                    count(*) FILTER (
+                        WHERE date_part('year', age(CURRENT_DATE, y.date_of_birth)) BETWEEN 26 AND 30
+                    ) AS youth_26_30,
+                    count(*) FILTER (
+                        WHERE date_part('year', age(CURRENT_DATE, y.date_of_birth)) BETWEEN 31 AND 35
+                    ) AS youth_31_35,
+                    count(*) FILTER (WHERE y.gender = 'male') AS male_youth,
+                    count(*) FILTER (WHERE y.gender = 'female') AS female_youth,
+                    count(*) FILTER (WHERE y.education_level = 'primary') AS primary_education,
+                    count(*) FILTER (WHERE y.education_level = 'secondary') AS secondary_education,
+                    count(*) FILTER (WHERE y.education_level = 'tertiary') AS tertiary_education,
+                    count(*) FILTER (WHERE y.education_level = 'university') AS university_education,
+                    count(*) FILTER (WHERE y.employment_status = 'employed') AS employed_youth,
+                    count(*) FILTER (WHERE y.employment_status = 'unemployed') AS unemployed_youth,
+                    count(*) FILTER (WHERE y.employment_status = 'student') AS student_youth,
+                    count(*) FILTER (WHERE y.employment_status = 'self_employed') AS self_employed_youth
+                FROM youth_youth y
+                WHERE y.active
+                GROUP BY 1, 2
+            ),
+            participants AS (
+                SELECT r.{program_column} AS program_id, count(*) AS participant_count
+                FROM {participant_relation} r
+                GROUP BY 1
+            ),
+            programs AS (
+                SELECT
+                    p.zone_id,
+                    date_trunc('month', COALESCE(p.start_date, p.create_date))::date AS date,
+                    count(*) AS total_programs,
+                    count(*) FILTER (WHERE p.status = 'active') AS active_programs,
+                    count(*) FILTER (WHERE p.status = 'completed') AS completed_programs,
+                    COALESCE(sum(pa.participant_count), 0) AS total_program_participants
+                FROM youth_program p
+                LEFT JOIN participants pa ON pa.program_id = p.id
+                WHERE p.active
+                GROUP BY 1, 2
+            ),
+            applications AS (
+                SELECT
+                    a.applicant_zone AS zone_id,
+                    date_trunc('month', COALESCE(a.application_date, a.create_date))::date AS date,
+                    count(*) AS total_applications,
+                    count(*) FILTER (
+                        WHERE a.status IN ('submitted', 'under_review', 'committee_review')
+                    ) AS pending_applications,
+                    count(*) FILTER (WHERE a.status = 'approved') AS approved_applications,
+                    count(*) FILTER (WHERE a.status = 'rejected') AS rejected_applications,
+                    count(*) FILTER (WHERE a.application_type = 'cdf') AS cdf_applications,
+                    count(*) FILTER (
+                        WHERE a.application_type = 'cdf' AND a.status IN ('approved', 'disbursed', 'completed')
+                    ) AS cdf_approved,
+                    COALESCE(sum(a.approved_amount) FILTER (
+                        WHERE a.application_type = 'cdf' AND a.status IN ('disbursed', 'completed')
+                    ), 0) AS cdf_total_amount,
+                    COALESCE(avg(a.approved_amount) FILTER (
+                        WHERE a.application_type = 'cdf' AND a.status IN ('approved', 'disbursed', 'completed')
+                    ), 0) AS cdf_average_amount
+                FROM youth_application a
+                WHERE a.active AND a.applicant_zone IS NOT NULL
+                GROUP BY 1, 2
+            ),
+            organizations AS (
+                SELECT
+                    o.zone_id,
+                    date_trunc('month', COALESCE(o.registration_date, o.established_date, o.create_date))::date AS date,
+                    count(*) AS total_organizations,
+                    count(*) FILTER (WHERE o.active) AS active_organizations,
+                    count(*) FILTER (
+                        WHERE o.registration_status IN ('registered', 'certified')
+                    ) AS registered_organizations
+                FROM youth_organization o
+                GROUP BY 1, 2
+            ),
+            budgets AS (
+                -- Allocations are yearly, like the ledger's fiscal periods: booked on
+                -- the first month of the current period
+                SELECT
+                    z.id AS zone_id,
+                    date_trunc('year', CURRENT_DATE)::date AS date,
+                    COALESCE(z.allocated_budget, 0) AS total_budget_allocated
+                FROM youth_zone z
+                WHERE z.active
+            ),
+            ledger AS (
+                SELECT
+                    l.zone_id,
+                    date_trunc('month', l.date)::date AS date,
+                    sum(l.committed_delta) AS total_budget_utilized
+                FROM youth_budget_ledger l
+                GROUP BY 1, 2
+            ),
+            grid AS (
+                SELECT zone_id, date FROM youth
+                UNION SELECT zone_id, date FROM programs
+                UNION SELECT zone_id, date FROM applications
+                UNION SELECT zone_id, date FROM organizations
+                UNION SELECT zone_id, date FROM budgets
+                UNION SELECT zone_id, date FROM ledger
+            ),
+            merged AS (
+                SELECT
+                    g.zone_id,
+                    g.date,
+                    COALESCE(y.total_youth, 0) AS total_youth,
+                    COALESCE(y.active_youth, 0) AS active_youth,
+                    COALESCE(y.inactive_youth, 0) AS inactive_youth,
+                    COALESCE(y.new_registrations_month, 0) AS new_registrations_month,
+                    COALESCE(y.youth_18_25, 0) AS youth_18_25,
+                    COALESCE(y.youth_26_30, 0) AS youth_26_30,
+                    COALESCE(y.youth_31_35, 0) AS youth_31_35,
+                    COALESCE(y.male_youth, 0) AS male_youth,
+                    COALESCE(y.female_youth, 0) AS female_youth,
+                    COALESCE(y.primary_education, 0) AS primary_education,
+                    COALESCE(y.secondary_education, 0) AS secondary_education,
+                    COALESCE(y.tertiary_education, 0) AS tertiary_education,
+                    COALESCE(y.university_education, 0) AS university_education,
+                    COALESCE(y.employed_youth, 0) AS employed_youth,
+                    COALESCE(y.unemployed_youth, 0) AS unemployed_youth,
+                    COALESCE(y.student_youth, 0) AS student_youth,
+                    COALESCE(y.self_employed_youth, 0) AS self_employed_youth,
+                    COALESCE(p.total_programs, 0) AS total_programs,
+                    COALESCE(p.active_programs, 0) AS active_programs,
+                    COALESCE(p.completed_programs, 0) AS completed_programs,
+                    COALESCE(p.total_program_participants, 0) AS total_program_participants,
+                    COALESCE(a.total_applications, 0) AS total_applications,
+                    COALESCE(a.pending_applications, 0) AS pending_applications,
+                    COALESCE(a.approved_applications, 0) AS approved_applications,
+                    COALESCE(a.rejected_applications, 0) AS rejected_applications,
+                    COALESCE(a.cdf_applications, 0) AS cdf_applications,
+                    COALESCE(a.cdf_approved, 0) AS cdf_approved,
+                    COALESCE(a.cdf_total_amount, 0) AS cdf_total_amount,
+                    COALESCE(a.cdf_average_amount, 0) AS cdf_average_amount,
+                    COALESCE(l.total_budget_utilized, 0) AS total_budget_utilized,
+                    COALESCE(b.total_budget_allocated, 0) AS total_budget_allocated,
+                    COALESCE(o.total_organizations, 0) AS total_organizations,
+                    COALESCE(o.active_organizations, 0) AS active_organizations,
+                    COALESCE(o.registered_organizations, 0) AS registered_organizations,
+                    z.allocated_budget AS zone_allocated_budget,
+                    COALESCE(bal.committed_amount, 0) AS zone_committed_amount,
+                    z.youth_population_estimate
+                FROM grid g
+                JOIN youth_zone z ON z.id = g.zone_id
+                LEFT JOIN youth y ON y.zone_id = g.zone_id AND y.date = g.date
+                LEFT JOIN programs p ON p.zone_id = g.zone_id AND p.date = g.date
+                LEFT JOIN applications a ON a.zone_id = g.zone_id AND a.date = g.date
+                LEFT JOIN organizations o ON o.zone_id = g.zone_id AND o.date = g.date
+                LEFT JOIN budgets b ON b.zone_id = g.zone_id AND b.date = g.date
+                LEFT JOIN ledger l ON l.zone_id = g.zone_id AND l.date = g.date
+                LEFT JOIN youth_budget_balance bal
+                       ON bal.zone_id = g.zone_id AND bal.period = to_char(CURRENT_DATE, 'YYYY')
             )
-        """)
+            SELECT
+                row_number() OVER (ORDER BY m.date, m.zone_id) AS id,
+                m.zone_id,
+                m.date,
+                m.total_youth,
+                m.active_youth,
+                m.inactive_youth,
+                m.new_registrations_month,
+                m.youth_18_25,
+                m.youth_26_30,
+                m.youth_31_35,
+                m.male_youth,
+                m.female_youth,
+                CASE WHEN m.male_youth > 0
+                    THEN m.female_youth::float / m.male_youth ELSE 0 END AS gender_ratio,
+                m.primary_education,
+                m.secondary_education,
+                m.tertiary_education,
+                m.university_education,
+                m.employed_youth,
+                m.unemployed_youth,
+                m.student_youth,
+                m.self_employed_youth,
+                m.total_programs,
+                m.active_programs,
+                m.completed_programs,
+                m.total_program_participants,
+                m.total_applications,
+                m.pending_applications,
+                m.approved_applications,
+                m.rejected_applications,
+                CASE WHEN m.total_applications > 0
+                    THEN m.approved_applications * 100.0 / m.total_applications ELSE 0 END AS application_success_rate,
+                m.cdf_applications,
+                m.cdf_approved,
+                m.cdf_total_amount,
+                m.cdf_average_amount,
+                m.total_budget_allocated,
+                m.total_budget_utilized,
+                CASE WHEN m.zone_allocated_budget > 0
+                    THEN m.zone_committed_amount * 100.0 / m.zone_allocated_budget
+                    ELSE 0 END AS budget_utilization_rate,
+                m.total_organizations,
+                m.active_organizations,
+                m.registered_organizations,
+                first_value(m.zone_id) OVER (
+                    PARTITION BY m.date
+                    ORDER BY m.approved_applications DESC, m.total_budget_utilized DESC, m.zone_id
+                ) AS top_performing_zone_id,
+                CASE WHEN m.youth_population_estimate > 0
+                    THEN sum(m.total_youth) OVER (PARTITION BY m.zone_id ORDER BY m.date) * 100.0
+                        / m.youth_population_estimate
+                    ELSE 0 END AS zone_participation_rate
+            FROM merged m
+        """.format(
+            participant_relation=participant_field.relation,
+            program_column=participant_field.column1,
+        )
 
-    def get_youth_statistics(self):
-        """Get real-time youth statistics"""
-        Youth = self.env['youth.youth']
-        domain = []
-        
-        if self.zone_id:
-            domain.append(('zone_id', '=', self.zone_id.id))
-            
-        youth_records = Youth.search(domain)
-        
-        return {
-            'total_youth': len(youth_records),
-            'active_youth': len(youth_records.filtered(lambda y: y.status == 'active')),
-            'male_youth': len(youth_records.filtered(lambda y: y.gender == 'male')),
-            'female_youth': len(youth_records.filtered(lambda y: y.gender == 'female')),
-        }
+    def init(self):
+        """Create the materialized view backing the analytics dashboard, unless it is current"""
+        cr = self.env.cr
+        query = self._query()
+        # The view comment holds a hash of its query, so upgrades only rebuild a changed view
+        signature = hashlib.sha1(query.encode()).hexdigest()
+        cr.execute("""
+            SELECT c.relkind, obj_description(c.oid, 'pg_class')
+              FROM pg_class c
+             WHERE c.relname = %s
+        """, [self._table])
+        row = cr.fetchone()
+        if row and row[0] == 'm' and row[1] == signature:
+            return
+        if row and row[0] == 'v':
+            # Replace the placeholder plain view of earlier versions
+            tools.drop_view_if_exists(cr, self._table)
+        cr.execute("DROP MATERIALIZED VIEW IF EXISTS %s CASCADE" % self._table)
+        cr.execute("CREATE MATERIALIZED VIEW %s AS (%s)" % (self._table, query))
+        cr.execute("COMMENT ON MATERIALIZED VIEW %s IS %%s" % self._table, [signature])
+        # A unique index is required by REFRESH ... CONCURRENTLY
+        cr.execute(
+            "CREATE UNIQUE INDEX %s_zone_date_uniq ON %s (zone_id, date)" % (self._table, self._table)
+        )
+        cr.execute("CREATE INDEX %s_date_idx ON %s (date)" % (self._table, self._table))
 
-    def get_application_statistics(self):
-        """Get real-time application statistics"""
-        Application = self.env['youth.application']
-        domain = []
-        
-        if self.zone_id:
-            domain.append(('applicant_zone', '=', self.zone_id.id))
-        if self.date_from:
-            domain.append(('application_date', '>=', self.date_from))
-        if self.date_to:
-            domain.append(('application_date', '<=', self.date_to))
-            
-        applications = Application.search(domain)
-        
-        total = len(applications)
-        approved = len(applications.filtered(lambda a: a.status == 'approved'))
-        
-        return {
-            'total_applications': total,
-            'approved_applications': approved,
-            'application_success_rate': (approved / total * 100) if total > 0 else 0.0,
-            'cdf_applications': len(applications.filtered(lambda a: a.application_type == 'cdf')),
-        }
+    @api.model
+    def refresh_materialized_view(self):
+        """Refresh the analytics without blocking readers of the dashboard"""
+        self.env.flush_all()
+        self.env.cr.execute("REFRESH MATERIALIZED VIEW CONCURRENTLY %s" % self._table)
+        self.invalidate_model()
+
+    @api.model
+    def _cron_refresh_materialized_view(self):
+        self.refresh_materialized_view()
 
-    def get_program_statistics(self):
-        """Get real-time program statistics"""
-        Program = self.env['youth.program']
+    @api.model
+    def _statistics_domain(self, zone_id=False, date_from=False, date_to=False):
         domain = []
-        
-        if self.zone_id:
-            domain.append(('zone_id', '=', self.zone_id.id))
-            
-        programs = Program.search(domain)
-        
-        return {
-            'total_programs': len(programs),
-            'active_programs': len(programs.filtered(lambda p: p.status == 'active')),
-            'completed_programs': len(programs.filtered(lambda p: p.status == 'completed')),
-        }
+        if zone_id:
+            domain.append(('zone_id', '=', zone_id))
+        if date_from:
+            domain.append(('date', '>=', date_from))
+        if date_to:
+            domain.append(('date', '<=', date_to))
+        return domain
+
+    @api.model
+    def _aggregate_statistics(self, field_names, zone_id=False, date_from=False, date_to=False):
+        """Sum the given columns of the materialized view over the filters"""
+        domain = self._statistics_domain(zone_id, date_from, date_to)
+        aggregates = ['%s:sum' % field_name for field_name in field_names]
+        values = self._read_group(domain, aggregates=aggregates)[0]
+        return {field_name: value or 0 for field_name, value in zip(field_names, values)}
+
+    @api.model
+    def get_youth_statistics(self, zone_id=False, date_from=False, date_to=False):
+        """Get youth statistics from the analytics view"""
+        return self._aggregate_statistics(
+            ['total_youth', 'active_youth', 'male_youth', 'female_youth'],
+            zone_id, date_from, date_to,
+        )
+
+    @api.model
+    def get_application_statistics(self, zone_id=False, date_from=False, date_to=False):
+        """Get application statistics from the analytics view"""
+        stats = self._aggregate_statistics(
+            ['total_applications', 'approved_applications', 'cdf_applications'],
+            zone_id, date_from, date_to,
+        )
+        total = stats['total_applications']
+        stats['application_success_rate'] = (
+            stats['approved_applications'] / total * 100 if total > 0 else 0.0
+        )
+        return stats
+
+    @api.model
+    def get_program_statistics(self, zone_id=False, date_from=False, date_to=False):
+        """Get program statistics from the analytics view"""
+        return self._aggregate_statistics(
+            ['total_programs', 'active_programs', 'completed_programs'],
+            zone_id, date_from, date_to,
+        )
 
     def action_refresh_data(self):
         """Refresh dashboard data"""
-        # Update statistics
-        youth_stats = self.get_youth_statistics()
-        app_stats = self.get_application_statistics()
-        prog_stats = self.get_program_statistics()
-        
-        # Update current record with fresh data
-        self.write({
-            **youth_stats,
-            **app_stats,
-            **prog_stats,
-        })
-        
+        self.refresh_materialized_view()
         return {
             'type': 'ir.actions.client',
             'tag': 'reload',
@@ -211,11 +445,9 @@ class YouthDashboard(models.TransientModel):
             'name': 'Youth Analytics Dashboard',
             'type': 'ir.actions.act_window',
             'res_model': 'youth.analytics',
-            'view_mode': 'form',
-            'context': {
-                'default_zone_id': self.zone_id.id if self.zone_id else False,
-                'default_date_from': self.date_from,
-                'default_date_to': self.date_to,
-            },
+            'view_mode': 'pivot,graph,list',
+            'domain': self.env['youth.analytics']._statistics_domain(
+                self.zone_id.id, self.date_from, self.date_to
+            ),
             'target': 'current',
         }
\ No newline at end of file
@@ -1,11 +1,36 @@
-from odoo import models, fields, api
+import logging
+
+from odoo import models, fields, api, tools
+from odoo.exceptions import UserError
+from odoo.tools import float_is_zero
+
+from .budget import BUDGET_FIELDS, COMMITTED_STATUSES, DISBURSED_STATUSES
+
+_logger = logging.getLogger(__name__)
+
+# Sortable rank of each priority, most urgent first in the review queue
+PRIORITY_RANKS = {'low': 1, 'medium': 2, 'high': 3, 'urgent': 4}
+REVIEW_QUEUE_PAGE_SIZE = 50
+
+# Statuses whose response deadline is watched, and those followed up after approval
+SLA_OPEN_STATUSES = ('submitted', 'under_review', 'committee_review')
+FOLLOW_UP_STATUSES = ('approved', 'disbursed')
+# Applications handled per transaction by the SLA job
+SLA_BATCH_SIZE = 1000
+# Days past the deadline before an overdue application is escalated
+SLA_ESCALATION_DAYS = 7
+# Fields frozen while an application sits in a batch ready for payment
+PAYMENT_LOCKED_FIELDS = {'status', 'approved_amount'}
 
 
 class YouthApplication(models.Model):
     _name = 'youth.application'
     _description = 'Youth Applications (CDF, Training, Empowerment)'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
-    _order = 'application_date desc, priority desc'
+    _inherit = ['batch.sequence.mixin', 'mail.thread', 'mail.activity.mixin']
+    _order = 'application_date desc, priority_rank desc'
+    _sequence_code = 'youth.application'
+    _sequence_field = 'application_id'
+    _sequence_fallback = 'YAPP000'
 
     name = fields.Char(
         string='Application Title',
@@ -67,6 +92,11 @@ class YouthApplication(models.Model):
         ('high', 'High'),
         ('urgent', 'Urgent')
     ], string='Priority', required=True, default='medium', tracking=True)
+    priority_rank = fields.Integer(
+        string='Priority Rank',
+        compute='_compute_priority_rank',
+        store=True
+    )
     
     # Application Details
     description = fields.Text(
@@ -191,6 +221,48 @@ class YouthApplication(models.Model):
         string='Disbursed By',
         help='Person who processed the disbursement'
     )
+    budget_program_id = fields.Many2one(
+        'youth.program',
+        string='Budget Program',
+        help='Youth program whose budget funds this application'
+    )
+    budget_zone_id = fields.Many2one(
+        'youth.zone',
+        string='Budget Zone',
+        readonly=True,
+        copy=False,
+        help='Zone the outstanding commitment of this application is booked against'
+    )
+    budget_booked_program_id = fields.Many2one(
+        'youth.program',
+        string='Booked Program',
+        readonly=True,
+        copy=False,
+        help='Youth program the outstanding commitment of this application is booked against'
+    )
+    budget_period = fields.Char(
+        string='Budget Period',
+        readonly=True,
+        copy=False,
+        help='Fiscal period the commitment of this application is booked in'
+    )
+    budget_committed = fields.Float(
+        string='Committed in Ledger',
+        readonly=True,
+        copy=False
+    )
+    budget_disbursed = fields.Float(
+        string='Disbursed in Ledger',
+        readonly=True,
+        copy=False
+    )
+    disbursement_batch_id = fields.Many2one(
+        'youth.disbursement.batch',
+        string='Disbursement Batch',
+        readonly=True,
+        copy=False,
+        index=True
+    )
     completion_date = fields.Date(
         string='Completion Date',
         help='Date when the application objective was completed'
@@ -211,10 +283,51 @@ class YouthApplication(models.Model):
         help='Date for next follow-up or review'
     )
     
+    sla_overdue_notified = fields.Boolean(
+        string='Overdue Reminder Sent',
+        readonly=True,
+        copy=False
+    )
+    sla_escalated = fields.Boolean(
+        string='Escalated',
+        readonly=True,
+        copy=False,
+        help='The response deadline was missed and the application was escalated to the zone coordinator'
+    )
+    follow_up_notified_date = fields.Date(
+        string='Follow-up Reminder For',
+        readonly=True,
+        copy=False,
+        help='Follow-up date for which a reminder activity was last scheduled'
+    )
+
     # Additional Information
     notes = fields.Text(string='Additional Notes')
     active = fields.Boolean(default=True)
 
+    def init(self):
+        # Serves the reviewer queue: equality on status and reviewer, then the queue order
+        tools.drop_index(self.env.cr, 'youth_application_review_queue_idx', self._table)
+        tools.create_index(
+            self.env.cr, 'youth_application_review_queue_active_idx', self._table,
+            ['status', 'reviewer_id', 'priority_rank DESC', 'application_date', 'id'], where='active')
+        # Partial indexes only cover the open applications the SLA job looks at
+        tools.create_index(
+            self.env.cr, 'youth_application_sla_deadline_idx', self._table, ['deadline_date', 'id'],
+            where=f"active AND deadline_date IS NOT NULL AND sla_escalated IS NOT TRUE "
+                  f"AND status IN {SLA_OPEN_STATUSES}")
+        tools.create_index(
+            self.env.cr, 'youth_application_follow_up_idx', self._table, ['next_follow_up_date', 'id'],
+            where=f"active AND follow_up_required AND next_follow_up_date IS NOT NULL "
+                  f"AND status IN {FOLLOW_UP_STATUSES}")
+        # Runs here rather than in the ledger, once the budget columns exist
+        self.env['youth.budget.ledger']._backfill_commitments()
+
+    @api.depends('priority')
+    def _compute_priority_rank(self):
+        for record in self:
+            record.priority_rank = PRIORITY_RANKS.get(record.priority, 0)
+
     @api.depends('message_attachment_count')
     def _compute_attachments_count(self):
         """Compute number of attachments"""
@@ -225,16 +338,222 @@ class YouthApplication(models.Model):
     def create(self, vals_list):
         # Handle both single dict and list of dicts
         if isinstance(vals_list, dict):
-            # Single record creation
-            if 'application_id' not in vals_list or not vals_list['application_id']:
-                vals_list['application_id'] = self.env['ir.sequence'].next_by_code('youth.application') or 'YAPP000'
-        else:
-            # Batch creation - list of dicts
-            for vals in vals_list:
-                if 'application_id' not in vals or not vals['application_id']:
-                    vals['application_id'] = self.env['ir.sequence'].next_by_code('youth.application') or 'YAPP000'
+            vals_list = [vals_list]
+        self._assign_sequence_numbers(vals_list)
         
-        return super(YouthApplication, self).create(vals_list)
+        records = super(YouthApplication, self).create(vals_list)
+        records.filtered(lambda r: r.status in COMMITTED_STATUSES)._sync_budget_ledger()
+        return records
+
+    def write(self, vals):
+        if 'deadline_date' in vals:
+            # A new deadline restarts the SLA watch
+            vals = dict(vals, sla_overdue_notified=False, sla_escalated=False)
+        if PAYMENT_LOCKED_FIELDS.intersection(vals) and not self.env.context.get('disbursement_batch_payment'):
+            self._check_not_in_payment_batch()
+        result = super().write(vals)
+        if BUDGET_FIELDS.intersection(vals):
+            self._sync_budget_ledger()
+        return result
+
+    def _check_not_in_payment_batch(self):
+        """Refuse changes to applications whose payment file may already be at the bank"""
+        locked = self.filtered(lambda a: a.disbursement_batch_id.state == 'ready')
+        if locked:
+            raise UserError(
+                "These applications are in a disbursement batch ready for payment: "
+                f"{', '.join(locked.mapped('application_id'))}. "
+                "Mark the batch as disbursed or cancel it first.")
+
+    def _sync_budget_ledger(self):
+        """Post the ledger entries bringing each application's booked amounts in line with its status
+
+        Outstanding amounts stay on the zone, program and period they were booked
+        against; changing the budget program moves them to the new program.
+        """
+        Ledger = self.env['youth.budget.ledger']
+        today = fields.Date.context_today(self)
+        entries = []
+        booked = []
+        for application in self:
+            committed = application.approved_amount if application.status in COMMITTED_STATUSES else 0.0
+            disbursed = application.approved_amount if application.status in DISBURSED_STATUSES else 0.0
+            outstanding = not (float_is_zero(application.budget_committed, precision_digits=2)
+                               and float_is_zero(application.budget_disbursed, precision_digits=2))
+            if outstanding:
+                zone = application.budget_zone_id
+                program = application.budget_booked_program_id
+                period = application.budget_period
+            else:
+                zone = application.applicant_zone
+                program = application.budget_program_id
+                period = Ledger._get_period(today)
+            if not zone:
+                # Budgets are held by zones; there is nothing to charge
+                continue
+            entry = {
+                'date': today,
+                'period': period,
+                'zone_id': zone.id,
+                'program_id': program.id,
+                'application_id': application.id,
+            }
+            booked_committed, booked_disbursed = application.budget_committed, application.budget_disbursed
+            if outstanding and program != application.budget_program_id:
+                # Release the old program before committing the new one
+                entries.append(dict(entry, committed_delta=-booked_committed,
+                                    disbursed_delta=-booked_disbursed, entry_type='reversal'))
+                program = application.budget_program_id
+                entry['program_id'] = program.id
+                booked_committed = booked_disbursed = 0.0
+                if not (float_is_zero(committed, precision_digits=2) and float_is_zero(disbursed, precision_digits=2)):
+                    entries.append(dict(entry, committed_delta=committed, disbursed_delta=disbursed,
+                                        entry_type='commitment'))
+            else:
+                committed_delta = committed - booked_committed
+                disbursed_delta = disbursed - booked_disbursed
+                if float_is_zero(committed_delta, precision_digits=2) \
+                        and float_is_zero(disbursed_delta, precision_digits=2):
+                    continue
+                if not float_is_zero(committed_delta, precision_digits=2):
+                    entries.append(dict(entry, committed_delta=committed_delta,
+                                        entry_type='commitment' if committed_delta > 0 else 'reversal'))
+                if not float_is_zero(disbursed_delta, precision_digits=2):
+                    entries.append(dict(entry, disbursed_delta=disbursed_delta,
+                                        entry_type='disbursement' if disbursed_delta > 0 else 'reversal'))
+            booked.append((application.id, zone.id, program.id or None, period, committed, disbursed))
+        if not entries:
+            return
+        Ledger._post(entries)
+        self.env.cr.execute("""
+            UPDATE youth_application app
+               SET budget_zone_id = b.zone_id, budget_booked_program_id = b.program_id,
+                   budget_period = b.period, budget_committed = b.committed, budget_disbursed = b.disbursed
+              FROM unnest(%s::int[], %s::int[], %s::int[], %s::varchar[], %s::float8[], %s::float8[])
+                   AS b(id, zone_id, program_id, period, committed, disbursed)
+             WHERE app.id = b.id
+        """, [[row[index] for row in booked] for index in range(6)])
+        self.browse([row[0] for row in booked]).invalidate_recordset(
+            ['budget_zone_id', 'budget_booked_program_id', 'budget_period', 'budget_committed', 'budget_disbursed'])
+
+    @api.model
+    def _cron_process_sla(self, batch_size=SLA_BATCH_SIZE):
+        """Remind, escalate and schedule follow-ups for applications due today, chunk by chunk"""
+        today = fields.Date.context_today(self)
+        escalation_days = int(self.env['ir.config_parameter'].sudo().get_param(
+            'youth_tracking.sla_escalation_days', SLA_ESCALATION_DAYS))
+        escalation_cutoff = fields.Date.subtract(today, days=escalation_days)
+        cr = self.env.cr
+
+        # Processed applications are flagged, so each query only returns new work
+        while True:
+            self.flush_model()
+            cr.execute("""
+                SELECT id
+                  FROM youth_application
+                 WHERE active AND deadline_date IS NOT NULL AND sla_escalated IS NOT TRUE
+                   AND status IN %s
+                   AND deadline_date < %s
+                   AND (sla_overdue_notified IS NOT TRUE OR deadline_date <= %s)
+              ORDER BY deadline_date, id
+                 LIMIT %s
+            """, [SLA_OPEN_STATUSES, today, escalation_cutoff, batch_size])
+            applications = self.browse([row[0] for row in cr.fetchall()])
+            if not applications:
+                break
+            applications._process_overdue(escalation_cutoff)
+            cr.commit()
+
+        while True:
+            self.flush_model()
+            cr.execute("""
+                SELECT id
+                  FROM youth_application
+                 WHERE active AND follow_up_required AND next_follow_up_date IS NOT NULL
+                   AND status IN %s
+                   AND next_follow_up_date <= %s
+                   AND follow_up_notified_date IS DISTINCT FROM next_follow_up_date
+              ORDER BY next_follow_up_date, id
+                 LIMIT %s
+            """, [FOLLOW_UP_STATUSES, today, batch_size])
+            applications = self.browse([row[0] for row in cr.fetchall()])
+            if not applications:
+                break
+            applications._schedule_follow_ups()
+            cr.commit()
+
+    def _process_overdue(self, escalation_cutoff):
+        """Remind the reviewer of missed deadlines and escalate long-overdue applications"""
+        to_escalate = self.filtered(lambda a: a.deadline_date <= escalation_cutoff)
+        to_remind = self - to_escalate
+        activities = [
+            application._prepare_sla_activity(
+                application.reviewer_id or application.applicant_zone.coordinator_id,
+                "Response deadline passed",
+                f"The response deadline of {application.deadline_date} has passed.")
+            for application in to_remind
+        ] + [
+            application._prepare_sla_activity(
+                application.applicant_zone.coordinator_id or application.reviewer_id,
+                "Escalated: response deadline overdue",
+                f"No decision was taken within {(fields.Date.context_today(self) - application.deadline_date).days} "
+                f"days of the response deadline ({application.deadline_date}).")
+            for application in to_escalate
+        ]
+        self._create_sla_activities(activities)
+        to_remind.write({'sla_overdue_notified': True})
+        if to_escalate:
+            to_escalate.with_context(mail_notrack=True).write({
+                'sla_overdue_notified': True,
+                'sla_escalated': True,
+                'priority': 'urgent',
+            })
+            to_escalate._message_log_batch(
+                bodies={application.id: f"Application Escalated: response deadline of "
+                                        f"{application.deadline_date} missed, application escalated to "
+                                        f"the zone coordinator and marked urgent."
+                        for application in to_escalate})
+
+    def _schedule_follow_ups(self):
+        """Schedule a follow-up activity for applications whose follow-up date has come"""
+        self._create_sla_activities([
+            application._prepare_sla_activity(
+                application.reviewer_id or application.applicant_zone.coordinator_id,
+                "Application follow-up",
+                f"Follow up on the progress of {application.youth_id.name}.",
+                application.next_follow_up_date)
+            for application in self
+        ])
+        self.env.cr.execute("""
+            UPDATE youth_application
+               SET follow_up_notified_date = next_follow_up_date
+             WHERE id IN %s
+        """, [tuple(self.ids)])
+        self.invalidate_recordset(['follow_up_notified_date'])
+
+    def _prepare_sla_activity(self, user, summary, note, date_deadline=False):
+        self.ensure_one()
+        vals = {
+            'res_model_id': self.env['ir.model']._get_id(self._name),
+            'res_id': self.id,
+            'summary': summary,
+            'note': note,
+            'date_deadline': date_deadline or fields.Date.context_today(self),
+        }
+        if user:
+            vals['user_id'] = user.id
+        return vals
+
+    @api.model
+    def _create_sla_activities(self, vals_list):
+        """Create the SLA activities of a chunk in one call, without per-activity assignment emails"""
+        if not vals_list:
+            return
+        activity_type = self.env.ref('mail.mail_activity_data_todo', raise_if_not_found=False)
+        if activity_type:
+            for vals in vals_list:
+                vals['activity_type_id'] = activity_type.id
+        self.env['mail.activity'].with_context(mail_activity_quick_update=True).create(vals_list)
 
     def action_submit_application(self):
         """Submit application for review"""
@@ -255,6 +574,67 @@ class YouthApplication(models.Model):
                 subject="Review Started"
             )
 
+    @api.model
+    def get_review_queue(self, status='submitted', reviewer_id=False, cursor=None, limit=REVIEW_QUEUE_PAGE_SIZE):
+        """Return the next page of a reviewer queue, most urgent and oldest first
+
+        Pages are keyset-paginated: pass back the returned cursor to fetch the
+        following page, so every page costs the same whatever the backlog size.
+        An empty reviewer_id lists the unassigned applications.
+        """
+        self.flush_model(['status', 'reviewer_id', 'priority_rank', 'application_date', 'active'])
+        conditions = ['active', 'status = %s', 'reviewer_id = %s' if reviewer_id else 'reviewer_id IS NULL']
+        params = [status] + ([reviewer_id] if reviewer_id else [])
+        if cursor:
+            rank, application_date, last_id = cursor
+            conditions.append('(priority_rank < %s OR (priority_rank = %s AND (application_date, id) > (%s, %s)))')
+            params += [rank, rank, application_date, last_id]
+        self.env.cr.execute(f"""
+            SELECT id, priority_rank, application_date
+              FROM youth_application
+             WHERE {' AND '.join(conditions)}
+          ORDER BY priority_rank DESC, application_date, id
+             LIMIT %s
+        """, params + [limit])
+        rows = self.env.cr.fetchall()
+        next_cursor = False
+        if len(rows) == limit:
+            last_id, rank, application_date = rows[-1]
+            next_cursor = [rank, fields.Date.to_string(application_date), last_id]
+        return {'ids': [row[0] for row in rows], 'cursor': next_cursor}
+
+    @api.model
+    def claim_review_items(self, limit=10):
+        """Assign the next unassigned submitted applications to the current user
+
+        Rows locked by another reviewer's claim are skipped rather than waited
+        for, so concurrent reviewers never receive the same application.
+        """
+        self.flush_model(['status', 'reviewer_id', 'priority_rank', 'application_date', 'active'])
+        # The row locks are held until commit, so the write below cannot race
+        self.env.cr.execute("""
+            SELECT id
+              FROM youth_application
+             WHERE active AND status = 'submitted' AND reviewer_id IS NULL
+          ORDER BY priority_rank DESC, application_date, id
+             LIMIT %s
+               FOR UPDATE SKIP LOCKED
+        """, [limit])
+        claimed = self.browse([row[0] for row in self.env.cr.fetchall()])
+        if not claimed:
+            return claimed
+        claimed.write({'reviewer_id': self.env.uid, 'status': 'under_review'})
+        claimed._message_log_batch(
+            bodies={record.id: f"Review Started: application review started by {self.env.user.name}"
+                    for record in claimed})
+        return claimed.sorted(lambda r: (-r.priority_rank, r.application_date, r.id))
+
+    @api.model
+    def action_claim_review_items(self):
+        """Claim the next applications and open the reviewer's queue"""
+        self.claim_review_items()
+        return self.env['ir.actions.act_window']._for_xml_id('youth_tracking.action_application_review_queue')
+
     def action_pydc_approve(self):
         """PYDC approval"""
         for record in self:
@@ -268,74 +648,145 @@ class YouthApplication(models.Model):
             )
 
     def action_committee_approve(self):
-        """Committee approval"""
-        try:
-            for record in self:
-                record.committee_approval = True
-                record.committee_approver_id = self.env.user.id
-                record.committee_approval_date = fields.Date.context_today(self)
-                record.status = 'approved'
-                
-                # Add youth as participant to the program if a program is selected
-                if record.program_id and record.youth_id:
-                    # Check if youth is already a participant
-                    existing_participant = self.env['event.participant'].search([
-                        ('program_id', '=', record.program_id.id),
-                        ('name', '=', record.youth_id.name)
-                    ], limit=1)
-                    
-                    if not existing_participant:
-                        # Create participant record
-                        self.env['event.participant'].create({
-                            'name': record.youth_id.name,
-                            'program_id': record.program_id.id,
-                            'gender': record.youth_id.gender,
-                            'contact': record.youth_id.phone,
-                            'address': record.youth_id.address,
-                        })
-                        
-                        record.message_post(
-                            body=f"Committee approval granted by {self.env.user.name}. Youth {record.youth_id.name} has been added as a participant to program '{record.program_id.name}'.",
-                            subject="Committee Approved & Participant Added"
-                        )
-                    else:
-                        record.message_post(
-                            body=f"Committee approval granted by {self.env.user.name}. Youth {record.youth_id.name} is already a participant in program '{record.program_id.name}'.",
-                            subject="Committee Approved"
-                        )
-                else:
-                    record.message_post(
-                        body=f"Committee approval granted by {self.env.user.name}",
-                        subject="Committee Approved"
-                    )
-                
-            # Return a notification to confirm the action worked
-            return {
-                'type': 'ir.actions.client',
-                'tag': 'display_notification',
-                'params': {
-                    'title': 'Success!',
-                    'message': 'Application has been approved by committee.',
-                    'type': 'success',
-                    'sticky': False,
-                }
-            }
-        except Exception as e:
-            # Log the error and show a notification
-            import logging
-            _logger = logging.getLogger(__name__)
-            _logger.error(f"Error in committee approval: {str(e)}")
-            
+        """Committee approval, applied to the whole selection at once"""
+        approved, failures = self._committee_approve_batch()
+        if failures:
+            details = '\n'.join(f"{application.application_id}: {reason}" for application, reason in failures)
+            _logger.warning("Committee approval failed for %s application(s):\n%s", len(failures), details)
             return {
                 'type': 'ir.actions.client',
                 'tag': 'display_notification',
                 'params': {
-                    'title': 'Error!',
-                    'message': f'Error occurred during approval: {str(e)}',
-                    'type': 'danger',
+                    'title': 'Approval Incomplete',
+                    'message': f'{len(approved)} application(s) approved, {len(failures)} failed:\n{details}',
+                    'type': 'warning' if approved else 'danger',
                     'sticky': True,
                 }
             }
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Success!',
+                'message': f'{len(approved)} application(s) approved by committee.',
+                'type': 'success',
+                'sticky': False,
+            }
+        }
+
+    def _committee_approve_batch(self):
+        """Approve the applications awaiting committee review and enrol their applicants
+
+        Returns the approved applications and a list of (application, reason) failures.
+        """
+        status_labels = dict(self._fields['status']._description_selection(self.env))
+        failures = [
+            (application, f"status is {status_labels.get(application.status)}, not Committee Review")
+            for application in self if application.status != 'committee_review'
+        ]
+        candidates = self - self.browse([application.id for application, __ in failures])
+        added, participant_failures = candidates._create_program_participants()
+        failures += participant_failures
+        approved = candidates - self.browse([application.id for application, __ in participant_failures])
+        if not approved:
+            return approved, failures
+
+        # The approver and date fields record the decision on each application;
+        # the sitting itself is summarised by one digest per program
+        approved.with_context(mail_notrack=True).write({
+            'committee_approval': True,
+            'committee_approver_id': self.env.user.id,
+            'committee_approval_date': fields.Date.context_today(self),
+            'status': 'approved',
+        })
+        approved._log_committee_digest(added)
+        return approved, failures
+
+    def _log_committee_digest(self, added):
+        """Log one committee digest on each program of these approved applications"""
+        bodies = {}
+        for program, applications in self.grouped('program_id').items():
+            if not program:
+                continue
+            entries = [
+                f"{application.name} - {application.youth_id.name} "
+                f"({'added as participant' if application.id in added else 'already a participant'})"
+                for application in applications
+            ]
+            bodies[program.id] = (
+                f"Committee Approved: {len(entries)} application(s) approved by {self.env.user.name}: "
+                + "; ".join(entries)
+            )
+        if bodies:
+            self.env['event.program'].browse(bodies)._message_log_batch(bodies=bodies)
+
+    def _create_program_participants(self):
+        """Create the missing program participants of these applications in one batch
+
+        Returns the ids of applications whose applicant was added and a list of
+        (application, reason) failures.
+        """
+        applications = self.filtered(lambda a: a.program_id and a.youth_id)
+        if not applications:
+            return set(), []
+        youths = applications.youth_id
+        youths.filtered(lambda y: not y.person_identity_id and not y.person_identity_checked)._resolve_person_identities()
+
+        # One query for every participant already enrolled in the programs concerned
+        identities = youths.person_identity_id
+        names = youths.filtered(lambda y: not y.person_identity_id).mapped('name')
+        person_domain = [('person_identity_id', 'in', identities.ids)] if identities else []
+        if names:
+            person_domain = (['|'] + person_domain if person_domain else []) + [('name', 'in', names)]
+        existing = set()
+        participants = self.env['event.participant'].search_read(
+            [('program_id', 'in', applications.program_id.ids)] + person_domain,
+            ['program_id', 'person_identity_id', 'name'])
+        for participant in participants:
+            program_id = participant['program_id'][0]
+            if participant['person_identity_id']:
+                existing.add((program_id, participant['person_identity_id'][0]))
+            existing.add((program_id, participant['name']))
+
+        # Applicants applying twice to the same program are enrolled once
+        pending = {}
+        for application in applications:
+            youth = application.youth_id
+            key = (application.program_id.id, youth.person_identity_id.id or youth.name)
+            if key in existing:
+                continue
+            if key not in pending:
+                pending[key] = ({
+                    'name': youth.name,
+                    'program_id': application.program_id.id,
+                    'gender': youth.gender,
+                    'contact': youth.phone,
+                    'address': youth.address,
+                    'person_identity_id': youth.person_identity_id.id,
+                }, [])
+            pending[key][1].append(application)
+        if not pending:
+            return set(), []
+
+        Participant = self.env['event.participant']
+        try:
+            with self.env.cr.savepoint():
+                Participant.create([vals for vals, __ in pending.values()])
+            return {application.id for __, group in pending.values() for application in group}, []
+        except Exception:
+            self.env.invalidate_all()
+
+        # Isolate the applicants whose participant record is rejected
+        added, failures = set(), []
+        for vals, group in pending.values():
+            try:
+                with self.env.cr.savepoint():
+                    Participant.create(vals)
+                added.update(application.id for application in group)
+            except Exception as e:
+                self.env.invalidate_all()
+                failures += [(application, f"could not add participant: {e}") for application in group]
+        return added, failures
 
     def action_director_approve(self):
         """Director approval"""
@@ -374,15 +825,20 @@ class YouthApplication(models.Model):
 
     def action_disburse_funds(self):
         """Disburse approved funds"""
-        for record in self:
-            if record.status == 'approved':
-                record.status = 'disbursed'
-                record.disbursement_date = fields.Date.context_today(self)
-                record.disbursed_by_id = self.env.user.id
-                record.message_post(
-                    body=f"Funds disbursed by {self.env.user.name}. Amount: {record.approved_amount}",
-                    subject="Funds Disbursed"
-                )
+        applications = self.filtered(lambda r: r.status == 'approved')
+        if not applications:
+            return
+        # Paid through their batch, never on their own
+        applications._check_not_in_payment_batch()
+        applications.with_context(mail_notrack=True).write({
+            'status': 'disbursed',
+            'disbursement_date': fields.Date.context_today(self),
+            'disbursed_by_id': self.env.user.id,
+        })
+        applications._message_log_batch(
+            bodies={record.id: f"Funds Disbursed: funds disbursed by {self.env.user.name}. "
+                               f"Amount: {record.approved_amount}"
+                    for record in applications})
 
     def action_mark_completed(self):
         """Mark application as completed"""
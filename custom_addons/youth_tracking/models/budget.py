@@ -0,0 +1,234 @@
+from collections import defaultdict
+
+from odoo import models, fields, api
+from odoo.exceptions import UserError
+from odoo.tools import float_compare, float_is_zero
+
+# Application statuses holding a budget commitment, and those already paid out
+COMMITTED_STATUSES = ('approved', 'disbursed', 'completed')
+DISBURSED_STATUSES = ('disbursed', 'completed')
+# Application fields whose changes move budget
+BUDGET_FIELDS = {'status', 'approved_amount', 'budget_program_id'}
+
+
+class YouthBudgetLedger(models.Model):
+    _name = 'youth.budget.ledger'
+    _description = 'Youth Budget Ledger'
+    _order = 'date desc, id desc'
+
+    date = fields.Date(string='Date', required=True, default=fields.Date.context_today, index=True)
+    period = fields.Char(string='Fiscal Period', required=True, index=True)
+    zone_id = fields.Many2one('youth.zone', string='Zone', required=True, index=True, ondelete='restrict')
+    program_id = fields.Many2one('youth.program', string='Program', index=True, ondelete='restrict')
+    application_id = fields.Many2one('youth.application', string='Application', index=True, ondelete='restrict')
+    entry_type = fields.Selection([
+        ('commitment', 'Commitment'),
+        ('disbursement', 'Disbursement'),
+        ('reversal', 'Reversal')
+    ], string='Entry Type', required=True)
+    committed_delta = fields.Float(string='Committed')
+    disbursed_delta = fields.Float(string='Disbursed')
+    user_id = fields.Many2one('res.users', string='Posted By', default=lambda self: self.env.user)
+
+    @api.model
+    def _backfill_commitments(self):
+        """Commit the applications approved before the ledger existed"""
+        cr = self.env.cr
+        # Applications booked before the zone and program were kept take them from their last entry
+        cr.execute("""
+            UPDATE youth_application app
+               SET budget_zone_id = last.zone_id, budget_booked_program_id = last.program_id
+              FROM (SELECT DISTINCT ON (application_id) application_id, zone_id, program_id
+                      FROM youth_budget_ledger
+                     WHERE application_id IS NOT NULL
+                  ORDER BY application_id, id DESC) last
+             WHERE app.id = last.application_id AND app.budget_zone_id IS NULL
+        """)
+        cr.execute("""
+            WITH missing AS (
+                SELECT id, applicant_zone, budget_program_id, approved_amount, status,
+                       COALESCE(final_approval_date, committee_approval_date, application_date) AS date
+                  FROM youth_application
+                 WHERE status IN %s AND applicant_zone IS NOT NULL
+                   AND COALESCE(approved_amount, 0) > 0 AND COALESCE(budget_committed, 0) = 0
+            ),
+            entries AS (
+                INSERT INTO youth_budget_ledger
+                       (date, period, zone_id, program_id, application_id, entry_type,
+                        committed_delta, disbursed_delta, create_uid, create_date, write_uid, write_date)
+                SELECT date, to_char(date, 'YYYY'), applicant_zone, budget_program_id, id, 'commitment',
+                       approved_amount, CASE WHEN status IN %s THEN approved_amount ELSE 0 END,
+                       %s, now() AT TIME ZONE 'UTC', %s, now() AT TIME ZONE 'UTC'
+                  FROM missing
+             RETURNING application_id, zone_id, program_id, period, committed_delta, disbursed_delta
+            )
+            UPDATE youth_application app
+               SET budget_zone_id = entries.zone_id,
+                   budget_booked_program_id = entries.program_id,
+                   budget_period = entries.period,
+                   budget_committed = entries.committed_delta,
+                   budget_disbursed = entries.disbursed_delta
+              FROM entries
+             WHERE app.id = entries.application_id
+        """, [COMMITTED_STATUSES, DISBURSED_STATUSES, self.env.uid, self.env.uid])
+        if cr.rowcount:
+            self._rebuild_balances()
+
+    def write(self, vals):
+        raise UserError("Budget ledger entries cannot be changed; post a reversal instead.")
+
+    def unlink(self):
+        raise UserError("Budget ledger entries cannot be deleted; post a reversal instead.")
+
+    @api.model
+    def _get_period(self, date):
+        """Return the fiscal period of a date"""
+        return str(date.year)
+
+    @api.model
+    def _post(self, vals_list):
+        """Append entries and move the zone and program running balances by the same amounts
+
+        Commitments pushing a zone or program past its allocation are refused
+        unless the context allows over-commitment.
+        """
+        # No group may create entries or edit balances: they only move through here
+        entries = self.sudo().create(vals_list)
+        zone_deltas = defaultdict(lambda: [0.0, 0.0])
+        program_deltas = defaultdict(lambda: [0.0, 0.0])
+        for vals in vals_list:
+            committed, disbursed = vals.get('committed_delta', 0.0), vals.get('disbursed_delta', 0.0)
+            zone_delta = zone_deltas[(vals['zone_id'], vals['period'])]
+            zone_delta[0] += committed
+            zone_delta[1] += disbursed
+            if vals.get('program_id'):
+                program_delta = program_deltas[vals['program_id']]
+                program_delta[0] += committed
+                program_delta[1] += disbursed
+
+        zone_rows = self.env['youth.budget.balance']._apply_deltas(zone_deltas)
+        program_rows = self.env['youth.program']._apply_budget_deltas(program_deltas)
+        if self.env.context.get('budget_allow_overcommit'):
+            return entries
+
+        over = []
+        zones = self.env['youth.zone'].browse([zone_id for zone_id, __, __ in zone_rows])
+        for (zone_id, period, committed), zone in zip(zone_rows, zones):
+            allocated = zone.allocated_budget
+            if zone_deltas[(zone_id, period)][0] > 0 and allocated > 0 \
+                    and float_compare(committed, allocated, precision_digits=2) > 0:
+                over.append(f"zone {zone.name} ({period}): {committed:,.2f} of {allocated:,.2f}")
+        for program_id, name, committed, budget in program_rows:
+            if program_deltas[program_id][0] > 0 and budget > 0 \
+                    and float_compare(committed, budget, precision_digits=2) > 0:
+                over.append(f"program {name}: {committed:,.2f} of {budget:,.2f}")
+        if over:
+            raise UserError(f"This commitment exceeds the available budget of {'; '.join(over)}.")
+        return entries
+
+    @api.model
+    def _rebuild_balances(self):
+        """Recompute every running balance from the ledger"""
+        self.flush_model()
+        cr = self.env.cr
+        cr.execute("DELETE FROM youth_budget_balance")
+        cr.execute("""
+            INSERT INTO youth_budget_balance
+                   (zone_id, period, committed_amount, disbursed_amount,
+                    create_uid, create_date, write_uid, write_date)
+            SELECT zone_id, period, sum(committed_delta), sum(disbursed_delta),
+                   %s, now() AT TIME ZONE 'UTC', %s, now() AT TIME ZONE 'UTC'
+              FROM youth_budget_ledger
+          GROUP BY zone_id, period
+        """, [self.env.uid, self.env.uid])
+        cr.execute("""
+            UPDATE youth_program p
+               SET budget_committed = COALESCE(totals.committed, 0),
+                   budget_disbursed = COALESCE(totals.disbursed, 0)
+              FROM youth_program p2
+         LEFT JOIN (SELECT program_id, sum(committed_delta) AS committed, sum(disbursed_delta) AS disbursed
+                      FROM youth_budget_ledger
+                     WHERE program_id IS NOT NULL
+                  GROUP BY program_id) totals ON totals.program_id = p2.id
+             WHERE p.id = p2.id
+        """)
+        self.env['youth.budget.balance'].invalidate_model()
+        self.env['youth.program'].invalidate_model(['budget_committed', 'budget_disbursed'])
+
+
+class YouthBudgetBalance(models.Model):
+    _name = 'youth.budget.balance'
+    _description = 'Youth Budget Balance'
+    _order = 'period desc, zone_id'
+
+    zone_id = fields.Many2one('youth.zone', string='Zone', required=True, readonly=True, ondelete='cascade')
+    period = fields.Char(string='Fiscal Period', required=True, readonly=True)
+    committed_amount = fields.Float(string='Committed', readonly=True)
+    disbursed_amount = fields.Float(string='Disbursed', readonly=True)
+    allocated_budget = fields.Float(related='zone_id.allocated_budget', string='Allocated Budget')
+    remaining_budget = fields.Float(string='Remaining Budget', compute='_compute_remaining_budget')
+    utilization_rate = fields.Float(string='Utilization (%)', compute='_compute_remaining_budget')
+
+    _sql_constraints = [
+        ('zone_period_uniq', 'unique(zone_id, period)',
+         'There can only be one budget balance per zone and fiscal period.'),
+    ]
+
+    @api.depends('committed_amount', 'allocated_budget')
+    def _compute_remaining_budget(self):
+        for record in self:
+            record.remaining_budget = record.allocated_budget - record.committed_amount
+            record.utilization_rate = (
+                record.committed_amount / record.allocated_budget * 100
+                if record.allocated_budget > 0 else 0.0
+            )
+
+    @api.model
+    def _apply_deltas(self, deltas):
+        """Add {(zone_id, period): [committed, disbursed]} to the balances in one upsert
+
+        Returns (zone_id, period, committed_amount) for every balance touched.
+        """
+        deltas = {key: delta for key, delta in deltas.items()
+                  if not (float_is_zero(delta[0], 2) and float_is_zero(delta[1], 2))}
+        if not deltas:
+            return []
+        self.flush_model()
+        keys = list(deltas)
+        # The upsert locks each balance row, so concurrent postings add up
+        self.env.cr.execute("""
+            INSERT INTO youth_budget_balance AS b
+                   (zone_id, period, committed_amount, disbursed_amount,
+                    create_uid, create_date, write_uid, write_date)
+            SELECT d.zone_id, d.period, d.committed, d.disbursed,
+                   %(uid)s, now() AT TIME ZONE 'UTC', %(uid)s, now() AT TIME ZONE 'UTC'
+              FROM unnest(%(zones)s::int[], %(periods)s::varchar[], %(committed)s::float8[], %(disbursed)s::float8[])
+                   AS d(zone_id, period, committed, disbursed)
+            ON CONFLICT (zone_id, period) DO UPDATE
+               SET committed_amount = b.committed_amount + EXCLUDED.committed_amount,
+                   disbursed_amount = b.disbursed_amount + EXCLUDED.disbursed_amount,
+                   write_uid = EXCLUDED.write_uid,
+                   write_date = EXCLUDED.write_date
+         RETURNING b.zone_id, b.period, b.committed_amount
+        """, {
+            'uid': self.env.uid,
+            'zones': [zone_id for zone_id, __ in keys],
+            'periods': [period for __, period in keys],
+            'committed': [deltas[key][0] for key in keys],
+            'disbursed': [deltas[key][1] for key in keys],
+        })
+        rows = self.env.cr.fetchall()
+        self.invalidate_model()
+        return rows
+
+    @api.model
+    def _get_balances(self, zone_ids, period):
+        """Return {zone_id: (committed, disbursed)} for the zones in one period"""
+        return {
+            zone.id: (committed, disbursed)
+            for zone, committed, disbursed in self._read_group(
+                [('zone_id', 'in', zone_ids), ('period', '=', period)],
+                groupby=['zone_id'],
+                aggregates=['committed_amount:sum', 'disbursed_amount:sum'],
+            )
+        }
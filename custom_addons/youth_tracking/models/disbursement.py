@@ -0,0 +1,216 @@
+import csv
+import io
+
+from odoo import models, fields, api
+from odoo.exceptions import UserError
+
+# Applications read per query while writing a payment file
+PAYMENT_FILE_CHUNK_SIZE = 5000
+# Fixed-width detail layout: (column, width, alignment)
+FIXED_WIDTH_LAYOUT = [
+    ('record_type', 1, '<'),
+    ('reference', 20, '<'),
+    ('application', 15, '<'),
+    ('beneficiary', 40, '<'),
+    ('nrc', 15, '<'),
+    ('phone', 15, '<'),
+    ('currency', 3, '<'),
+    ('amount', 15, '>'),
+]
+PAYMENT_CSV_HEADER = ['Batch', 'Application ID', 'Beneficiary', 'NRC Number', 'Phone', 'Currency', 'Amount']
+
+
+class YouthDisbursementBatch(models.Model):
+    _name = 'youth.disbursement.batch'
+    _description = 'Youth Disbursement Batch'
+    _inherit = ['batch.sequence.mixin', 'mail.thread']
+    _order = 'create_date desc, id desc'
+    _sequence_code = 'youth.disbursement.batch'
+    _sequence_field = 'name'
+    _sequence_fallback = 'YDISB000'
+
+    name = fields.Char(string='Batch Reference', required=True, copy=False, readonly=True, default='NEW')
+    zone_id = fields.Many2one('youth.zone', string='Zone', help='Leave empty to disburse every zone')
+    date_from = fields.Date(string='Approved From')
+    date_to = fields.Date(string='Approved To')
+    state = fields.Selection([
+        ('draft', 'Draft'),
+        ('ready', 'Ready for Payment'),
+        ('disbursed', 'Disbursed'),
+        ('cancelled', 'Cancelled')
+    ], string='Status', default='draft', required=True, tracking=True)
+
+    # Batch header kept for reconciliation with the bank or mobile-money statement
+    application_ids = fields.One2many('youth.application', 'disbursement_batch_id', string='Applications')
+    application_count = fields.Integer(string='Payments', readonly=True)
+    total_amount = fields.Float(string='Total Amount', readonly=True)
+    currency_id = fields.Many2one('res.currency', string='Currency',
+                                  default=lambda self: self.env.company.currency_id)
+    generated_date = fields.Datetime(string='Generated On', readonly=True)
+    generated_by_id = fields.Many2one('res.users', string='Generated By', readonly=True)
+    disbursement_date = fields.Date(string='Disbursement Date', readonly=True)
+    disbursed_by_id = fields.Many2one('res.users', string='Disbursed By', readonly=True)
+    notes = fields.Text(string='Notes')
+
+    @api.model
+    def create(self, vals_list):
+        # Handle both single dict and list of dicts
+        if isinstance(vals_list, dict):
+            vals_list = [vals_list]
+        self._assign_sequence_numbers(vals_list)
+        return super().create(vals_list)
+
+    def action_generate(self):
+        """Reserve the approved applications matching the batch filters"""
+        self.ensure_one()
+        if self.state != 'draft':
+            raise UserError("Only draft batches can be generated.")
+        conditions = [
+            "app.status = 'approved'",
+            "app.active",
+            "app.disbursement_batch_id IS NULL",
+            "app.approved_amount > 0",
+        ]
+        params = []
+        if self.zone_id:
+            conditions.append("app.applicant_zone = %s")
+            params.append(self.zone_id.id)
+        if self.date_from:
+            conditions.append("COALESCE(app.final_approval_date, app.committee_approval_date) >= %s")
+            params.append(self.date_from)
+        if self.date_to:
+            conditions.append("COALESCE(app.final_approval_date, app.committee_approval_date) <= %s")
+            params.append(self.date_to)
+
+        Application = self.env['youth.application']
+        Application.flush_model()
+        # Rows already being reserved by a concurrent batch are left to that batch
+        self.env.cr.execute(f"""
+            WITH picked AS (
+                SELECT app.id
+                  FROM youth_application app
+                 WHERE {' AND '.join(conditions)}
+                   FOR UPDATE SKIP LOCKED
+            )
+            UPDATE youth_application app
+               SET disbursement_batch_id = %s
+              FROM picked
+             WHERE app.id = picked.id
+         RETURNING app.approved_amount
+        """, params + [self.id])
+        amounts = [row[0] for row in self.env.cr.fetchall()]
+        if not amounts:
+            raise UserError("No approved applications match this batch.")
+        Application.invalidate_model(['disbursement_batch_id'])
+        self.write({
+            'state': 'ready',
+            'application_count': len(amounts),
+            'total_amount': sum(amounts),
+            'generated_date': fields.Datetime.now(),
+            'generated_by_id': self.env.user.id,
+        })
+
+    def action_download_csv(self):
+        return self._action_download('csv')
+
+    def action_download_fixed_width(self):
+        return self._action_download('txt')
+
+    def _action_download(self, file_format):
+        self.ensure_one()
+        if self.state not in ('ready', 'disbursed'):
+            raise UserError("Generate the batch before downloading its payment file.")
+        return {
+            'type': 'ir.actions.act_url',
+            'url': f'/youth_tracking/disbursement/{self.id}/{file_format}',
+            'target': 'self',
+        }
+
+    def action_mark_disbursed(self):
+        """Mark every application of the batch as disbursed in one write"""
+        self.ensure_one()
+        if self.state != 'ready':
+            raise UserError("Only batches ready for payment can be marked as disbursed.")
+        today = fields.Date.context_today(self)
+        applications = self.application_ids.filtered(lambda a: a.status == 'approved')
+        applications.with_context(mail_notrack=True, disbursement_batch_payment=True).write({
+            'status': 'disbursed',
+            'disbursement_date': today,
+            'disbursed_by_id': self.env.user.id,
+        })
+        applications._message_log_batch(
+            bodies={application.id: f"Funds Disbursed: funds disbursed by {self.env.user.name} "
+                                    f"in batch {self.name}. Amount: {application.approved_amount}"
+                    for application in applications})
+        self.write({
+            'state': 'disbursed',
+            'disbursement_date': today,
+            'disbursed_by_id': self.env.user.id,
+        })
+
+    def action_cancel(self):
+        """Release the applications of a batch that will not be paid"""
+        for batch in self:
+            if batch.state == 'disbursed':
+                raise UserError("A disbursed batch cannot be cancelled.")
+        self.application_ids.write({'disbursement_batch_id': False})
+        self.write({'state': 'cancelled', 'application_count': 0, 'total_amount': 0})
+
+    def _iter_payment_rows(self):
+        """Yield the payment rows of the batch, reading applications chunk by chunk"""
+        self.ensure_one()
+        last_id = 0
+        while True:
+            self.env.cr.execute("""
+                SELECT app.id, app.application_id, youth.name, youth.nrc_number, youth.phone, app.approved_amount
+                  FROM youth_application app
+                  JOIN youth_youth youth ON youth.id = app.youth_id
+                 WHERE app.disbursement_batch_id = %s AND app.id > %s
+              ORDER BY app.id
+                 LIMIT %s
+            """, [self.id, last_id, PAYMENT_FILE_CHUNK_SIZE])
+            rows = self.env.cr.fetchall()
+            if not rows:
+                return
+            last_id = rows[-1][0]
+            for row in rows:
+                yield row[1:]
+
+    def _iter_payment_file(self, file_format):
+        """Yield the payment file as text chunks, CSV or fixed width"""
+        self.ensure_one()
+        currency = self.currency_id.name or ''
+        rows = self._iter_payment_rows()
+        if file_format == 'csv':
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(PAYMENT_CSV_HEADER)
+            for count, (application, beneficiary, nrc, phone, amount) in enumerate(rows, start=1):
+                writer.writerow([self.name, application, beneficiary, nrc or '', phone or '',
+                                 currency, f"{amount:.2f}"])
+                if count % PAYMENT_FILE_CHUNK_SIZE == 0:
+                    yield buffer.getvalue()
+                    buffer.seek(0)
+                    buffer.truncate()
+            yield buffer.getvalue()
+            return
+
+        # Fixed width: header, one detail line per payment, trailer; amounts in ngwee
+        yield (f"H{self.name[:20]:<20}{fields.Date.context_today(self):%Y%m%d}"
+               f"{self.application_count:>10}{round(self.total_amount * 100):>15}\r\n")
+        for application, beneficiary, nrc, phone, amount in rows:
+            values = {
+                'record_type': 'D',
+                'reference': self.name,
+                'application': application,
+                'beneficiary': beneficiary,
+                'nrc': nrc or '',
+                'phone': phone or '',
+                'currency': currency,
+                'amount': round(amount * 100),
+            }
+            yield ''.join(
+                f"{str(values[column])[:width]:{alignment}{width}}"
+                for column, width, alignment in FIXED_WIDTH_LAYOUT
+            ) + '\r\n'
+        yield f"T{self.application_count:>10}{round(self.total_amount * 100):>15}\r\n"
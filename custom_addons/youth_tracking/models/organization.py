@@ -4,8 +4,11 @@ from odoo import models, fields, api
 class YouthOrganization(models.Model):
     _name = 'youth.organization'
     _description = 'Youth Organizations & Groups'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['batch.sequence.mixin', 'mail.thread', 'mail.activity.mixin']
     _order = 'name'
+    _sequence_code = 'youth.organization'
+    _sequence_field = 'organization_id'
+    _sequence_fallback = 'YORG000'
 
     name = fields.Char(
         string='Organization Name',
@@ -196,14 +199,8 @@ class YouthOrganization(models.Model):
     def create(self, vals_list):
         # Handle both single dict and list of dicts
         if isinstance(vals_list, dict):
-            # Single record creation
-            if 'organization_id' not in vals_list or not vals_list['organization_id']:
-                vals_list['organization_id'] = self.env['ir.sequence'].next_by_code('youth.organization') or 'YORG000'
-        else:
-            # Batch creation - list of dicts
-            for vals in vals_list:
-                if 'organization_id' not in vals or not vals['organization_id']:
-                    vals['organization_id'] = self.env['ir.sequence'].next_by_code('youth.organization') or 'YORG000'
+            vals_list = [vals_list]
+        self._assign_sequence_numbers(vals_list)
         
         return super(YouthOrganization, self).create(vals_list)
 
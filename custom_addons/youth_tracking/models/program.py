@@ -1,12 +1,17 @@
 from odoo import models, fields, api
+from odoo.exceptions import UserError
+from .youth import EDUCATION_RANKS
 from datetime import datetime, timedelta
 
 
 class YouthProgram(models.Model):
     _name = 'youth.program'
     _description = 'Youth Programs & Training'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['batch.sequence.mixin', 'mail.thread', 'mail.activity.mixin']
     _order = 'start_date desc, name'
+    _sequence_code = 'youth.program'
+    _sequence_field = 'program_id'
+    _sequence_fallback = 'YPROG000'
 
     name = fields.Char(
         string='Program Name',
@@ -111,7 +116,9 @@ class YouthProgram(models.Model):
     )
     current_participants = fields.Integer(
         string='Current Participants',
-        compute='_compute_participant_stats'
+        readonly=True,
+        copy=False,
+        help='Number of enrolled youth, kept up to date by the enrollment service'
     )
     available_slots = fields.Integer(
         string='Available Slots',
@@ -133,6 +140,30 @@ class YouthProgram(models.Model):
         string='Education Requirements',
         help='Minimum education requirements'
     )
+    min_education_level = fields.Selection(
+        selection=lambda self: self.env['youth.youth']._fields['education_level'].selection,
+        string='Minimum Education Level',
+        help='Lowest education level accepted; leave empty to accept any level'
+    )
+    min_education_rank = fields.Integer(
+        string='Minimum Education Rank',
+        compute='_compute_min_education_rank',
+        store=True
+    )
+    allowed_employment_status_ids = fields.Many2many(
+        'youth.employment.status',
+        string='Allowed Employment Statuses',
+        help='Leave empty to accept any employment status'
+    )
+    eligibility_zone_id = fields.Many2one(
+        'youth.zone',
+        string='Eligible Zone',
+        help='Only youth registered in this zone or its sub-zones qualify; leave empty for all zones'
+    )
+    eligible_youth_count = fields.Integer(
+        string='Eligible Youth',
+        compute='_compute_eligible_youth_count'
+    )
     other_requirements = fields.Text(
         string='Other Requirements',
         help='Additional requirements for participation'
@@ -147,6 +178,21 @@ class YouthProgram(models.Model):
         string='Cost per Participant',
         compute='_compute_cost_per_participant'
     )
+    budget_committed = fields.Float(
+        string='Committed Budget',
+        readonly=True,
+        copy=False,
+        help='Approved application amounts charged to this program, from the budget ledger'
+    )
+    budget_disbursed = fields.Float(
+        string='Disbursed Budget',
+        readonly=True,
+        copy=False
+    )
+    budget_remaining = fields.Float(
+        string='Remaining Budget',
+        compute='_compute_budget_remaining'
+    )
     funding_source = fields.Text(
         string='Funding Source',
         help='Source of funding for the program'
@@ -247,13 +293,106 @@ class YouthProgram(models.Model):
             else:
                 record.is_ongoing = False
 
-    @api.depends('participant_ids', 'max_participants')
+    @api.depends('current_participants', 'max_participants')
     def _compute_participant_stats(self):
         """Compute participant statistics"""
         for record in self:
-            current = len(record.participant_ids)
-            record.current_participants = current
-            record.available_slots = record.max_participants - current
+            record.available_slots = record.max_participants - record.current_participants
+
+    @api.depends('min_education_level')
+    def _compute_min_education_rank(self):
+        for record in self:
+            record.min_education_rank = EDUCATION_RANKS.get(record.min_education_level, 0)
+
+    def _compute_eligible_youth_count(self):
+        """Count eligible youth with two queries per distinct set of requirements"""
+        Youth = self.env['youth.youth']
+        groups = {}
+        for record in self:
+            record.eligible_youth_count = 0
+            if record.id:
+                domain = record._get_eligible_youth_domain(exclude_enrolled=False)
+                groups.setdefault(repr(domain), (domain, []))[1].append(record.id)
+        for domain, program_ids in groups.values():
+            programs = self.browse(program_ids)
+            matching = Youth.search_count(domain)
+            # Youth already enrolled are not counted as eligible for that program
+            enrolled = dict(Youth._read_group(
+                domain + [('program_ids', 'in', programs.ids)],
+                groupby=['program_ids'], aggregates=['__count']))
+            for program in programs:
+                program.eligible_youth_count = matching - enrolled.get(program, 0)
+
+    def _get_eligible_youth_domain(self, exclude_enrolled=True):
+        """Return the domain of active youth meeting this program's requirements"""
+        self.ensure_one()
+        domain = [('status', '=', 'active')]
+        if self.eligibility_zone_id:
+            domain.append(('zone_id', 'child_of', self.eligibility_zone_id.id))
+        if self.allowed_employment_status_ids:
+            domain.append(('employment_status', 'in', self.allowed_employment_status_ids.mapped('code')))
+        if self.age_min:
+            domain.append(('age', '>=', self.age_min))
+        if self.age_max:
+            domain.append(('age', '<=', self.age_max))
+        if self.min_education_rank:
+            domain.append(('education_rank', '>=', self.min_education_rank))
+        if exclude_enrolled:
+            domain.append(('program_ids', 'not in', self.ids))
+        return domain
+
+    def get_eligible_youth(self, limit=80, offset=0, order='age, id', exclude_enrolled=True):
+        """Return one page of eligible youth with the total count, for shortlisting
+
+        Returns a dict with the matching 'count' and the 'ids' of the requested page.
+        """
+        self.ensure_one()
+        Youth = self.env['youth.youth']
+        domain = self._get_eligible_youth_domain(exclude_enrolled=exclude_enrolled)
+        return {
+            'count': Youth.search_count(domain),
+            'ids': Youth.search(domain, limit=limit, offset=offset, order=order).ids,
+        }
+
+    def action_view_eligible_youth(self):
+        """Action to shortlist the youth qualifying for the program"""
+        self.ensure_one()
+        return {
+            'name': f'Eligible Youth - {self.name}',
+            'type': 'ir.actions.act_window',
+            'res_model': 'youth.youth',
+            'view_mode': 'list,form',
+            'domain': self._get_eligible_youth_domain(),
+            'target': 'current',
+        }
+
+    @api.depends('budget', 'budget_committed')
+    def _compute_budget_remaining(self):
+        for record in self:
+            record.budget_remaining = record.budget - record.budget_committed
+
+    @api.model
+    def _apply_budget_deltas(self, deltas):
+        """Add {program_id: [committed, disbursed]} to the program spend counters in one statement
+
+        Returns (id, name, budget_committed, budget) for every program touched.
+        """
+        if not deltas:
+            return []
+        self.flush_model(['budget_committed', 'budget_disbursed', 'budget'])
+        program_ids = list(deltas)
+        self.env.cr.execute("""
+            UPDATE youth_program p
+               SET budget_committed = COALESCE(p.budget_committed, 0) + d.committed,
+                   budget_disbursed = COALESCE(p.budget_disbursed, 0) + d.disbursed
+              FROM unnest(%s::int[], %s::float8[], %s::float8[]) AS d(id, committed, disbursed)
+             WHERE p.id = d.id
+         RETURNING p.id, p.name, p.budget_committed, COALESCE(p.budget, 0)
+        """, [program_ids, [deltas[program_id][0] for program_id in program_ids],
+              [deltas[program_id][1] for program_id in program_ids]])
+        rows = self.env.cr.fetchall()
+        self.browse(program_ids).invalidate_recordset(['budget_committed', 'budget_disbursed'])
+        return rows
 
     @api.depends('budget', 'current_participants')
     def _compute_cost_per_participant(self):
@@ -290,16 +429,132 @@ class YouthProgram(models.Model):
     def create(self, vals_list):
         # Handle both single dict and list of dicts
         if isinstance(vals_list, dict):
-            # Single record creation
-            if 'program_id' not in vals_list or not vals_list['program_id']:
-                vals_list['program_id'] = self.env['ir.sequence'].next_by_code('youth.program') or 'YPROG000'
-        else:
-            # Batch creation - list of dicts
-            for vals in vals_list:
-                if 'program_id' not in vals or not vals['program_id']:
-                    vals['program_id'] = self.env['ir.sequence'].next_by_code('youth.program') or 'YPROG000'
+            vals_list = [vals_list]
+        self._assign_sequence_numbers(vals_list)
         
-        return super(YouthProgram, self).create(vals_list)
+        records = super(YouthProgram, self).create(vals_list)
+        if any(vals.get('participant_ids') for vals in vals_list):
+            records._lock_for_enrollment()
+            records._refresh_participant_counts()
+        return records
+
+    def write(self, vals):
+        if 'participant_ids' not in vals:
+            return super().write(vals)
+        # Direct edits of the participant list go through the same lock and capacity check
+        self._lock_for_enrollment()
+        result = super().write(vals)
+        self._refresh_participant_counts()
+        return result
+
+    def init(self):
+        # Seed the participant counter from the enrollment table
+        self._refresh_participant_counts()
+
+    def _participant_relation(self):
+        field = self._fields['participant_ids']
+        return field.relation, field.column1, field.column2
+
+    def _lock_for_enrollment(self):
+        """Lock the program rows so concurrent enrollments are applied one after another"""
+        if not self:
+            return {}
+        self.flush_recordset(['max_participants', 'current_participants'])
+        self.env.cr.execute("""
+            SELECT id, max_participants, current_participants
+              FROM youth_program
+             WHERE id IN %s
+          ORDER BY id
+               FOR UPDATE
+        """, [tuple(self.ids)])
+        return {row[0]: (row[1] or 0, row[2] or 0) for row in self.env.cr.fetchall()}
+
+    def _refresh_participant_counts(self):
+        """Recount the enrolled youth of these programs, or of every program, and check capacity"""
+        relation, program_column, __ = self._participant_relation()
+        # Only the enrollment table is read below, through either side of the relation
+        self.env['youth.program'].flush_model(['participant_ids', 'max_participants', 'current_participants'])
+        self.env['youth.youth'].flush_model(['program_ids'])
+        program_clause = 'AND p.id IN %s' if self else ''
+        self.env.cr.execute(f"""
+            UPDATE youth_program p
+               SET current_participants = (
+                       SELECT count(*) FROM {relation} rel WHERE rel.{program_column} = p.id)
+             WHERE TRUE {program_clause}
+         RETURNING p.id, p.name, p.current_participants, p.max_participants
+        """, [tuple(self.ids)] if self else [])
+        rows = self.env.cr.fetchall()
+        self.invalidate_model(['current_participants', 'available_slots'])
+        if not self:
+            return
+        over = [f"{name} ({current}/{maximum})" for __, name, current, maximum in rows
+                if maximum > 0 and current > maximum]
+        if over:
+            raise UserError(f"Enrollment exceeds program capacity: {', '.join(over)}.")
+
+    def enroll(self, youth_ids):
+        """Enroll youth in this program, all or none, without exceeding its capacity
+
+        The program row is locked for the duration of the transaction, so
+        concurrent enrollments wait for each other instead of overshooting the
+        capacity or failing on serialisation errors. Returns the newly enrolled youth.
+        """
+        self.ensure_one()
+        # The raw SQL below bypasses the ORM access checks
+        self.check_access('write')
+        capacity = self._lock_for_enrollment()
+        maximum, current = capacity[self.id]
+        relation, program_column, youth_column = self._participant_relation()
+        youth_ids = list(set(youth_ids))
+        if not youth_ids:
+            return self.env['youth.youth']
+
+        self.env.cr.execute(f"""
+            SELECT {youth_column} FROM {relation}
+             WHERE {program_column} = %s AND {youth_column} IN %s
+        """, [self.id, tuple(youth_ids)])
+        enrolled = {row[0] for row in self.env.cr.fetchall()}
+        new_ids = [youth_id for youth_id in youth_ids if youth_id not in enrolled]
+        if not new_ids:
+            return self.env['youth.youth']
+        if maximum > 0 and current + len(new_ids) > maximum:
+            raise UserError(
+                f"{self.name} has {max(maximum - current, 0)} place(s) left; "
+                f"{len(new_ids)} youth cannot be enrolled.")
+
+        self.env.cr.execute(f"""
+            INSERT INTO {relation} ({program_column}, {youth_column})
+            SELECT %s, unnest(%s::int[])
+            ON CONFLICT DO NOTHING
+        """, [self.id, new_ids])
+        self.env.cr.execute(
+            "UPDATE youth_program SET current_participants = current_participants + %s WHERE id = %s",
+            [len(new_ids), self.id])
+        self.invalidate_recordset(['participant_ids', 'current_participants', 'available_slots'])
+        new_youth = self.env['youth.youth'].browse(new_ids)
+        new_youth.invalidate_recordset(['program_ids'])
+        self._message_log(body=f"{len(new_ids)} youth enrolled by {self.env.user.name}.")
+        return new_youth
+
+    def unenroll(self, youth_ids):
+        """Remove youth from this program and release their places"""
+        self.ensure_one()
+        self.check_access('write')
+        self._lock_for_enrollment()
+        relation, program_column, youth_column = self._participant_relation()
+        youth_ids = list(set(youth_ids))
+        if not youth_ids:
+            return 0
+        self.env.cr.execute(f"""
+            DELETE FROM {relation} WHERE {program_column} = %s AND {youth_column} IN %s
+        """, [self.id, tuple(youth_ids)])
+        removed = self.env.cr.rowcount
+        self.env.cr.execute(
+            "UPDATE youth_program SET current_participants = current_participants - %s WHERE id = %s",
+            [removed, self.id])
+        self.invalidate_recordset(['participant_ids', 'current_participants', 'available_slots'])
+        self.env['youth.youth'].browse(youth_ids).invalidate_recordset(['program_ids'])
+        return removed
 
     def action_start_program(self):
         """Start the program"""
@@ -321,6 +576,7 @@ class YouthProgram(models.Model):
 
     def action_enroll_youth(self):
         """Action to enroll youth in the program"""
+        self.ensure_one()
         return {
             'name': 'Enroll Youth',
             'type': 'ir.actions.act_window',
@@ -366,4 +622,53 @@ class YouthProgram(models.Model):
         for record in self:
             if record.age_min and record.age_max:
                 if record.age_min > record.age_max:
-                    raise models.ValidationError("Minimum age cannot be greater than maximum age.")
\ No newline at end of file
+                    raise models.ValidationError("Minimum age cannot be greater than maximum age.")
+
+
+class YouthEmploymentStatus(models.Model):
+    _name = 'youth.employment.status'
+    _description = 'Youth Employment Status'
+    _order = 'sequence, name'
+
+    name = fields.Char(string='Name', required=True)
+    code = fields.Char(string='Code', required=True,
+                       help='Matches the employment status recorded on youth profiles')
+    sequence = fields.Integer(string='Sequence', default=10)
+
+    _sql_constraints = [
+        ('code_uniq', 'unique(code)', 'The employment status code must be unique.'),
+    ]
+
+
+class YouthProgramEnrollmentWizard(models.TransientModel):
+    _name = 'youth.program.enrollment.wizard'
+    _description = 'Youth Program Enrollment Wizard'
+
+    program_id = fields.Many2one('youth.program', string='Program', required=True,
+                                 domain="[('status', 'not in', ['completed', 'cancelled'])]")
+    youth_ids = fields.Many2many('youth.youth', string='Youth',
+                                 default=lambda self: self._default_youth_ids())
+    available_slots = fields.Integer(related='program_id.available_slots', string='Available Slots')
+
+    @api.model
+    def _default_youth_ids(self):
+        youth_id = self.env.context.get('default_youth_id')
+        return [fields.Command.set([youth_id])] if youth_id else False
+
+    def action_enroll(self):
+        """Enroll the selected youth in one call"""
+        self.ensure_one()
+        if not self.youth_ids:
+            raise UserError("Select the youth to enroll.")
+        enrolled = self.program_id.enroll(self.youth_ids.ids)
+        return {
+            'type': 'ir.actions.client',
+            'tag': 'display_notification',
+            'params': {
+                'title': 'Enrollment Complete',
+                'message': f'{len(enrolled)} youth enrolled in {self.program_id.name}.',
+                'type': 'success',
+                'sticky': False,
+                'next': {'type': 'ir.actions.act_window_close'},
+            }
+        }
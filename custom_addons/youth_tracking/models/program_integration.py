@@ -1,5 +1,10 @@
 from odoo import models, fields, api
 
+# Youth listed per page in the participant selector
+SELECTOR_PAGE_SIZE = 80
+# Names spelled out in the selection summary logged on the event
+SELECTION_SUMMARY_NAMES = 50
+
 
 class EventProgramYouthIntegration(models.Model):
     _inherit = 'event.program'
@@ -105,6 +110,16 @@ class YouthParticipantSelectorWizard(models.TransientModel):
     ], string='Employment Status Filter')
     
     # Available and selected youth
+    page = fields.Integer(string='Page', default=1)
+    page_size = fields.Integer(string='Youth per Page', default=SELECTOR_PAGE_SIZE)
+    available_count = fields.Integer(
+        string='Matching Youth',
+        compute='_compute_available_youth'
+    )
+    page_count = fields.Integer(
+        string='Pages',
+        compute='_compute_available_youth'
+    )
     available_youth_ids = fields.Many2many(
         'youth.youth',
         'wizard_available_youth_rel',
@@ -116,42 +131,86 @@ class YouthParticipantSelectorWizard(models.TransientModel):
         'wizard_selected_youth_rel',
         string='Selected Youth'
     )
+    keep_existing_participants = fields.Boolean(
+        string='Keep Current Participants',
+        help='Add the selection to the youth already taking part instead of replacing them'
+    )
+
+    @api.onchange('zone_id', 'age_min', 'age_max', 'education_level', 'employment_status')
+    def _onchange_filters(self):
+        self.page = 1
+
+    def _get_available_youth_domain(self):
+        """Return the search domain of the wizard filters"""
+        self.ensure_one()
+        domain = [('status', '=', 'active')]
+        if self.zone_id:
+            domain.append(('zone_id', '=', self.zone_id.id))
+        if self.age_min:
+            domain.append(('age', '>=', self.age_min))
+        if self.age_max:
+            domain.append(('age', '<=', self.age_max))
+        if self.education_level:
+            domain.append(('education_level', '=', self.education_level))
+        if self.employment_status:
+            domain.append(('employment_status', '=', self.employment_status))
+        return domain
 
-    @api.depends('zone_id', 'age_min', 'age_max', 'education_level', 'employment_status')
+    @api.depends('zone_id', 'age_min', 'age_max', 'education_level', 'employment_status', 'page', 'page_size')
     def _compute_available_youth(self):
-        """Compute available youth based on criteria"""
+        """Compute the current page of matching youth and the total count"""
+        Youth = self.env['youth.youth']
         for wizard in self:
-            domain = [('status', '=', 'active')]
-            
-            if wizard.zone_id:
-                domain.append(('zone_id', '=', wizard.zone_id.id))
-            if wizard.age_min:
-                domain.append(('age', '>=', wizard.age_min))
-            if wizard.age_max:
-                domain.append(('age', '<=', wizard.age_max))
-            if wizard.education_level:
-                domain.append(('education_level', '=', wizard.education_level))
-            if wizard.employment_status:
-                domain.append(('employment_status', '=', wizard.employment_status))
-            
-            available_youth = self.env['youth.youth'].search(domain)
-            wizard.available_youth_ids = [(6, 0, available_youth.ids)]
+            domain = wizard._get_available_youth_domain()
+            page_size = max(wizard.page_size, 1)
+            wizard.available_count = Youth.search_count(domain)
+            wizard.page_count = max(-(-wizard.available_count // page_size), 1)
+            wizard.available_youth_ids = Youth.search(
+                domain, order='name, id', limit=page_size,
+                offset=(min(max(wizard.page, 1), wizard.page_count) - 1) * page_size)
+
+    def _reopen(self):
+        return {
+            'name': 'Select Youth Participants',
+            'type': 'ir.actions.act_window',
+            'res_model': self._name,
+            'res_id': self.id,
+            'view_mode': 'form',
+            'target': 'new',
+        }
+
+    def action_next_page(self):
+        self.ensure_one()
+        self.page = min(self.page + 1, self.page_count)
+        return self._reopen()
+
+    def action_previous_page(self):
+        self.ensure_one()
+        self.page = max(self.page - 1, 1)
+        return self._reopen()
+
+    def action_select_page(self):
+        """Add every youth of the current page to the selection"""
+        self.ensure_one()
+        self.selected_youth_ids = [fields.Command.link(youth_id) for youth_id in self.available_youth_ids.ids]
+        return self._reopen()
 
     def action_confirm_selection(self):
         """Confirm youth selection for the event"""
-        if self.selected_youth_ids:
-            # Add selected youth to the event
-            self.event_id.write({
-                'youth_participants_ids': [(6, 0, self.selected_youth_ids.ids)]
-            })
-            
-            # Create activity records for tracking
-            for youth in self.selected_youth_ids:
-                youth.message_post(
-                    body=f"Selected for event: {self.event_id.name}",
-                    subject="Event Participation"
-                )
-        
+        selected = self.selected_youth_ids
+        if selected:
+            # The selection replaces the event participants unless asked to add to them
+            if self.keep_existing_participants:
+                commands = [fields.Command.link(youth_id) for youth_id in selected.ids]
+            else:
+                commands = [fields.Command.set(selected.ids)]
+            self.event_id.write({'youth_participants_ids': commands})
+            names = ", ".join(selected[:SELECTION_SUMMARY_NAMES].mapped('name'))
+            if len(selected) > SELECTION_SUMMARY_NAMES:
+                names += f" and {len(selected) - SELECTION_SUMMARY_NAMES} more"
+            self.event_id._message_log(
+                body=f"Youth Selection: {len(selected)} youth selected for this event: {names}")
+
         return {'type': 'ir.actions.act_window_close'}
 
 
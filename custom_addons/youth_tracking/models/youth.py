@@ -1,13 +1,33 @@
-from odoo import models, fields, api
+from odoo import models, fields, api, tools
+from odoo.addons.sports_tracking.models.person_identity import normalize_name, normalize_phone, normalize_national_id
 from dateutil.relativedelta import relativedelta
 from datetime import date, datetime
 
+# Minimum pg_trgm similarity for two normalised names to be a probable match
+DUPLICATE_NAME_SIMILARITY = 0.6
+# Fields whose changes require re-running duplicate detection
+DUPLICATE_KEY_FIELDS = {'name', 'phone', 'nrc_number', 'date_of_birth', 'active'}
+# Ordering of education levels for program eligibility floors
+EDUCATION_RANKS = {
+    'other': 0,
+    'primary': 1,
+    'secondary': 2,
+    'vocational': 3,
+    'tertiary': 3,
+    'university': 4,
+}
+
 
 class Youth(models.Model):
     _name = 'youth.youth'
     _description = 'Youth Profile & Registration'
-    _inherit = ['mail.thread', 'mail.activity.mixin']
+    _inherit = ['batch.sequence.mixin', 'person.identity.mixin', 'birthday.refresh.mixin',
+                'mail.thread', 'mail.activity.mixin']
     _order = 'registration_date desc, name'
+    _identity_national_id_field = 'nrc_number'
+    _sequence_code = 'youth.youth'
+    _sequence_field = 'youth_id'
+    _sequence_fallback = 'YOUTH000'
 
     # Basic Information
     youth_id = fields.Char(
@@ -29,6 +49,7 @@ class Youth(models.Model):
     date_of_birth = fields.Date(
         string='Date of Birth',
         required=True,
+        index=True,
         tracking=True
     )
     age = fields.Integer(
@@ -58,6 +79,11 @@ class Youth(models.Model):
         ('vocational', 'Vocational Training'),
         ('other', 'Other')
     ], string='Education Level', required=True)
+    education_rank = fields.Integer(
+        string='Education Rank',
+        compute='_compute_education_rank',
+        store=True
+    )
     current_institution = fields.Char(string='Current Institution/School')
     grade_year = fields.Char(string='Grade/Year')
     graduation_date = fields.Date(string='Expected/Actual Graduation Date')
@@ -118,17 +144,25 @@ class Youth(models.Model):
     )
     
     # Analytics & Performance
+    application_ids = fields.One2many(
+        'youth.application',
+        'youth_id',
+        string='Applications'
+    )
     total_applications = fields.Integer(
         string='Total Applications',
-        compute='_compute_application_stats'
+        compute='_compute_application_stats',
+        store=True
     )
     approved_applications = fields.Integer(
         string='Approved Applications',
-        compute='_compute_application_stats'
+        compute='_compute_application_stats',
+        store=True
     )
     application_success_rate = fields.Float(
         string='Application Success Rate (%)',
-        compute='_compute_application_stats'
+        compute='_compute_application_stats',
+        store=True
     )
     last_activity_date = fields.Date(
         string='Last Activity',
@@ -143,7 +177,8 @@ class Youth(models.Model):
     )
     financial_support_received = fields.Float(
         string='Total Financial Support Received',
-        compute='_compute_financial_stats'
+        compute='_compute_application_stats',
+        store=True
     )
     
     # Additional Information
@@ -151,6 +186,43 @@ class Youth(models.Model):
     notes = fields.Text(string='Notes')
     active = fields.Boolean(default=True)
     
+    # Duplicate Detection (blocking keys)
+    normalized_name = fields.Char(
+        string='Normalized Name',
+        compute='_compute_normalized_keys',
+        store=True,
+        index='trigram'
+    )
+    normalized_phone = fields.Char(
+        string='Normalized Phone',
+        compute='_compute_normalized_keys',
+        store=True,
+        index=True
+    )
+    normalized_nrc = fields.Char(
+        string='Normalized NRC',
+        compute='_compute_normalized_keys',
+        store=True,
+        index=True
+    )
+    is_probable_duplicate = fields.Boolean(
+        string='Probable Duplicate',
+        readonly=True,
+        copy=False,
+        index=True
+    )
+    duplicate_of_id = fields.Many2one(
+        'youth.youth',
+        string='Probable Duplicate Of',
+        readonly=True,
+        copy=False
+    )
+    duplicate_reason = fields.Selection([
+        ('nrc', 'Same NRC Number'),
+        ('phone', 'Same Phone Number'),
+        ('name_dob', 'Similar Name and Same Date of Birth')
+    ], string='Duplicate Reason', readonly=True, copy=False)
+    
     # Event Integration Fields (for compatibility with event management)
     event_participants_ids = fields.Many2many(
         'event.program',
@@ -158,6 +230,116 @@ class Youth(models.Model):
         compute='_compute_event_participants'
     )
 
+    @api.depends('name', 'phone', 'nrc_number')
+    def _compute_normalized_keys(self):
+        """Compute the blocking keys used for duplicate detection"""
+        for record in self:
+            record.normalized_name = self._normalize_name(record.name)
+            record.normalized_phone = self._normalize_phone(record.phone)
+            record.normalized_nrc = normalize_national_id(record.nrc_number)
+
+    @api.model
+    def _normalize_name(self, name):
+        return normalize_name(name)
+
+    @api.model
+    def _normalize_phone(self, phone):
+        return normalize_phone(phone)
+
+    def _detect_duplicates(self, scope_all=False):
+        """Flag records matching an older youth on NRC, phone or name and date of birth
+
+        Candidates are only compared within the same blocking key (NRC, phone or
+        date of birth), so the whole table can be checked without pairwise scans.
+        Records flagged against one of these records are checked again as well.
+        """
+        if not scope_all and not self:
+            return
+        self.flush_model(['normalized_name', 'normalized_phone', 'normalized_nrc',
+                          'date_of_birth', 'active', 'duplicate_of_id'])
+        if scope_all:
+            scope, params = 'TRUE', []
+        else:
+            dependents = self.with_context(active_test=False).search([('duplicate_of_id', 'in', self.ids)])
+            scope, params = 'b.id IN %s', [tuple((self | dependents).ids)]
+        if self.env.registry.has_trigram:
+            name_match = 'similarity(y.normalized_name, b.normalized_name) >= %s'
+            name_params = [DUPLICATE_NAME_SIMILARITY]
+        else:
+            name_match = 'y.normalized_name = b.normalized_name'
+            name_params = []
+
+        cr = self.env.cr
+        cr.execute(f"""
+            UPDATE youth_youth b
+               SET is_probable_duplicate = FALSE, duplicate_of_id = NULL, duplicate_reason = NULL
+             WHERE {scope} AND b.is_probable_duplicate
+        """, params)
+        cr.execute(f"""
+            WITH candidates AS (
+                SELECT b.id, y.id AS match_id, 1 AS priority, 'nrc' AS reason
+                  FROM youth_youth b
+                  JOIN youth_youth y ON y.normalized_nrc = b.normalized_nrc AND y.id < b.id AND y.active
+                 WHERE {scope} AND b.active AND b.normalized_nrc IS NOT NULL
+                 UNION ALL
+                SELECT b.id, y.id, 2, 'phone'
+                  FROM youth_youth b
+                  JOIN youth_youth y ON y.normalized_phone = b.normalized_phone AND y.id < b.id AND y.active
+                 WHERE {scope} AND b.active AND b.normalized_phone IS NOT NULL
+                 UNION ALL
+                SELECT b.id, y.id, 3, 'name_dob'
+                  FROM youth_youth b
+                  JOIN youth_youth y ON y.date_of_birth = b.date_of_birth AND y.id < b.id AND y.active
+                 WHERE {scope} AND b.active AND b.normalized_name IS NOT NULL AND {name_match}
+            ), best AS (
+                SELECT DISTINCT ON (id) id, match_id, reason
+                  FROM candidates
+              ORDER BY id, priority, match_id
+            )
+            UPDATE youth_youth y
+               SET is_probable_duplicate = TRUE, duplicate_of_id = best.match_id, duplicate_reason = best.reason
+              FROM best
+             WHERE best.id = y.id
+        """, params * 3 + name_params)
+        self.invalidate_model(['is_probable_duplicate', 'duplicate_of_id', 'duplicate_reason'])
+
+    @api.model
+    def get_duplicate_report(self):
+        """Re-check the whole registry and return the probable duplicate pairs"""
+        self._detect_duplicates(scope_all=True)
+        duplicates = self.search([('is_probable_duplicate', '=', True)])
+        reasons = dict(self._fields['duplicate_reason'].selection)
+        return [{
+            'youth_id': record.id,
+            'youth_name': record.name,
+            'duplicate_of_id': record.duplicate_of_id.id,
+            'duplicate_of_name': record.duplicate_of_id.name,
+            'reason': reasons.get(record.duplicate_reason, ''),
+        } for record in duplicates]
+
+    @api.model
+    def action_duplicate_report(self):
+        """Run the batch duplicate check and list the flagged youth"""
+        self._detect_duplicates(scope_all=True)
+        return {
+            'type': 'ir.actions.act_window',
+            'name': 'Probable Duplicate Youth',
+            'res_model': 'youth.youth',
+            'view_mode': 'list,form',
+            'domain': [('is_probable_duplicate', '=', True)],
+        }
+
+    def init(self):
+        # Serves eligibility searches: status and zone equality, then the ranged criteria
+        tools.create_index(
+            self.env.cr, 'youth_youth_eligibility_idx', self._table,
+            ['status', 'zone_id', 'employment_status', 'age', 'education_rank'])
+
+    @api.depends('education_level')
+    def _compute_education_rank(self):
+        for record in self:
+            record.education_rank = EDUCATION_RANKS.get(record.education_level, 0)
+
     @api.depends('date_of_birth')
     def _compute_age(self):
         """Calculate age from date of birth"""
@@ -175,17 +357,35 @@ class Youth(models.Model):
             record.active_programs = len(programs.filtered(lambda p: p.status == 'active'))
             record.completed_programs = len(programs.filtered(lambda p: p.status == 'completed'))
 
+    @api.depends('application_ids.status', 'application_ids.application_type',
+                 'application_ids.requested_amount', 'application_ids.active')
     def _compute_application_stats(self):
-        """Compute application statistics"""
-        Application = self.env['youth.application']
+        """Compute application and financial statistics with one grouped query"""
+        stats = {}
+        youth_ids = self.filtered('id').ids
+        if youth_ids:
+            groups = self.env['youth.application']._read_group(
+                [('youth_id', 'in', youth_ids)],
+                groupby=['youth_id', 'status', 'application_type'],
+                aggregates=['__count', 'requested_amount:sum'],
+            )
+            for youth, status, application_type, count, amount in groups:
+                youth_stats = stats.setdefault(youth.id, {'total': 0, 'approved': 0, 'support': 0.0})
+                youth_stats['total'] += count
+                if status == 'approved':
+                    youth_stats['approved'] += count
+                    if application_type in ('cdf', 'financial_support'):
+                        youth_stats['support'] += amount
+
         for record in self:
-            applications = Application.search([('youth_id', '=', record.id)])
-            total = len(applications)
-            approved = len(applications.filtered(lambda a: a.status == 'approved'))
-            
+            youth_stats = stats.get(record.id, {'total': 0, 'approved': 0, 'support': 0.0})
+            total = youth_stats['total']
+            approved = youth_stats['approved']
+
             record.total_applications = total
             record.approved_applications = approved
             record.application_success_rate = (approved / total * 100) if total > 0 else 0.0
+            record.financial_support_received = youth_stats['support']
 
     def _compute_last_activity(self):
         """Compute last activity date"""
@@ -200,36 +400,80 @@ class Youth(models.Model):
                         latest_date = latest_program
             record.last_activity_date = latest_date
 
-    def _compute_financial_stats(self):
-        """Compute financial support statistics"""
-        Application = self.env['youth.application']
-        for record in self:
-            approved_apps = Application.search([
-                ('youth_id', '=', record.id),
-                ('status', '=', 'approved'),
-                ('application_type', 'in', ['cdf', 'financial_support'])
-            ])
-            record.financial_support_received = sum(approved_apps.mapped('requested_amount'))
-
     def _compute_event_participants(self):
-        """Compute method for event participants compatibility"""
+        """Compute the programs this youth took part in through the person identity"""
+        programs = {}
+        identities = self.person_identity_id
+        if identities:
+            for participant in identities.get_participations():
+                programs.setdefault(participant.person_identity_id.id, set()).add(participant.program_id.id)
         for record in self:
-            record.event_participants_ids = [(6, 0, [record.id])]
+            program_ids = programs.get(record.person_identity_id.id, set()) - {False}
+            record.event_participants_ids = [(6, 0, list(program_ids))]
 
     @api.model
     def create(self, vals_list):
         # Handle both single dict and list of dicts
         if isinstance(vals_list, dict):
-            # Single record creation
-            if 'youth_id' not in vals_list or not vals_list['youth_id']:
-                vals_list['youth_id'] = self.env['ir.sequence'].next_by_code('youth.youth') or 'YOUTH000'
-        else:
-            # Batch creation - list of dicts
-            for vals in vals_list:
-                if 'youth_id' not in vals or not vals['youth_id']:
-                    vals['youth_id'] = self.env['ir.sequence'].next_by_code('youth.youth') or 'YOUTH000'
-        
-        return super(Youth, self).create(vals_list)
+            vals_list = [vals_list]
+        self._assign_sequence_numbers(vals_list)
+
+        # Enrollments given at creation take the same locks and capacity check as enroll()
+        programs = self.env['youth.program'].browse([
+            program_id
+            for vals in vals_list
+            for program_id in self._get_command_record_ids(vals.get('program_ids') or [])
+        ])
+        programs._lock_for_enrollment()
+        records = super(Youth, self).create(vals_list)
+        records._detect_duplicates()
+        programs |= records.program_ids
+        if programs:
+            programs._refresh_participant_counts()
+        return records
+
+    def write(self, vals):
+        programs = None
+        if 'program_ids' in vals:
+            # Take the same program locks as enroll() so the capacity check cannot race
+            programs = self.program_ids | self.env['youth.program'].browse(
+                self._get_command_record_ids(vals['program_ids']))
+            programs._lock_for_enrollment()
+        result = super().write(vals)
+        if DUPLICATE_KEY_FIELDS.intersection(vals):
+            self._detect_duplicates()
+        if programs is not None:
+            # Keep the program participant counters in step with the enrollment table
+            programs |= self.program_ids
+            if programs:
+                programs._refresh_participant_counts()
+        return result
+
+    @api.model
+    def _get_command_record_ids(self, commands):
+        """Return the ids of existing records linked by x2many commands"""
+        record_ids = []
+        for command in commands:
+            if isinstance(command, int):
+                record_ids.append(command)
+            elif command[0] == fields.Command.SET:
+                record_ids += command[2]
+            elif command[0] in (fields.Command.LINK, fields.Command.UNLINK):
+                record_ids.append(command[1])
+        return record_ids
+
+    def unlink(self):
+        dependents = self.with_context(active_test=False).search(
+            [('duplicate_of_id', 'in', self.ids), ('id', 'not in', self.ids)])
+        # Deleting the youth drops their enrollment rows; release the places they held
+        programs = self.program_ids
+        programs._lock_for_enrollment()
+        result = super().unlink()
+        if programs:
+            programs._refresh_participant_counts()
+        # Their original is gone; look for another one or clear the flag
+        dependents._detect_duplicates()
+        return result
 
     def action_view_applications(self):
         """Action to view youth's applications"""
@@ -254,6 +498,41 @@ class Youth(models.Model):
             'target': 'current',
         }
 
+    def _get_eligible_programs_domain(self):
+        """Return the domain of open programs whose requirements this youth meets"""
+        self.ensure_one()
+        # Same rule as youth.program._get_eligible_youth_domain: only active youth qualify
+        if self.status != 'active':
+            return [('id', '=', False)]
+        # The zone's materialized path lists it and all its ancestors
+        zone_ids = [int(zone_id) for zone_id in (self.zone_id.parent_path or '').split('/') if zone_id]
+        return [
+            ('status', 'in', ['draft', 'planned', 'active']),
+            '|', ('age_min', '=', 0), ('age_min', '<=', self.age),
+            '|', ('age_max', '=', 0), ('age_max', '>=', self.age),
+            '|', ('min_education_rank', '=', 0), ('min_education_rank', '<=', self.education_rank),
+            '|', ('allowed_employment_status_ids', '=', False),
+            ('allowed_employment_status_ids.code', '=', self.employment_status),
+            '|', ('eligibility_zone_id', '=', False), ('eligibility_zone_id', 'in', zone_ids),
+            ('participant_ids', 'not in', self.ids),
+        ]
+
+    def get_eligible_programs(self, limit=None, offset=0):
+        """Return the open programs this youth qualifies for and is not enrolled in"""
+        return self.env['youth.program'].search(self._get_eligible_programs_domain(),
+                                                limit=limit, offset=offset)
+
+    def action_view_eligible_programs(self):
+        """Action to view the programs this youth qualifies for"""
+        return {
+            'name': f'Eligible Programs - {self.name}',
+            'type': 'ir.actions.act_window',
+            'res_model': 'youth.program',
+            'view_mode': 'list,form',
+            'domain': self._get_eligible_programs_domain(),
+            'target': 'current',
+        }
+
     def action_enroll_program(self):
         """Action to enroll in a new program"""
         return {
@@ -0,0 +1,34 @@
+from odoo import models
+
+
+class YouthImportWizard(models.TransientModel):
+    _name = 'youth.import.wizard'
+    _inherit = 'streaming.import.mixin'
+    _description = 'Youth Registry Import'
+
+    _import_model = 'youth.youth'
+    # Headers of static/xls/youth_import_template.xlsx
+    _import_columns = {
+        'Name': 'name',
+        'Stage Name': 'stage_name',
+        'Date of Birth': 'date_of_birth',
+        'Gender': 'gender',
+        'Phone Number': 'phone',
+        'Email Address': 'email',
+        'Physical Address': 'address',
+        'NRC Number': 'nrc_number',
+        'Emergency Contact Name': 'emergency_contact',
+        'Emergency Contact Phone': 'emergency_phone',
+        'Zone': 'zone_id',
+        'District': 'notes',
+        'Constituency': 'notes',
+        'Ward': 'notes',
+        'Education Level': 'education_level',
+        'Specialization': 'skills_interests',
+        'Status': 'status',
+        'Organization': 'organization_ids',
+    }
+    _import_lookups = {
+        'zone_id': ('youth.zone', ['zone_code', 'name']),
+        'organization_ids': ('youth.organization', ['organization_id', 'name']),
+    }
@@ -5,6 +5,8 @@ class YouthZone(models.Model):
     _name = 'youth.zone'
     _description = 'Youth Geographical Zone Management'
     _order = 'name'
+    _parent_name = 'parent_zone_id'
+    _parent_store = True
 
     name = fields.Char(
         string='Zone Name',
@@ -31,8 +33,11 @@ class YouthZone(models.Model):
     parent_zone_id = fields.Many2one(
         'youth.zone',
         string='Parent Zone',
+        index=True,
+        ondelete='restrict',
         help='Higher level administrative zone'
     )
+    parent_path = fields.Char(index=True, unaccent=False)
     child_zone_ids = fields.One2many(
         'youth.zone',
         'parent_zone_id',
@@ -54,38 +59,94 @@ class YouthZone(models.Model):
         related='coordinator_id.email'
     )
     
+    # Related Records
+    youth_ids = fields.One2many(
+        'youth.youth',
+        'zone_id',
+        string='Youth'
+    )
+    program_ids = fields.One2many(
+        'youth.program',
+        'zone_id',
+        string='Programs'
+    )
+    organization_ids = fields.One2many(
+        'youth.organization',
+        'zone_id',
+        string='Organizations'
+    )
+    application_ids = fields.One2many(
+        'youth.application',
+        'applicant_zone',
+        string='Applications'
+    )
+
     # Zone Statistics
     youth_count = fields.Integer(
         string='Total Youth',
-        compute='_compute_youth_stats'
+        compute='_compute_zone_statistics'
     )
     active_youth_count = fields.Integer(
         string='Active Youth',
-        compute='_compute_youth_stats'
+        compute='_compute_zone_statistics'
     )
     program_count = fields.Integer(
         string='Active Programs',
-        compute='_compute_program_stats'
+        compute='_compute_zone_statistics'
     )
     organization_count = fields.Integer(
         string='Youth Organizations',
-        compute='_compute_organization_stats'
+        compute='_compute_zone_statistics'
     )
     
     # Performance Metrics
     total_applications = fields.Integer(
         string='Total Applications',
-        compute='_compute_application_stats'
+        compute='_compute_zone_statistics'
     )
     approved_applications = fields.Integer(
         string='Approved Applications',
-        compute='_compute_application_stats'
+        compute='_compute_zone_statistics'
     )
     success_rate = fields.Float(
         string='Approval Success Rate (%)',
-        compute='_compute_application_stats'
+        compute='_compute_zone_statistics'
     )
     
+    # Statistics rolled up over the zone and all its sub-zones
+    subtree_youth_count = fields.Integer(
+        string='Total Youth (incl. Sub-zones)',
+        compute='_compute_subtree_statistics'
+    )
+    subtree_active_youth_count = fields.Integer(
+        string='Active Youth (incl. Sub-zones)',
+        compute='_compute_subtree_statistics'
+    )
+    subtree_program_count = fields.Integer(
+        string='Active Programs (incl. Sub-zones)',
+        compute='_compute_subtree_statistics'
+    )
+    subtree_total_applications = fields.Integer(
+        string='Total Applications (incl. Sub-zones)',
+        compute='_compute_subtree_statistics'
+    )
+    subtree_approved_applications = fields.Integer(
+        string='Approved Applications (incl. Sub-zones)',
+        compute='_compute_subtree_statistics'
+    )
+    subtree_allocated_budget = fields.Float(
+        string='Allocated Budget (incl. Sub-zones)',
+        compute='_compute_subtree_statistics'
+    )
+    subtree_utilized_budget = fields.Float(
+        string='Utilized Budget (incl. Sub-zones)',
+        compute='_compute_subtree_statistics'
+    )
+    subtree_budget_utilization_rate = fields.Float(
+        string='Budget Utilization (incl. Sub-zones) (%)',
+        compute='_compute_subtree_statistics'
+    )
+
     # Financial & Resources
     allocated_budget = fields.Float(
         string='Allocated Budget',
@@ -93,11 +154,21 @@ class YouthZone(models.Model):
     )
     utilized_budget = fields.Float(
         string='Utilized Budget',
-        compute='_compute_budget_utilization'
+        compute='_compute_zone_statistics'
     )
     budget_utilization_rate = fields.Float(
         string='Budget Utilization (%)',
-        compute='_compute_budget_utilization'
+        compute='_compute_zone_statistics'
+    )
+    remaining_budget = fields.Float(
+        string='Remaining Budget',
+        compute='_compute_zone_statistics',
+        help='Allocated budget not yet committed in the current fiscal period'
+    )
+    budget_balance_ids = fields.One2many(
+        'youth.budget.balance',
+        'zone_id',
+        string='Budget Balances'
     )
     
     # Additional Information
@@ -115,61 +186,206 @@ class YouthZone(models.Model):
         default=fields.Date.context_today
     )
 
-    @api.depends('youth_count', 'active_youth_count')
-    def _compute_youth_stats(self):
-        """Compute youth statistics for the zone"""
-        Youth = self.env['youth.youth']
-        for record in self:
-            youth_in_zone = Youth.search([('zone_id', '=', record.id)])
-            record.youth_count = len(youth_in_zone)
-            record.active_youth_count = len(youth_in_zone.filtered(lambda y: y.status == 'active'))
-
-    def _compute_program_stats(self):
-        """Compute program statistics for the zone"""
-        Program = self.env['youth.program']
+    @api.depends('youth_ids.status', 'program_ids.status', 'organization_ids.active',
+                 'application_ids.status', 'budget_balance_ids.committed_amount', 'allocated_budget')
+    def _compute_zone_statistics(self):
+        """Compute every zone counter from the grouped zone statistics"""
+        statistics = self._get_zone_statistics()
         for record in self:
-            programs = Program.search([('zone_id', '=', record.id), ('status', '=', 'active')])
-            record.program_count = len(programs)
+            zone_stats = statistics.get(record.id, self._empty_zone_statistics())
+            total = zone_stats['total_applications']
+            approved = zone_stats['approved_applications']
+            utilized = zone_stats['utilized_budget']
 
-    def _compute_organization_stats(self):
-        """Compute organization statistics for the zone"""
-        Organization = self.env['youth.organization']
-        for record in self:
-            organizations = Organization.search([('zone_id', '=', record.id), ('active', '=', True)])
-            record.organization_count = len(organizations)
-
-    def _compute_application_stats(self):
-        """Compute application statistics for the zone"""
-        Application = self.env['youth.application']
-        for record in self:
-            # Get all applications from youth in this zone
-            youth_ids = self.env['youth.youth'].search([('zone_id', '=', record.id)]).ids
-            applications = Application.search([('youth_id', 'in', youth_ids)])
-            
-            total = len(applications)
-            approved = len(applications.filtered(lambda a: a.status == 'approved'))
-            
+            record.youth_count = zone_stats['youth_count']
+            record.active_youth_count = zone_stats['active_youth_count']
+            record.program_count = zone_stats['program_count']
+            record.organization_count = zone_stats['organization_count']
             record.total_applications = total
             record.approved_applications = approved
             record.success_rate = (approved / total * 100) if total > 0 else 0.0
-
-    def _compute_budget_utilization(self):
-        """Compute budget utilization for the zone"""
-        Application = self.env['youth.application']
-        for record in self:
-            # Calculate utilized budget from approved applications
-            youth_ids = self.env['youth.youth'].search([('zone_id', '=', record.id)]).ids
-            approved_apps = Application.search([
-                ('youth_id', 'in', youth_ids),
-                ('status', '=', 'approved')
-            ])
-            
-            utilized = sum(approved_apps.mapped('approved_amount'))
             record.utilized_budget = utilized
             record.budget_utilization_rate = (
-                (utilized / record.allocated_budget * 100) 
+                (utilized / record.allocated_budget * 100)
                 if record.allocated_budget > 0 else 0.0
             )
+            record.remaining_budget = record.allocated_budget - utilized
+
+    @api.constrains('parent_zone_id')
+    def _check_parent_zone(self):
+        if self._has_cycle():
+            raise models.ValidationError("A zone cannot be its own parent or sub-zone.")
+
+    def _get_subtree_members(self):
+        """Return (zone, member) id pairs of each zone in self and its active sub-zones
+
+        Sub-zones are read with a parent_path prefix match at query time, so no
+        cached copy of the tree has to be kept in step with zone changes.
+        """
+        zone_ids = self.filtered('id').ids
+        if not zone_ids:
+            return []
+        self.flush_model(['parent_path', 'active'])
+        self.env.cr.execute("""
+            SELECT root.id, member.id
+              FROM youth_zone root
+              JOIN youth_zone member ON member.parent_path LIKE root.parent_path || '%%'
+             WHERE root.id IN %s AND (member.active OR member.id = root.id)
+        """, [tuple(zone_ids)])
+        return self.env.cr.fetchall()
+
+    def _compute_subtree_statistics(self):
+        """Compute the zone statistics rolled up over each zone's subtree"""
+        statistics = self._get_subtree_statistics()
+        for record in self:
+            zone_stats = statistics.get(record.id, {})
+            allocated = zone_stats.get('allocated_budget', 0.0)
+            utilized = zone_stats.get('utilized_budget', 0.0)
+            record.subtree_youth_count = zone_stats.get('youth_count', 0)
+            record.subtree_active_youth_count = zone_stats.get('active_youth_count', 0)
+            record.subtree_program_count = zone_stats.get('program_count', 0)
+            record.subtree_total_applications = zone_stats.get('total_applications', 0)
+            record.subtree_approved_applications = zone_stats.get('approved_applications', 0)
+            record.subtree_allocated_budget = allocated
+            record.subtree_utilized_budget = utilized
+            record.subtree_budget_utilization_rate = (utilized / allocated * 100) if allocated > 0 else 0.0
+
+    def _get_subtree_statistics(self):
+        """Return the statistics of each zone in self summed over its subtree, in one query"""
+        pairs = self._get_subtree_members()
+        root_ids = [root_id for root_id, __ in pairs]
+        member_ids = [member_id for __, member_id in pairs]
+        if not root_ids:
+            return {}
+
+        period = self.env['youth.budget.ledger']._get_period(fields.Date.context_today(self))
+        self.env['youth.youth'].flush_model(['zone_id', 'status', 'active'])
+        self.env['youth.program'].flush_model(['zone_id', 'status', 'active'])
+        self.env['youth.application'].flush_model(['applicant_zone', 'status', 'active'])
+        self.env['youth.budget.balance'].flush_model()
+        self.flush_model(['allocated_budget'])
+        self.env.cr.execute("""
+            WITH members AS (
+                SELECT * FROM unnest(%(roots)s::int[], %(members)s::int[]) AS m(root_id, zone_id)
+            ),
+            youth AS (
+                SELECT zone_id, count(*) AS total, count(*) FILTER (WHERE status = 'active') AS active
+                  FROM youth_youth
+                 WHERE active AND zone_id = ANY(%(members)s)
+              GROUP BY zone_id
+            ),
+            programs AS (
+                SELECT zone_id, count(*) AS total
+                  FROM youth_program
+                 WHERE active AND status = 'active' AND zone_id = ANY(%(members)s)
+              GROUP BY zone_id
+            ),
+            applications AS (
+                SELECT applicant_zone AS zone_id,
+                       count(*) AS total,
+                       count(*) FILTER (WHERE status = 'approved') AS approved
+                  FROM youth_application
+                 WHERE active AND applicant_zone = ANY(%(members)s)
+              GROUP BY applicant_zone
+            ),
+            balances AS (
+                SELECT zone_id, committed_amount AS utilized
+                  FROM youth_budget_balance
+                 WHERE period = %(period)s AND zone_id = ANY(%(members)s)
+            )
+            SELECT m.root_id,
+                   COALESCE(sum(y.total), 0), COALESCE(sum(y.active), 0),
+                   COALESCE(sum(p.total), 0),
+                   COALESCE(sum(a.total), 0), COALESCE(sum(a.approved), 0), COALESCE(sum(b.utilized), 0),
+                   COALESCE(sum(z.allocated_budget), 0)
+              FROM members m
+              JOIN youth_zone z ON z.id = m.zone_id
+         LEFT JOIN youth y ON y.zone_id = m.zone_id
+         LEFT JOIN programs p ON p.zone_id = m.zone_id
+         LEFT JOIN applications a ON a.zone_id = m.zone_id
+         LEFT JOIN balances b ON b.zone_id = m.zone_id
+          GROUP BY m.root_id
+        """, {'roots': root_ids, 'members': member_ids, 'period': period})
+        return {
+            root_id: {
+                'youth_count': youth_count,
+                'active_youth_count': active_youth_count,
+                'program_count': program_count,
+                'total_applications': total_applications,
+                'approved_applications': approved_applications,
+                'utilized_budget': utilized,
+                'allocated_budget': allocated,
+            }
+            for root_id, youth_count, active_youth_count, program_count, total_applications,
+                approved_applications, utilized, allocated in self.env.cr.fetchall()
+        }
+
+    @api.model
+    def _empty_zone_statistics(self):
+        return {
+            'youth_count': 0,
+            'active_youth_count': 0,
+            'program_count': 0,
+            'organization_count': 0,
+            'total_applications': 0,
+            'approved_applications': 0,
+            'utilized_budget': 0.0,
+        }
+
+    def _get_zone_statistics(self):
+        """Return per-zone counters and sums for all zones in self
+
+        The figures come from one grouped query per source model, so the
+        query count does not depend on the number of zones or youth.
+        """
+        zone_ids = self.filtered('id').ids
+        statistics = {zone_id: self._empty_zone_statistics() for zone_id in zone_ids}
+        if not zone_ids:
+            return statistics
+
+        youth_groups = self.env['youth.youth']._read_group(
+            [('zone_id', 'in', zone_ids)],
+            groupby=['zone_id', 'status'],
+            aggregates=['__count'],
+        )
+        for zone, status, count in youth_groups:
+            statistics[zone.id]['youth_count'] += count
+            if status == 'active':
+                statistics[zone.id]['active_youth_count'] += count
+
+        program_groups = self.env['youth.program']._read_group(
+            [('zone_id', 'in', zone_ids), ('status', '=', 'active')],
+            groupby=['zone_id'],
+            aggregates=['__count'],
+        )
+        for zone, count in program_groups:
+            statistics[zone.id]['program_count'] = count
+
+        organization_groups = self.env['youth.organization']._read_group(
+            [('zone_id', 'in', zone_ids), ('active', '=', True)],
+            groupby=['zone_id'],
+            aggregates=['__count'],
+        )
+        for zone, count in organization_groups:
+            statistics[zone.id]['organization_count'] = count
+
+        application_groups = self.env['youth.application']._read_group(
+            [('applicant_zone', 'in', zone_ids)],
+            groupby=['applicant_zone', 'status'],
+            aggregates=['__count'],
+        )
+        for zone, status, count in application_groups:
+            statistics[zone.id]['total_applications'] += count
+            if status == 'approved':
+                statistics[zone.id]['approved_applications'] += count
+
+        # Utilisation is the running ledger balance of the current fiscal period
+        Balance = self.env['youth.budget.balance']
+        period = self.env['youth.budget.ledger']._get_period(fields.Date.context_today(self))
+        for zone_id, (committed, __) in Balance._get_balances(zone_ids, period).items():
+            statistics[zone_id]['utilized_budget'] = committed
+
+        return statistics
 
     def action_view_youth(self):
         """Action to view youth in this zone"""
@@ -213,9 +429,9 @@ class YouthZone(models.Model):
             'name': f'{self.name} - Dashboard',
             'type': 'ir.actions.act_window',
             'res_model': 'youth.analytics',
-            'view_mode': 'form',
+            'view_mode': 'pivot,graph,list',
+            'domain': [('zone_id', '=', self.id)],
             'context': {
-                'default_zone_id': self.id,
                 'zone_dashboard': True
             },
             'target': 'current',
@@ -0,0 +1,5 @@
+from . import test_committee_approval
+from . import test_enrollment
+from . import test_sla
+from . import test_disbursement
+from . import test_budget_ledger
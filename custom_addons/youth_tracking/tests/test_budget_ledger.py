@@ -0,0 +1,117 @@
+from odoo import fields
+from odoo.exceptions import UserError
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestBudgetLedger(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.Ledger = cls.env['youth.budget.ledger']
+        cls.zone = cls.env['youth.zone'].create({
+            'name': 'Mandevu',
+            'zone_code': 'LSK-MDV',
+            'province': 'Lusaka',
+            'allocated_budget': 10000.0,
+        })
+        cls.youth = cls.env['youth.youth'].create({
+            'name': 'Mutinta Mweemba',
+            'date_of_birth': '2002-01-25',
+            'gender': 'female',
+            'phone': '+260 976 808080',
+            'nrc_number': '808080/10/1',
+            'address': 'Mandevu Township',
+            'education_level': 'tertiary',
+            'zone_id': cls.zone.id,
+        })
+        cls.period = cls.Ledger._get_period(fields.Date.context_today(cls.Ledger))
+
+    def _create_application(self, amount, status='approved'):
+        return self.env['youth.application'].create({
+            'name': f'Salon equipment ({amount:.0f})',
+            'youth_id': self.youth.id,
+            'application_type': 'entrepreneurship',
+            'description': 'Dryers and chairs for a hair salon',
+            'requested_amount': amount,
+            'approved_amount': amount,
+            'status': status,
+        })
+
+    def _entries(self, application):
+        return self.Ledger.search([('application_id', '=', application.id)], order='id')
+
+    def _committed(self):
+        return self.env['youth.budget.balance']._get_balances([self.zone.id], self.period).get(
+            self.zone.id, (0.0, 0.0))[0]
+
+    def test_approval_appends_commitment_and_rejection_reverses_it(self):
+        application = self._create_application(4000.0)
+
+        entries = self._entries(application)
+        self.assertEqual(entries.mapped('entry_type'), ['commitment'])
+        self.assertEqual(entries.committed_delta, 4000.0)
+        self.assertEqual(entries.zone_id, self.zone)
+        self.assertEqual(self._committed(), 4000.0)
+
+        application.status = 'rejected'
+
+        entries = self._entries(application)
+        self.assertEqual(entries.mapped('entry_type'), ['commitment', 'reversal'])
+        self.assertEqual(entries.mapped('committed_delta'), [4000.0, -4000.0])
+        self.assertEqual(self._committed(), 0.0)
+        self.assertEqual(application.budget_committed, 0.0)
+
+    def test_entries_are_append_only(self):
+        entry = self._entries(self._create_application(1000.0))
+
+        with self.assertRaises(UserError):
+            entry.write({'committed_delta': 1.0})
+        with self.assertRaises(UserError):
+            entry.unlink()
+
+    def test_balance_is_upserted_per_zone_and_period(self):
+        self._create_application(1500.0)
+        self._create_application(2500.0)
+        self.env['youth.budget.balance']._apply_deltas({(self.zone.id, self.period): [250.0, 0.0]})
+
+        balances = self.env['youth.budget.balance'].search(
+            [('zone_id', '=', self.zone.id), ('period', '=', self.period)])
+        self.assertEqual(len(balances), 1)
+        self.assertEqual(balances.committed_amount, 4250.0)
+
+    def test_overcommit_is_rejected(self):
+        self._create_application(8000.0)
+
+        with self.assertRaises(UserError):
+            self._create_application(3000.0)
+        self.assertEqual(self._committed(), 8000.0)
+
+        # Reversals and explicitly allowed over-commitments still go through
+        application = self._create_application(3000.0, status='under_review')
+        application.with_context(budget_allow_overcommit=True).status = 'approved'
+        self.assertEqual(self._committed(), 11000.0)
+
+    def test_backfill_is_idempotent(self):
+        application = self._create_application(2000.0)
+        # Forget the commitment, as for an application approved before the ledger existed
+        self.env.flush_all()
+        self.env.cr.execute("DELETE FROM youth_budget_ledger WHERE application_id = %s", [application.id])
+        self.env.cr.execute("""
+            UPDATE youth_application
+               SET budget_zone_id = NULL, budget_booked_program_id = NULL, budget_period = NULL,
+                   budget_committed = 0, budget_disbursed = 0
+             WHERE id = %s
+        """, [application.id])
+        self.Ledger._rebuild_balances()
+        self.env.invalidate_all()
+        self.assertEqual(self._committed(), 0.0)
+
+        for __ in range(2):
+            self.Ledger._backfill_commitments()
+            self.env.invalidate_all()
+            self.assertEqual(len(self._entries(application)), 1)
+            self.assertEqual(application.budget_committed, 2000.0)
+            self.assertEqual(application.budget_zone_id, self.zone)
+            self.assertEqual(self._committed(), 2000.0)
@@ -0,0 +1,81 @@
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestCommitteeApproval(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.zone = cls.env['youth.zone'].create({
+            'name': 'Kabwata',
+            'zone_code': 'LSK-KBW',
+            'province': 'Lusaka',
+        })
+        cls.program = cls.env['event.program'].create({
+            'name': 'Youth Enterprise Bootcamp',
+            'category': 'youth',
+        })
+        cls.youths = cls.env['youth.youth'].create([{
+            'name': name,
+            'date_of_birth': date_of_birth,
+            'gender': gender,
+            'phone': phone,
+            'nrc_number': nrc_number,
+            'address': 'Plot 12, Kabwata',
+            'education_level': 'secondary',
+            'zone_id': cls.zone.id,
+        } for name, date_of_birth, gender, phone, nrc_number in [
+            ('Mwila Banda', '2000-03-14', 'female', '+260 977 123456', '123456/10/1'),
+            # A sibling sharing the family phone number
+            ('Chanda Banda', '2003-08-02', 'male', '0977123456', '654321/10/1'),
+        ]])
+
+    def _create_applications(self, youths, status='committee_review'):
+        return self.env['youth.application'].create([{
+            'name': f'Tailoring business for {youth.name}',
+            'youth_id': youth.id,
+            'program_id': self.program.id,
+            'application_type': 'entrepreneurship',
+            'description': 'Start-up capital for a tailoring business',
+            'requested_amount': 5000.0,
+            'status': status,
+        } for youth in youths])
+
+    def test_committee_approve_batch(self):
+        applications = self._create_applications(self.youths)
+        pending = self._create_applications(self.youths[:1], status='under_review')
+
+        approved, failures = (applications | pending)._committee_approve_batch()
+
+        self.assertEqual(approved, applications)
+        self.assertEqual([application for application, __ in failures], list(pending))
+        self.assertEqual(set(applications.mapped('status')), {'approved'})
+        self.assertTrue(all(applications.mapped('committee_approval')))
+        self.assertEqual(applications.committee_approver_id, self.env.user)
+        self.assertEqual(pending.status, 'under_review')
+
+        # Both siblings are enrolled even though they share a phone number
+        participants = self.program.participants_ids
+        self.assertEqual(sorted(participants.mapped('name')), ['Chanda Banda', 'Mwila Banda'])
+        self.assertEqual(participants.person_identity_id, self.youths.person_identity_id)
+        self.assertEqual(len(self.youths.person_identity_id), 2)
+
+        # One digest on the program instead of one message per application
+        digest = self.program.message_ids.filtered(lambda m: 'Committee Approved' in (m.body or ''))
+        self.assertEqual(len(digest), 1)
+        self.assertIn('2 application(s)', digest.body)
+        for application in applications:
+            self.assertIn(application.name, digest.body)
+            self.assertFalse(application.message_ids.filtered(lambda m: 'Committee Approved' in (m.body or '')))
+
+    def test_committee_approve_existing_participant(self):
+        applications = self._create_applications(self.youths[:1])
+        applications._committee_approve_batch()
+        repeat = self._create_applications(self.youths[:1])
+
+        approved, failures = repeat._committee_approve_batch()
+
+        self.assertEqual(approved, repeat)
+        self.assertFalse(failures)
+        self.assertEqual(len(self.program.participants_ids), 1)
@@ -0,0 +1,107 @@
+import csv
+import io
+
+from odoo.exceptions import UserError
+from odoo.tests import TransactionCase, tagged
+
+from odoo.addons.youth_tracking.models.disbursement import FIXED_WIDTH_LAYOUT, PAYMENT_CSV_HEADER
+
+
+@tagged('post_install', '-at_install')
+class TestDisbursementBatch(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.zone = cls.env['youth.zone'].create({
+            'name': 'Kanyama',
+            'zone_code': 'LSK-KNY',
+            'province': 'Lusaka',
+        })
+        youths = cls.env['youth.youth'].create([{
+            'name': name,
+            'date_of_birth': '1998-04-09',
+            'gender': 'male',
+            'phone': phone,
+            'nrc_number': nrc_number,
+            'address': 'Kanyama Market Road',
+            'education_level': 'secondary',
+            'zone_id': cls.zone.id,
+        } for name, phone, nrc_number in [
+            ('Chilufya Mwansa', '+260 955 100200', '100200/10/1'),
+            ('Emmanuel Tembo', '+260 955 300400', '300400/10/1'),
+        ]])
+        cls.applications = cls.env['youth.application'].create([{
+            'name': f'Carpentry tools for {youth.name}',
+            'youth_id': youth.id,
+            'application_type': 'entrepreneurship',
+            'description': 'Hand tools and a workbench',
+            'requested_amount': amount,
+            'approved_amount': amount,
+            'status': 'approved',
+        } for youth, amount in zip(youths, [1500.0, 2500.5])])
+
+    def _create_generated_batch(self):
+        batch = self.env['youth.disbursement.batch'].create({'zone_id': self.zone.id})
+        batch.action_generate()
+        return batch
+
+    def test_generate_reserves_approved_applications(self):
+        batch = self._create_generated_batch()
+
+        self.assertEqual(batch.state, 'ready')
+        self.assertEqual(batch.application_count, 2)
+        self.assertAlmostEqual(batch.total_amount, 4000.5)
+        self.assertEqual(batch.application_ids, self.applications)
+
+        # The payment file may be at the bank: amounts and statuses are frozen
+        with self.assertRaises(UserError):
+            self.applications[0].approved_amount = 1000.0
+
+        # Reserved applications are not picked up by a second batch
+        with self.assertRaises(UserError):
+            self.env['youth.disbursement.batch'].create({'zone_id': self.zone.id}).action_generate()
+
+    def test_csv_file_matches_batch_totals(self):
+        batch = self._create_generated_batch()
+
+        rows = list(csv.reader(io.StringIO(''.join(batch._iter_payment_file('csv')))))
+
+        self.assertEqual(rows[0], PAYMENT_CSV_HEADER)
+        self.assertEqual(len(rows) - 1, batch.application_count)
+        self.assertEqual(sorted(row[1] for row in rows[1:]), sorted(self.applications.mapped('application_id')))
+        self.assertAlmostEqual(sum(float(row[-1]) for row in rows[1:]), batch.total_amount)
+
+    def test_fixed_width_file_matches_batch_totals(self):
+        batch = self._create_generated_batch()
+
+        lines = ''.join(batch._iter_payment_file('txt')).split('\r\n')[:-1]
+        header, details, trailer = lines[0], lines[1:-1], lines[-1]
+
+        self.assertTrue(header.startswith('H'))
+        self.assertEqual(len(details), 2)
+        line_width = sum(width for __, width, __ in FIXED_WIDTH_LAYOUT)
+        amount_width = FIXED_WIDTH_LAYOUT[-1][1]
+        for line in details:
+            self.assertEqual(len(line), line_width)
+        self.assertEqual(sum(int(line[-amount_width:]) for line in details), 400050)
+        self.assertEqual(trailer, f"T{2:>10}{400050:>15}")
+
+    def test_mark_disbursed_and_cancel(self):
+        batch = self._create_generated_batch()
+
+        batch.action_mark_disbursed()
+
+        self.assertEqual(batch.state, 'disbursed')
+        self.assertEqual(set(self.applications.mapped('status')), {'disbursed'})
+        with self.assertRaises(UserError):
+            batch.action_cancel()
+
+    def test_cancel_releases_applications(self):
+        batch = self._create_generated_batch()
+
+        batch.action_cancel()
+
+        self.assertEqual(batch.state, 'cancelled')
+        self.assertFalse(self.applications.disbursement_batch_id)
+        self.assertEqual(self._create_generated_batch().application_count, 2)
@@ -0,0 +1,103 @@
+from odoo.exceptions import UserError
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestEnrollment(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.zone = cls.env['youth.zone'].create({
+            'name': 'Matero',
+            'zone_code': 'LSK-MTR',
+            'province': 'Lusaka',
+        })
+        cls.program = cls.env['youth.program'].create({
+            'name': 'Welding Skills Training',
+            'program_type': 'skills_training',
+            'description': 'Six-week welding course',
+            'start_date': '2026-01-05',
+            'end_date': '2026-02-13',
+            'zone_id': cls.zone.id,
+            'coordinator_id': cls.env.user.id,
+            'max_participants': 2,
+        })
+        cls.youths = cls.env['youth.youth'].create([
+            cls._youth_vals(name, nrc_number)
+            for name, nrc_number in [
+                ('Bupe Mulenga', '111111/10/1'),
+                ('Kondwani Phiri', '222222/10/1'),
+                ('Natasha Zulu', '333333/10/1'),
+            ]
+        ])
+
+    @classmethod
+    def _youth_vals(cls, name, nrc_number, **extra):
+        return dict({
+            'name': name,
+            'date_of_birth': '2001-06-20',
+            'gender': 'male',
+            'phone': f'+260 97 {nrc_number[:6]}',
+            'nrc_number': nrc_number,
+            'address': 'Matero Main Road',
+            'education_level': 'secondary',
+            'zone_id': cls.zone.id,
+        }, **extra)
+
+    def test_enroll_respects_capacity(self):
+        enrolled = self.program.enroll(self.youths[:2].ids)
+
+        self.assertEqual(enrolled, self.youths[:2])
+        self.assertEqual(self.program.current_participants, 2)
+        self.assertEqual(self.program.available_slots, 0)
+
+        # All or none: the full program refuses the third youth
+        with self.assertRaises(UserError):
+            self.program.enroll(self.youths[2:].ids)
+        self.assertEqual(self.program.participant_ids, self.youths[:2])
+
+        # Enrolling someone twice does not take a second place
+        self.assertFalse(self.program.enroll(self.youths[:1].ids))
+        self.assertEqual(self.program.current_participants, 2)
+
+    def test_unenroll_releases_places(self):
+        self.program.enroll(self.youths[:2].ids)
+
+        self.program.unenroll(self.youths[:1].ids)
+
+        self.assertEqual(self.program.current_participants, 1)
+        self.assertEqual(self.program.enroll(self.youths[2:].ids), self.youths[2:])
+
+    def test_create_with_programs_checks_capacity(self):
+        self.program.enroll(self.youths[:2].ids)
+
+        with self.assertRaises(UserError):
+            self.env['youth.youth'].create(
+                self._youth_vals('Mutale Chola', '444444/10/1', program_ids=[(6, 0, self.program.ids)]))
+
+        self.program.unenroll(self.youths[:1].ids)
+        youth = self.env['youth.youth'].create(
+            self._youth_vals('Mutale Chola', '444444/10/1', program_ids=[(6, 0, self.program.ids)]))
+        self.assertIn(youth, self.program.participant_ids)
+        self.assertEqual(self.program.current_participants, 2)
+
+    def test_unlink_enrolled_youth_releases_place(self):
+        self.program.enroll(self.youths[:2].ids)
+
+        self.youths[0].unlink()
+
+        self.assertEqual(self.program.current_participants, 1)
+        self.assertEqual(self.program.participant_ids, self.youths[1])
+
+    def test_eligibility_agrees_in_both_directions(self):
+        # Keep other youth in the database out of the count
+        self.program.eligibility_zone_id = self.zone
+        self.program.enroll(self.youths[:1].ids)
+        self.youths[2].status = 'suspended'
+
+        eligible = self.env['youth.youth'].browse(self.program.get_eligible_youth()['ids'])
+        self.assertEqual(eligible, self.youths[1])
+        self.assertEqual(self.program.eligible_youth_count, 1)
+        for youth in self.youths:
+            self.assertEqual(self.program in youth.get_eligible_programs(), youth in eligible)
@@ -0,0 +1,71 @@
+from odoo import fields
+from odoo.tests import TransactionCase, tagged
+
+
+@tagged('post_install', '-at_install')
+class TestApplicationSla(TransactionCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.zone = cls.env['youth.zone'].create({
+            'name': 'Chawama',
+            'zone_code': 'LSK-CHW',
+            'province': 'Lusaka',
+            'coordinator_id': cls.env.user.id,
+        })
+        cls.youth = cls.env['youth.youth'].create({
+            'name': 'Lweendo Hamoonga',
+            'date_of_birth': '1999-11-02',
+            'gender': 'female',
+            'phone': '+260 966 555111',
+            'nrc_number': '555111/10/1',
+            'address': 'Chawama Compound',
+            'education_level': 'secondary',
+            'zone_id': cls.zone.id,
+        })
+        cls.today = fields.Date.context_today(cls.env['youth.application'])
+
+    def _create_application(self, days_overdue):
+        return self.env['youth.application'].create({
+            'name': f'Poultry project, {days_overdue} days overdue',
+            'youth_id': self.youth.id,
+            'application_type': 'entrepreneurship',
+            'description': 'Broiler house and feed for the first cycle',
+            'requested_amount': 3000.0,
+            'status': 'under_review',
+            'priority': 'medium',
+            'reviewer_id': self.env.user.id,
+            'deadline_date': fields.Date.subtract(self.today, days=days_overdue),
+        })
+
+    def _activity_summaries(self, application):
+        return self.env['mail.activity'].search([
+            ('res_model', '=', application._name), ('res_id', '=', application.id),
+        ]).mapped('summary')
+
+    def test_overdue_application_is_reminded_then_escalated(self):
+        recent = self._create_application(2)
+        stale = self._create_application(10)
+        cutoff = fields.Date.subtract(self.today, days=7)
+
+        (recent | stale)._process_overdue(cutoff)
+
+        self.assertTrue(recent.sla_overdue_notified)
+        self.assertFalse(recent.sla_escalated)
+        self.assertEqual(recent.priority, 'medium')
+        self.assertEqual(self._activity_summaries(recent), ['Response deadline passed'])
+
+        self.assertTrue(stale.sla_escalated)
+        self.assertEqual(stale.priority, 'urgent')
+        self.assertEqual(self._activity_summaries(stale), ['Escalated: response deadline overdue'])
+        self.assertTrue(stale.message_ids.filtered(lambda m: 'Application Escalated' in (m.body or '')))
+
+    def test_new_deadline_restarts_sla_watch(self):
+        application = self._create_application(10)
+        application._process_overdue(fields.Date.subtract(self.today, days=7))
+
+        application.deadline_date = fields.Date.add(self.today, days=5)
+
+        self.assertFalse(application.sla_overdue_notified)
+        self.assertFalse(application.sla_escalated)